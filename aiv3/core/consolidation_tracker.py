@@ -8,15 +8,30 @@ Tracks consolidation patterns through qualification, active, and completion phas
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-from typing import Optional, List, Dict, Any
-import pandas as pd
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, Tuple
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from stockgpt.core.entities.pattern import Pattern, PatternPhase, PatternOutcome, OutcomeClass
 from stockgpt.core.entities.stock import Price
+from stockgpt.infrastructure.data import _indicators as ind
 
 logger = logging.getLogger(__name__)
 
+_OHLCV_FIELDS = attrgetter('open', 'high', 'low', 'close', 'volume')
+
+
+def _extract_arrays(prices: List[Price]) -> np.ndarray:
+    """A (5, len(prices)) float64 array of open, high, low, close and volume."""
+    ohlcv = np.fromiter(map(_OHLCV_FIELDS, prices), dtype=(np.float64, 5), count=len(prices))
+    return ohlcv.T
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Means of every full period-bar window (the first at index period - 1)."""
+    return sliding_window_view(values, period).mean(axis=-1)
+
 
 @dataclass
 class ConsolidationMetrics:
@@ -77,6 +92,13 @@ class ConsolidationTracker:
         self.price_history: List[Price] = []
         self.metrics_history: List[ConsolidationMetrics] = []
 
+        # Preallocated OHLCV rows of the last bars read (first and last bar
+        # kept to recognise a longer list), so bar-by-bar updates only read
+        # the new bars
+        self._buffer = np.empty((5, 0))
+        self._buffer_len = 0
+        self._buffer_ends: Tuple[Optional[Price], Optional[Price]] = (None, None)
+
     def update(self, price_data: List[Price]) -> Optional[Pattern]:
         """
         Update tracker with new price data.
@@ -103,6 +125,31 @@ class ConsolidationTracker:
 
         return self.current_pattern
 
+    def _price_arrays(self, prices: List[Price]) -> Tuple[np.ndarray, ...]:
+        """
+        Contiguous open, high, low, close and volume arrays of prices.
+
+        When prices extend the previous update's bars, only the new bars
+        are read into the buffer; any other list is read in full.
+        """
+        n = len(prices)
+        seen = self._buffer_len
+        first, last = self._buffer_ends
+        if not (0 < seen <= n and prices[0] is first and prices[seen - 1] is last):
+            seen = 0
+
+        if n > self._buffer.shape[1]:
+            grown = np.empty((5, max(n, 2 * self._buffer.shape[1], 256)))
+            grown[:, :seen] = self._buffer[:, :seen]
+            self._buffer = grown
+
+        if n > seen:
+            self._buffer[:, seen:n] = _extract_arrays(prices[seen:])
+        self._buffer_len = n
+        self._buffer_ends = (prices[0], prices[-1])
+
+        return tuple(self._buffer[:, :n])
+
     def _calculate_metrics(self, prices: List[Price]) -> ConsolidationMetrics:
         """
         Calculate real consolidation metrics from price data.
@@ -113,46 +160,45 @@ class ConsolidationTracker:
         Returns:
             Consolidation metrics
         """
-        # Convert to DataFrame for easier calculation
-        df = pd.DataFrame([p.to_dict() for p in prices])
+        # Read the price fields into arrays once
+        _, high, low, close, volume = self._price_arrays(prices)
 
         # Bollinger Band Width
-        sma20 = df['close'].rolling(20).mean()
-        std20 = df['close'].rolling(20).std()
+        windows = sliding_window_view(close, 20)
+        sma20 = windows.mean(axis=-1)
+        std20 = windows.std(axis=-1, ddof=1)
         upper_band = sma20 + 2 * std20
         lower_band = sma20 - 2 * std20
-        bbw = ((upper_band - lower_band) / sma20 * 100).iloc[-1]
-
-        # BBW Percentile (how tight is current BBW vs history)
         bbw_series = (upper_band - lower_band) / sma20 * 100
-        bbw_percentile = (bbw <= bbw_series).mean() * 100
+        bbw = bbw_series[-1]
+
+        # BBW Percentile (how tight is current BBW vs history); warm-up bars
+        # without a full window count towards the denominator
+        bbw_percentile = (bbw <= bbw_series).sum() / len(close) * 100
 
         # ADX Calculation
-        adx = self._calculate_adx(df)
+        adx = self._calculate_adx(high, low, close)
 
         # Volume Ratio
-        current_volume = df['volume'].iloc[-1]
-        avg_volume_20 = df['volume'].rolling(20).mean().iloc[-1]
+        current_volume = volume[-1]
+        avg_volume_20 = volume[-20:].mean()
         volume_ratio = current_volume / avg_volume_20 if avg_volume_20 > 0 else 1.0
 
         # Daily Range Ratio
-        current_range = (df['high'].iloc[-1] - df['low'].iloc[-1]) / df['close'].iloc[-1]
-        avg_range_20 = ((df['high'] - df['low']) / df['close']).rolling(20).mean().iloc[-1]
+        range_pct = (high - low) / close
+        current_range = range_pct[-1]
+        avg_range_20 = range_pct[-20:].mean()
         daily_range_ratio = current_range / avg_range_20 if avg_range_20 > 0 else 1.0
 
         # ATR
-        high_low = df['high'] - df['low']
-        high_close = (df['high'] - df['close'].shift()).abs()
-        low_close = (df['low'] - df['close'].shift()).abs()
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(14).mean().iloc[-1]
+        atr = ind.true_range(high, low, close)[-14:].mean()
 
         # Volatility
-        volatility = df['close'].pct_change().rolling(20).std().iloc[-1] * 100
+        volatility = ind.return_volatility(close, 20) * 100
 
         # Price position within current range
         if self.current_pattern and self.current_pattern.upper_boundary:
-            price_position = ((df['close'].iloc[-1] - self.current_pattern.lower_boundary) /
+            price_position = ((close[-1] - self.current_pattern.lower_boundary) /
                             (self.current_pattern.upper_boundary - self.current_pattern.lower_boundary))
         else:
             price_position = 0.5
@@ -168,50 +214,40 @@ class ConsolidationTracker:
             price_position=price_position,
         )
 
-    def _calculate_adx(self, df: pd.DataFrame) -> float:
+    def _calculate_adx(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> float:
         """
         Calculate Average Directional Index (ADX).
 
         Args:
-            df: Price DataFrame
+            high: High prices
+            low: Low prices
+            close: Close prices
 
         Returns:
             ADX value
         """
         # Simplified ADX calculation
-        high = df['high']
-        low = df['low']
-        close = df['close']
 
         # True Range
-        tr1 = high - low
-        tr2 = (high - close.shift()).abs()
-        tr3 = (low - close.shift()).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(14).mean()
+        atr = _rolling_mean(ind.true_range(high, low, close), 14)
 
         # Directional Movement
-        up = high - high.shift()
-        down = low.shift() - low
-
-        pos_dm = pd.Series(0.0, index=df.index)
-        neg_dm = pd.Series(0.0, index=df.index)
-
-        pos_dm[up > down] = up[up > down]
-        pos_dm[pos_dm < 0] = 0
+        up = np.r_[np.nan, np.diff(high)]
+        down = np.r_[np.nan, -np.diff(low)]
 
-        neg_dm[down > up] = down[down > up]
-        neg_dm[neg_dm < 0] = 0
+        pos_dm = np.where(up > down, np.maximum(up, 0.0), 0.0)
+        neg_dm = np.where(down > up, np.maximum(down, 0.0), 0.0)
 
-        # Smoothed DI
-        pos_di = 100 * (pos_dm.rolling(14).mean() / atr)
-        neg_di = 100 * (neg_dm.rolling(14).mean() / atr)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Smoothed DI
+            pos_di = 100 * (_rolling_mean(pos_dm, 14) / atr)
+            neg_di = 100 * (_rolling_mean(neg_dm, 14) / atr)
 
-        # ADX
-        dx = 100 * ((pos_di - neg_di).abs() / (pos_di + neg_di))
-        adx = dx.rolling(14).mean().iloc[-1]
+            # ADX
+            dx = 100 * (np.abs(pos_di - neg_di) / (pos_di + neg_di))
+        adx = dx[-14:].mean() if len(dx) >= 14 else np.nan
 
-        return adx if not pd.isna(adx) else 25.0  # Default if calculation fails
+        return adx if not np.isnan(adx) else 25.0  # Default if calculation fails
 
     def _update_pattern_state(self, latest_price: Price, metrics: ConsolidationMetrics) -> None:
         """
@@ -13,7 +13,8 @@ import asyncio
 import logging
 from datetime import date, timedelta
 from pathlib import Path
-import json
+from typing import Optional
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -39,6 +40,9 @@ class BreakoutPredictionSystem:
     - AIv3 consolidation tracking
     """
 
+    # Maximum number of symbols fetched from the APIs at once
+    FETCH_CONCURRENCY = 8
+
     def __init__(self):
         self.project_id = os.environ['PROJECT_ID']
         self.bucket_name = os.environ['GCS_BUCKET_NAME']
@@ -65,10 +69,100 @@ class BreakoutPredictionSystem:
         logger.info(f"GCS Bucket: gs://{self.bucket_name}")
         logger.info(f"APIs configured: {', '.join(self.rate_limits.keys())}")
 
-    async def scan_for_breakouts(self, symbols: list) -> dict:
+    async def _fetch_all(self, symbols: list, fetch) -> list:
+        """
+        Run fetch(symbol) for all symbols concurrently, at most
+        FETCH_CONCURRENCY at a time.
+
+        Results come back in symbol order; a failed fetch yields its
+        exception instead of a result.
+        """
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+
+        async def fetch_one(symbol):
+            async with semaphore:
+                return await fetch(symbol)
+
+        return await asyncio.gather(*(fetch_one(symbol) for symbol in symbols),
+                                    return_exceptions=True)
+
+    async def scan_symbol(self, symbol: str, provider) -> Optional[dict]:
+        """
+        Fetch one symbol's recent prices and run AIv3 pattern detection.
+
+        Returns:
+            The status from scan_prices
+        """
+        # Get historical data
+        prices = await provider.get_prices(symbol, days=100)
+        return self.scan_prices(symbol, prices)
+
+    def scan_prices(self, symbol: str, prices: list) -> Optional[dict]:
+        """
+        Run AIv3 pattern detection on one symbol's recent prices.
+
+        Returns:
+            None without enough data, otherwise a status dict whose 'phase'
+            is None when no pattern was detected; ACTIVE patterns are marked
+            breakout_ready and carry their boundaries
+        """
+        from aiv3.core.consolidation_tracker import ConsolidationTracker
+
+        if not prices or len(prices) < 60:
+            return None
+
+        # Initialize pattern tracker and update with real data
+        tracker = ConsolidationTracker(symbol)
+        pattern = tracker.update(prices)
+        if not pattern:
+            return {'symbol': symbol, 'phase': None}
+
+        status = {
+            'symbol': symbol,
+            'phase': pattern.phase.value,
+            'qualification_days': pattern.qualification_days
+        }
+
+        # Check if in ACTIVE phase (ready for breakout)
+        if pattern.phase.value == "ACTIVE":
+            status['breakout_ready'] = True
+            status['upper_boundary'] = pattern.upper_boundary
+            status['lower_boundary'] = pattern.lower_boundary
+            status['power_boundary'] = pattern.power_boundary
+            status['range_percent'] = pattern.range_percentage
+
+        return status
+
+    async def iter_breakout_scan(self, symbols: list, provider=None):
+        """
+        Scan symbols concurrently (at most FETCH_CONCURRENCY at a time),
+        yielding (symbol, status) as each scan finishes.
+
+        status is as returned by scan_symbol, or the exception a failed
+        scan raised.
+        """
+        from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
+
+        provider = provider or EnhancedMarketProvider()
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+
+        async def scan(symbol):
+            async with semaphore:
+                try:
+                    return symbol, await self.scan_symbol(symbol, provider)
+                except Exception as e:
+                    return symbol, e
+
+        for next_done in asyncio.as_completed([scan(symbol) for symbol in symbols]):
+            yield await next_done
+
+    async def scan_for_breakouts(self, symbols: list, provider=None) -> dict:
         """
         Scan symbols for potential breakout patterns.
 
+        A shared EnhancedMarketProvider may be passed in; otherwise a new one
+        is created. Prices are fetched in one batch with its get_many().
+
         Uses AIv3 pattern detection:
         - Consolidation qualification (10 days)
         - BBW < 30th percentile
@@ -76,56 +170,37 @@ class BreakoutPredictionSystem:
         - Volume < 35% of average
         """
         from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
-        from aiv3.core.consolidation_tracker import ConsolidationTracker
 
-        provider = EnhancedMarketProvider()
+        provider = provider or EnhancedMarketProvider()
         breakout_candidates = []
 
         print("\n" + "="*70)
         print("BREAKOUT PATTERN SCANNER")
         print("="*70)
 
+        # Fetch all symbols' prices in one batch, then scan them
+        price_lists = await provider.get_many(symbols, days=100)
+
         for symbol in symbols:
             try:
-                # Get historical data
-                prices = await provider.get_prices(symbol, days=100)
-
-                if prices and len(prices) >= 60:
-                    # Initialize pattern tracker
-                    tracker = ConsolidationTracker(symbol)
-
-                    # Update with real data
-                    pattern = tracker.update(prices)
-
-                    if pattern:
-                        status = {
-                            'symbol': symbol,
-                            'phase': pattern.phase.value,
-                            'qualification_days': pattern.qualification_days
-                        }
-
-                        # Check if in ACTIVE phase (ready for breakout)
-                        if pattern.phase.value == "ACTIVE":
-                            status['breakout_ready'] = True
-                            status['upper_boundary'] = pattern.upper_boundary
-                            status['lower_boundary'] = pattern.lower_boundary
-                            status['power_boundary'] = pattern.power_boundary
-                            status['range_percent'] = pattern.range_percentage
-
-                            breakout_candidates.append(status)
-
-                            print(f"\n[ALERT] {symbol} - BREAKOUT PATTERN DETECTED!")
-                            print(f"  Range: ${pattern.lower_boundary:.2f} - ${pattern.upper_boundary:.2f}")
-                            print(f"  Breakout Target: ${pattern.power_boundary:.2f}")
-                            print(f"  Range Width: {pattern.range_percentage:.2f}%")
-
-                        elif pattern.phase.value == "QUALIFYING":
-                            print(f"\n[WATCH] {symbol} - Pattern forming ({pattern.qualification_days}/10 days)")
-                    else:
-                        print(f"\n[INFO] {symbol} - No pattern detected")
-
+                status = self.scan_prices(symbol, price_lists[symbol])
             except Exception as e:
                 logger.error(f"Error scanning {symbol}: {e}")
+                continue
+
+            if status is None:
+                continue
+            elif status.get('breakout_ready'):
+                breakout_candidates.append(status)
+
+                print(f"\n[ALERT] {symbol} - BREAKOUT PATTERN DETECTED!")
+                print(f"  Range: ${status['lower_boundary']:.2f} - ${status['upper_boundary']:.2f}")
+                print(f"  Breakout Target: ${status['power_boundary']:.2f}")
+                print(f"  Range Width: {status['range_percent']:.2f}%")
+            elif status['phase'] == "QUALIFYING":
+                print(f"\n[WATCH] {symbol} - Pattern forming ({status['qualification_days']}/10 days)")
+            elif status['phase'] is None:
+                print(f"\n[INFO] {symbol} - No pattern detected")
 
         return {
             'scanned': len(symbols),
@@ -133,23 +208,29 @@ class BreakoutPredictionSystem:
             'timestamp': date.today().isoformat()
         }
 
-    async def get_realtime_signals(self, symbols: list) -> dict:
+    async def get_realtime_signals(self, symbols: list, provider=None) -> dict:
         """
         Generate real-time trading signals based on technical indicators.
+
+        A shared market data provider may be passed in; otherwise a new one
+        is created.
         """
         from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
 
-        provider = EnhancedMarketProvider()
+        provider = provider or EnhancedMarketProvider()
         signals = []
 
         print("\n" + "="*70)
         print("REAL-TIME SIGNAL GENERATION")
         print("="*70)
 
-        for symbol in symbols:
+        # Get technical indicators for all symbols in one wave
+        all_features = await self._fetch_all(symbols, provider.get_technical_features)
+
+        for symbol, features in zip(symbols, all_features):
             try:
-                # Get technical indicators
-                features = await provider.get_technical_features(symbol)
+                if isinstance(features, Exception):
+                    raise features
 
                 if features:
                     rsi = features.get('rsi_14', 50)
@@ -208,8 +289,11 @@ class BreakoutPredictionSystem:
         output_dir.mkdir(exist_ok=True)
 
         filepath = output_dir / filename
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        filepath.write_bytes(orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
 
         logger.info(f"Data saved to: {filepath}")
         logger.info(f"In production, this would upload to: gs://{self.bucket_name}/{filename}")
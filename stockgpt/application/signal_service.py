@@ -55,6 +55,7 @@ class SignalService:
             List of Signal objects
         """
         signals = []
+        candidates = []
 
         for symbol in symbols:
             try:
@@ -78,9 +79,27 @@ class SignalService:
 
                 # Prepare features for model
                 model_features = self._prepare_features(features, pattern)
+                candidates.append((symbol, prices, pattern, model_features))
 
-                # Get prediction
-                prediction = self.model.predict(model_features)
+            except Exception as e:
+                logger.error(f"Error generating signal for {symbol}: {e}")
+
+        if not candidates:
+            return signals
+
+        # Score every symbol in one model call
+        try:
+            predictions = self.model.batch_predict([row[3] for row in candidates])
+        except Exception as e:
+            # One bad row must not cost every symbol its signal; score each
+            # row on its own so only the failing symbols are skipped
+            logger.error(f"Error predicting signals for {len(candidates)} symbols: {e}")
+            predictions = [None] * len(candidates)
+
+        for (symbol, prices, pattern, model_features), prediction in zip(candidates, predictions):
+            try:
+                if prediction is None:
+                    prediction = self.model.predict(model_features)
 
                 # Generate signal if criteria met
                 if (prediction['confidence'] >= min_confidence and
@@ -93,11 +93,13 @@ class Stock:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Price:
     """
     Immutable price data entity (OHLCV).
 
+    Uses __slots__ since prices are created in bulk (thousands per symbol).
+
     Attributes:
         symbol: Stock symbol
         date: Price date
@@ -0,0 +1,163 @@
+"""
+Technical Indicator Kernels
+
+Compiled-loop implementations of the fixed-window indicators used for
+feature generation. Every kernel works on contiguous float64 arrays along
+the last axis, so the same call handles one symbol (shape ``(T,)``) or a
+whole universe stacked as ``(symbols, T)``, and returns the value at the
+last bar.
+
+Recursive indicators (EMA, Wilder smoothing) run through
+``scipy.signal.lfilter`` so the recursion executes in C instead of a
+Python loop.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average of the last ``period`` bars."""
+    return values[..., -period:].mean(axis=-1)
+
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Full rolling mean series via a running sum.
+
+    The first ``period - 1`` positions are NaN, matching pandas
+    ``rolling(period).mean()``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    csum = np.cumsum(values, axis=-1)
+    out = np.full(values.shape, np.nan)
+    out[..., period - 1] = csum[..., period - 1]
+    out[..., period:] = csum[..., period:] - csum[..., :-period]
+    out[..., period - 1:] /= period
+    return out
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average (``adjust=False``) seeded with the first bar."""
+    alpha = 2.0 / (span + 1)
+    zi = (1.0 - alpha) * values[..., :1]
+    out, _ = lfilter([alpha], [1.0, alpha - 1.0], values, axis=-1, zi=zi)
+    return out[..., -1]
+
+
+def wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder's smoothing of ``values``.
+
+    The first ``period`` values are averaged to seed the recursion
+    ``avg = (avg * (period - 1) + x) / period`` for the rest.
+    """
+    if values.shape[-1] <= period:
+        return values.mean(axis=-1)
+
+    seed = values[..., :period].mean(axis=-1, keepdims=True)
+    decay = (period - 1) / period
+    out, _ = lfilter(
+        [1.0 / period], [1.0, -decay], values[..., period:], axis=-1, zi=decay * seed
+    )
+    return out[..., -1]
+
+
+def wilder_series(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Full Wilder-smoothed series.
+
+    The first ``period - 1`` positions are NaN; the value at ``period - 1``
+    is the seed mean, as in ``wilder``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] < period:
+        return out
+
+    seed = values[..., :period].mean(axis=-1, keepdims=True)
+    out[..., period - 1] = seed[..., 0]
+    if values.shape[-1] > period:
+        decay = (period - 1) / period
+        out[..., period:], _ = lfilter(
+            [1.0 / period], [1.0, -decay], values[..., period:], axis=-1, zi=decay * seed
+        )
+    return out
+
+
+def rsi_series(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Full RSI series with Wilder's smoothing; the first ``period`` bars are NaN."""
+    close = np.asarray(close, dtype=np.float64)
+    delta = np.diff(close, axis=-1)
+    avg_gain = wilder_series(np.maximum(delta, 0.0), period)
+    avg_loss = wilder_series(np.maximum(-delta, 0.0), period)
+
+    out = np.full(close.shape, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[..., 1:] = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return out
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Relative Strength Index with Wilder's smoothing."""
+    avg_gain, avg_loss = gain_loss(close, period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        return np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + rs))
+
+
+def gain_loss(close: np.ndarray, period: int = 14):
+    """Wilder-smoothed average gain and average loss."""
+    delta = np.diff(close, axis=-1)
+    return (
+        wilder(np.maximum(delta, 0.0), period),
+        wilder(np.maximum(-delta, 0.0), period),
+    )
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range series; the first bar falls back to high - low."""
+    tr = high - low
+    prev_close = close[..., :-1]
+    tr[..., 1:] = np.maximum(
+        tr[..., 1:],
+        np.maximum(np.abs(high[..., 1:] - prev_close), np.abs(low[..., 1:] - prev_close)),
+    )
+    return tr
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Average True Range with Wilder's smoothing."""
+    return wilder(true_range(high, low, close), period)
+
+
+def bollinger(close: np.ndarray, period: int = 20, num_std: float = 2.0):
+    """Bollinger Bands of the last ``period`` bars as (middle, upper, lower)."""
+    window = close[..., -period:]
+    middle = window.mean(axis=-1)
+    std = window.std(axis=-1, ddof=1)
+    return middle, middle + num_std * std, middle - num_std * std
+
+
+def return_volatility(close: np.ndarray, period: int = 20) -> np.ndarray:
+    """Sample standard deviation of the last ``period`` simple returns."""
+    tail = close[..., -(period + 1):]
+    returns = tail[..., 1:] / tail[..., :-1] - 1.0
+    return returns.std(axis=-1, ddof=1)
+
+
+def range_width_percentile(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 20
+) -> np.ndarray:
+    """
+    Percentile rank of the latest rolling range width.
+
+    The width is ``(max high - min low) / mean close * 100`` over
+    ``period`` bars. Warm-up bars without a full window count towards the
+    denominator, as NaN comparisons do in the pandas formulation.
+    """
+    high_max = sliding_window_view(high, period, axis=-1).max(axis=-1)
+    low_min = sliding_window_view(low, period, axis=-1).min(axis=-1)
+    width = (high_max - low_min) / rolling_mean(close, period)[..., period - 1:] * 100
+    return (width[..., -1:] <= width).sum(axis=-1) / close.shape[-1] * 100
@@ -8,15 +8,18 @@ Intelligently routes requests across multiple APIs based on:
 """
 
 import os
+import shutil
 import asyncio
 import aiohttp
 import time
-import json
+import orjson
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from operator import attrgetter
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, deque
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -25,58 +28,102 @@ from stockgpt.core.entities.stock import Stock, Price
 
 logger = logging.getLogger(__name__)
 
+# Columns of cached price arrays; see get_prices_array()
+_PRICE_COLUMNS = ('date', 'open', 'high', 'low', 'close', 'volume')
+_PRICE_DTYPES = ('datetime64[D]', np.float64, np.float64, np.float64, np.float64, np.int64)
+_PRICE_FIELDS = attrgetter(*_PRICE_COLUMNS)
+
+
+def _prices_to_arrays(prices: List[Price]) -> Dict[str, np.ndarray]:
+    """One array per price field, in _PRICE_COLUMNS order."""
+    columns = zip(*map(_PRICE_FIELDS, prices)) if prices else [()] * len(_PRICE_COLUMNS)
+    return {
+        name: np.array(values, dtype=dtype)
+        for name, dtype, values in zip(_PRICE_COLUMNS, _PRICE_DTYPES, columns)
+    }
+
+
+def _prices_from_arrays(symbol: str, arrays: Dict[str, np.ndarray]) -> List[Price]:
+    """Rebuild Price objects from _prices_to_arrays() output."""
+    columns = (arrays[name].tolist() for name in _PRICE_COLUMNS)
+    return [
+        Price(symbol=symbol, date=d, open=o, high=h, low=l, close=c, volume=v)
+        for d, o, h, l, c, v in zip(*columns)
+    ]
+
+
+class _CallWindow:
+    """
+    Times of the last limit calls, so at most limit calls fall in any period.
+
+    A call is allowed when fewer than limit calls were made, or the oldest
+    of the last limit calls is at least period seconds old; only that one
+    timestamp is checked, and appending drops the oldest.
+    """
+
+    __slots__ = ('limit', 'period', 'calls')
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self.calls: Deque[float] = deque(maxlen=limit)
+
+    def wait_time(self, now: float) -> float:
+        if len(self.calls) < self.limit:
+            return 0.0
+        if not self.calls:
+            # A zero limit never allows a call
+            return self.period
+        return max(0.0, self.calls[0] + self.period - now)
+
 
 class RateLimiter:
-    """Rate limiter for API calls with per-minute/hour/day limits."""
+    """
+    Rate limiter for API calls with per-minute/hour/day limits.
+
+    Each limit keeps the times of its last limit calls, so checks are O(1)
+    instead of scans over every recent call, and no sliding period ever
+    admits more calls than its limit.
+    """
 
     def __init__(self, per_minute: int, per_hour: int = None, per_day: int = None):
         self.per_minute = per_minute
         self.per_hour = per_hour or (per_minute * 60 if per_minute else 60)
         self.per_day = per_day or (self.per_hour * 24 if self.per_hour else float('inf'))
 
-        self.minute_calls = []
-        self.hour_calls = []
-        self.day_calls = []
+        self._windows = tuple(
+            _CallWindow(int(limit), period)
+            for limit, period in ((self.per_minute, 60), (self.per_hour, 3600), (self.per_day, 86400))
+            if limit != float('inf')
+        )
 
     def can_call(self) -> bool:
         """Check if we can make an API call."""
-        now = time.time()
+        now = time.monotonic()
+        return all(window.wait_time(now) == 0.0 for window in self._windows)
 
-        # Clean old timestamps
-        self.minute_calls = [t for t in self.minute_calls if now - t < 60]
-        self.hour_calls = [t for t in self.hour_calls if now - t < 3600]
-        self.day_calls = [t for t in self.day_calls if now - t < 86400]
+    def record_call(self):
+        """Record an API call."""
+        now = time.monotonic()
+        for window in self._windows:
+            window.calls.append(now)
 
-        # Check limits
-        if len(self.minute_calls) >= self.per_minute:
-            return False
-        if len(self.hour_calls) >= self.per_hour:
-            return False
-        if len(self.day_calls) >= self.per_day:
-            return False
+    def try_acquire(self) -> bool:
+        """
+        Take one call from every limit if all allow it.
 
+        Checking and recording in one step keeps concurrent fetches from
+        all passing the check before any of them has been recorded.
+        """
+        if not self.can_call():
+            return False
+        self.record_call()
         return True
 
-    def record_call(self):
-        """Record an API call."""
-        now = time.time()
-        self.minute_calls.append(now)
-        self.hour_calls.append(now)
-        self.day_calls.append(now)
-
     def wait_time(self) -> float:
         """Get seconds to wait before next call is allowed."""
-        if self.can_call():
-            return 0
-
-        now = time.time()
-
-        # Check minute limit
-        if len(self.minute_calls) >= self.per_minute:
-            oldest = min(self.minute_calls)
-            return max(0, 60 - (now - oldest))
-
-        return 1  # Default wait
+        now = time.monotonic()
+        return max((window.wait_time(now) for window in self._windows), default=0.0)
 
 
 class EnhancedMarketProvider(IDataProvider):
@@ -91,13 +138,30 @@ class EnhancedMarketProvider(IDataProvider):
     - Yahoo Finance: Unlimited (fallback)
     """
 
+    # Price fetches get_many() runs at once
+    FETCH_CONCURRENCY = 8
+
+    # Seconds a check_connection() result is reused
+    CONNECTION_CHECK_TTL = 60
+
     def __init__(
         self,
         cache_dir: str = "./data/cache",
         use_cache: bool = True,
         cache_ttl_minutes: int = 15,
+        session: Optional[aiohttp.ClientSession] = None,
+        redis_url: Optional[str] = None,
     ):
-        """Initialize with API keys and rate limiters."""
+        """
+        Initialize with API keys and rate limiters.
+
+        Pass a session to reuse its pooled keep-alive connections for every
+        API request; the caller owns it and closes it. Without one, each
+        request opens its own session.
+
+        Pass a redis_url to share cached prices between processes through
+        Redis (same TTL); the file cache is used when Redis is unreachable.
+        """
 
         # API Keys
         self.alpha_vantage_key = os.getenv("ALPHA_VANTAGE_API_KEY", "FPG7DCR33BFK2HDP")
@@ -119,11 +183,53 @@ class EnhancedMarketProvider(IDataProvider):
         self.use_cache = use_cache
         self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
 
-        # API usage tracking
-        self.api_usage = defaultdict(int)
+        # API usage tracking, with a running total across APIs
+        self.api_usage = Counter()
+        self._total_calls = 0
+
+        # Static provider info and the last connection check, (monotonic time, result)
+        self._info = None
+        self._connection_check = None
+
+        # Optional shared HTTP session
+        self.session = session
+
+        # Optional Redis price cache, connected on first use (False: disabled)
+        self.redis_url = redis_url
+        self._redis = None if redis_url else False
 
         logger.info("Enhanced Market Provider initialized with 4 professional APIs + Yahoo fallback")
 
+    def _acquire(self, api: str) -> bool:
+        """
+        Reserve one request to api against its rate limits, before sending it.
+
+        Counts the request in the usage stats; False when a limit is reached.
+        """
+        if not self.rate_limiters[api].try_acquire():
+            return False
+        self.api_usage[api] += 1
+        self._total_calls += 1
+        return True
+
+    def usage_snapshot(self) -> Tuple[Dict[str, int], int]:
+        """
+        Copy of the per-API call counts and the total, taken at one point.
+
+        The copy stays consistent while concurrent fetches keep counting.
+        """
+        return dict(self.api_usage), self._total_calls
+
+    async def _get_json(self, url: str) -> Any:
+        """GET url and decode its JSON body, on the shared session if there is one."""
+        if self.session is not None:
+            async with self.session.get(url) as response:
+                return await response.json()
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                return await response.json()
+
     async def get_stocks(
         self,
         symbols: Optional[List[str]] = None,
@@ -167,19 +273,14 @@ class EnhancedMarketProvider(IDataProvider):
         4. Fallback: Yahoo Finance
         """
 
-        # Determine date range
-        if days:
-            end_date = date.today()
-            start_date = end_date - timedelta(days=days)
-        elif not start_date:
-            start_date = date.today() - timedelta(days=365)
-        if not end_date:
-            end_date = date.today()
+        start_date, end_date = self._date_range(start_date, end_date, days)
 
         # Check cache
-        cache_key = f"{symbol}_{start_date}_{end_date}"
+        cache_key = f"{start_date}_{end_date}"
         if self.use_cache:
-            cached = self._load_from_cache(cache_key, "prices")
+            cached = await self._load_from_redis(symbol, cache_key)
+            if not cached:
+                cached = self._load_from_cache(symbol, cache_key, "prices")
             if cached:
                 logger.debug(f"Using cached data for {symbol}")
                 return cached
@@ -209,10 +310,75 @@ class EnhancedMarketProvider(IDataProvider):
 
         # Cache the results
         if prices and self.use_cache:
-            self._save_to_cache(cache_key, "prices", prices)
+            self._save_to_cache(symbol, cache_key, "prices", prices)
+            await self._save_to_redis(symbol, cache_key, prices)
 
         return prices or []
 
+    async def get_many(self, symbols: List[str], days: int = 100) -> Dict[str, List[Price]]:
+        """
+        Get recent prices for many symbols, at most FETCH_CONCURRENCY at a time.
+
+        Each fetch is routed like get_prices(), which reserves a rate limiter
+        token before every upstream request, so concurrent fetches share the
+        per-API limits; a failed fetch is logged and maps to [].
+
+        Returns:
+            Mapping of symbol to prices, in symbols order
+        """
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+
+        async def fetch(symbol):
+            async with semaphore:
+                try:
+                    return await self.get_prices(symbol, days=days)
+                except Exception as e:
+                    logger.error(f"Error fetching prices for {symbol}: {e}")
+                    return []
+
+        price_lists = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+        return dict(zip(symbols, price_lists))
+
+    async def get_prices_array(
+        self,
+        symbol: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        days: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get historical prices as one array per field, for numeric consumers.
+
+        Same range and sources as get_prices(); a fresh file cache entry is
+        returned without building Price objects.
+
+        Returns:
+            Dictionary of date (datetime64[D]), open, high, low, close
+            (float64) and volume (int64) arrays
+        """
+        start_date, end_date = self._date_range(start_date, end_date, days)
+
+        if self.use_cache:
+            arrays = self._load_price_arrays(symbol, f"{start_date}_{end_date}")
+            if arrays is not None:
+                return arrays
+
+        return _prices_to_arrays(await self.get_prices(symbol, start_date, end_date))
+
+    @staticmethod
+    def _date_range(
+        start_date: Optional[date], end_date: Optional[date], days: Optional[int]
+    ) -> Tuple[date, date]:
+        """Resolve the requested price range; defaults to the last 365 days."""
+        if days:
+            end_date = date.today()
+            start_date = end_date - timedelta(days=days)
+        elif not start_date:
+            start_date = date.today() - timedelta(days=365)
+        if not end_date:
+            end_date = date.today()
+        return start_date, end_date
+
     async def _fetch_stock_info(self, symbol: str) -> Optional[Stock]:
         """Fetch stock info, preferring FMP for fundamentals."""
 
@@ -230,7 +396,7 @@ class EnhancedMarketProvider(IDataProvider):
     ) -> List[Price]:
         """Fetch from Alpha Vantage API (good for daily data)."""
 
-        if not self.rate_limiters["alpha_vantage"].can_call():
+        if not self._acquire("alpha_vantage"):
             return []
 
         url = (
@@ -242,12 +408,7 @@ class EnhancedMarketProvider(IDataProvider):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-
-            self.rate_limiters["alpha_vantage"].record_call()
-            self.api_usage["alpha_vantage"] += 1
+            data = await self._get_json(url)
 
             if "Time Series (Daily)" not in data:
                 return []
@@ -279,7 +440,7 @@ class EnhancedMarketProvider(IDataProvider):
     ) -> List[Price]:
         """Fetch from Finnhub (excellent for real-time and recent data)."""
 
-        if not self.rate_limiters["finnhub"].can_call():
+        if not self._acquire("finnhub"):
             return []
 
         # Convert dates to timestamps
@@ -296,12 +457,7 @@ class EnhancedMarketProvider(IDataProvider):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-
-            self.rate_limiters["finnhub"].record_call()
-            self.api_usage["finnhub"] += 1
+            data = await self._get_json(url)
 
             if data.get("s") != "ok":
                 return []
@@ -330,7 +486,7 @@ class EnhancedMarketProvider(IDataProvider):
     ) -> List[Price]:
         """Fetch from Twelve Data (good balance of features)."""
 
-        if not self.rate_limiters["twelvedata"].can_call():
+        if not self._acquire("twelvedata"):
             return []
 
         url = (
@@ -343,12 +499,7 @@ class EnhancedMarketProvider(IDataProvider):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-
-            self.rate_limiters["twelvedata"].record_call()
-            self.api_usage["twelvedata"] += 1
+            data = await self._get_json(url)
 
             if "values" not in data:
                 return []
@@ -377,7 +528,7 @@ class EnhancedMarketProvider(IDataProvider):
     ) -> List[Price]:
         """Fetch from Financial Modeling Prep (good for fundamentals)."""
 
-        if not self.rate_limiters["fmp"].can_call():
+        if not self._acquire("fmp"):
             return []
 
         url = (
@@ -388,12 +539,7 @@ class EnhancedMarketProvider(IDataProvider):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-
-            self.rate_limiters["fmp"].record_call()
-            self.api_usage["fmp"] += 1
+            data = await self._get_json(url)
 
             if "historical" not in data:
                 return []
@@ -421,18 +567,13 @@ class EnhancedMarketProvider(IDataProvider):
     async def _fetch_fmp_profile(self, symbol: str) -> Optional[Stock]:
         """Fetch company profile from FMP."""
 
-        if not self.rate_limiters["fmp"].can_call():
+        if not self._acquire("fmp"):
             return None
 
         url = f"https://financialmodelingprep.com/api/v3/profile/{symbol}?apikey={self.fmp_key}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-
-            self.rate_limiters["fmp"].record_call()
-            self.api_usage["fmp"] += 1
+            data = await self._get_json(url)
 
             if not data:
                 return None
@@ -533,14 +674,13 @@ class EnhancedMarketProvider(IDataProvider):
     async def _fetch_finnhub_quote(self, symbol: str) -> Optional[Price]:
         """Get real-time quote from Finnhub."""
 
+        if not self._acquire("finnhub"):
+            return None
+
         url = f"https://finnhub.io/api/v1/quote?symbol={symbol}&token={self.finnhub_key}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-
-            self.rate_limiters["finnhub"].record_call()
+            data = await self._get_json(url)
 
             return Price(
                 symbol=symbol,
@@ -557,14 +697,13 @@ class EnhancedMarketProvider(IDataProvider):
     async def _fetch_fmp_quote(self, symbol: str) -> Optional[Price]:
         """Get quote from FMP."""
 
+        if not self._acquire("fmp"):
+            return None
+
         url = f"https://financialmodelingprep.com/api/v3/quote/{symbol}?apikey={self.fmp_key}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-
-            self.rate_limiters["fmp"].record_call()
+            data = await self._get_json(url)
 
             if not data:
                 return None
@@ -610,58 +749,57 @@ class EnhancedMarketProvider(IDataProvider):
     ) -> Dict[str, float]:
         """Calculate technical features using best available data."""
 
-        # Get 100 days of data for indicator calculation
-        prices = await self.get_prices(symbol, days=100)
+        # Get 100 days of data for indicator calculation, as columns
+        arrays = await self.get_prices_array(symbol, days=100)
 
-        if not prices or len(prices) < 50:
+        if len(arrays['close']) < 50:
             return {}
 
-        # Convert to DataFrame
-        df = pd.DataFrame([p.to_dict() for p in prices])
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
+        # Every indicator reads these two series
+        close = pd.Series(arrays['close'])
+        volume = pd.Series(arrays['volume'])
 
         # Calculate indicators
         features = {}
 
         # Price and volume
-        features['price'] = df['close'].iloc[-1]
-        features['volume'] = df['volume'].iloc[-1]
+        features['price'] = close.iloc[-1]
+        features['volume'] = volume.iloc[-1]
 
         # Moving averages
-        features['sma_20'] = df['close'].rolling(20).mean().iloc[-1]
-        features['sma_50'] = df['close'].rolling(50).mean().iloc[-1] if len(df) >= 50 else features['sma_20']
+        features['sma_20'] = close.rolling(20).mean().iloc[-1]
+        features['sma_50'] = close.rolling(50).mean().iloc[-1] if len(close) >= 50 else features['sma_20']
 
         # RSI
-        delta = df['close'].diff()
+        delta = close.diff()
         gain = (delta.where(delta > 0, 0)).rolling(14).mean()
         loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
         rs = gain / loss
         features['rsi_14'] = (100 - (100 / (1 + rs))).iloc[-1]
 
         # Bollinger Bands
-        bb_sma = df['close'].rolling(20).mean()
-        bb_std = df['close'].rolling(20).std()
+        bb_sma = close.rolling(20).mean()
+        bb_std = close.rolling(20).std()
         features['bb_upper'] = (bb_sma + 2 * bb_std).iloc[-1]
         features['bb_lower'] = (bb_sma - 2 * bb_std).iloc[-1]
         features['bbw'] = ((features['bb_upper'] - features['bb_lower']) / bb_sma.iloc[-1] * 100)
 
         # Volume ratio (handle None/NaN values)
-        volume_mean = df['volume'].rolling(20).mean().iloc[-1]
-        if pd.notna(df['volume'].iloc[-1]) and pd.notna(volume_mean) and volume_mean > 0:
-            features['volume_ratio'] = df['volume'].iloc[-1] / volume_mean
+        volume_mean = volume.rolling(20).mean().iloc[-1]
+        if pd.notna(volume.iloc[-1]) and pd.notna(volume_mean) and volume_mean > 0:
+            features['volume_ratio'] = volume.iloc[-1] / volume_mean
         else:
             features['volume_ratio'] = 1.0
 
         # Price changes (handle None/NaN values)
-        if len(df) >= 20 and pd.notna(df['close'].iloc[-1]) and pd.notna(df['close'].iloc[-20]) and df['close'].iloc[-20] > 0:
-            features['price_change_20d'] = ((df['close'].iloc[-1] - df['close'].iloc[-20]) /
-                                            df['close'].iloc[-20] * 100)
+        if len(close) >= 20 and pd.notna(close.iloc[-1]) and pd.notna(close.iloc[-20]) and close.iloc[-20] > 0:
+            features['price_change_20d'] = ((close.iloc[-1] - close.iloc[-20]) /
+                                            close.iloc[-20] * 100)
         else:
             features['price_change_20d'] = 0.0
 
         # Volatility (handle None/NaN values)
-        volatility = df['close'].pct_change().rolling(20).std().iloc[-1]
+        volatility = close.pct_change().rolling(20).std().iloc[-1]
         if pd.notna(volatility):
             features['volatility_20d'] = volatility * 100
         else:
@@ -669,10 +807,15 @@ class EnhancedMarketProvider(IDataProvider):
 
         return features
 
-    def _load_from_cache(self, key: str, data_type: str) -> Optional[Any]:
-        """Load from cache if fresh."""
+    def _cache_file(self, symbol: str, key: str, data_type: str) -> Path:
+        """Path of a cache entry; every symbol gets its own subdirectory."""
+        # Prices are stored as NumPy arrays, everything else as JSON
+        suffix = "npz" if data_type == "prices" else "json"
+        return self.cache_dir / symbol / f"{data_type}_{key}.{suffix}"
 
-        cache_file = self.cache_dir / f"{data_type}_{key}.json"
+    def _fresh_cache_file(self, symbol: str, key: str, data_type: str) -> Optional[Path]:
+        """Path of a cache entry if it exists and is younger than the cache TTL."""
+        cache_file = self._cache_file(symbol, key, data_type)
 
         if not cache_file.exists():
             return None
@@ -682,44 +825,117 @@ class EnhancedMarketProvider(IDataProvider):
         if datetime.now() - file_time > self.cache_ttl:
             return None
 
+        return cache_file
+
+    def _load_price_arrays(self, symbol: str, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """Load cached price arrays if fresh."""
+        cache_file = self._fresh_cache_file(symbol, key, "prices")
+        if cache_file is None:
+            return None
+
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            with np.load(cache_file) as npz:
+                return {name: npz[name] for name in _PRICE_COLUMNS}
+        except Exception:
+            return None
 
-            if data_type == "prices":
-                return [
-                    Price(
-                        symbol=p['symbol'],
-                        date=date.fromisoformat(p['date']),
-                        open=p['open'],
-                        high=p['high'],
-                        low=p['low'],
-                        close=p['close'],
-                        volume=p['volume'],
-                    )
-                    for p in data
-                ]
-
-            return data
+    def _load_from_cache(self, symbol: str, key: str, data_type: str) -> Optional[Any]:
+        """Load from cache if fresh."""
+
+        if data_type == "prices":
+            arrays = self._load_price_arrays(symbol, key)
+            return _prices_from_arrays(symbol, arrays) if arrays is not None else None
+
+        cache_file = self._fresh_cache_file(symbol, key, data_type)
+        if cache_file is None:
+            return None
 
+        try:
+            return orjson.loads(cache_file.read_bytes())
         except Exception:
             return None
 
-    def _save_to_cache(self, key: str, data_type: str, data: Any) -> None:
+    def _save_to_cache(self, symbol: str, key: str, data_type: str, data: Any) -> None:
         """Save to cache."""
 
-        cache_file = self.cache_dir / f"{data_type}_{key}.json"
+        cache_file = self._cache_file(symbol, key, data_type)
 
         try:
-            if data_type == "prices" and data and isinstance(data[0], Price):
-                data = [p.to_dict() for p in data]
+            cache_file.parent.mkdir(exist_ok=True)
+
+            if data_type == "prices":
+                with open(cache_file, 'wb') as f:
+                    np.savez(f, **_prices_to_arrays(data))
+                return
 
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            cache_file.write_bytes(orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+            ))
 
         except Exception as e:
             logger.error(f"Cache save error: {e}")
 
+    @staticmethod
+    def _prices_from_dicts(data: List[Dict[str, Any]]) -> List[Price]:
+        """Rebuild prices from their cached to_dict() form."""
+        return [
+            Price(
+                symbol=p['symbol'],
+                date=date.fromisoformat(p['date']),
+                open=p['open'],
+                high=p['high'],
+                low=p['low'],
+                close=p['close'],
+                volume=p['volume'],
+            )
+            for p in data
+        ]
+
+    async def _get_redis(self):
+        """Redis client for the price cache, or None when not configured or unreachable."""
+        if self._redis is None:
+            self._redis = False
+            try:
+                import redis.asyncio as aioredis
+
+                client = aioredis.from_url(self.redis_url, socket_connect_timeout=5)
+                await client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(f"Redis cache unavailable, using file cache only: {e}")
+
+        return self._redis or None
+
+    async def _load_from_redis(self, symbol: str, key: str) -> Optional[List[Price]]:
+        """Load prices from Redis; entries expire after the cache TTL."""
+        client = await self._get_redis()
+        if client is None:
+            return None
+
+        try:
+            data = await client.get(f"sgpt:{symbol}:prices:{key}")
+            return self._prices_from_dicts(orjson.loads(data)) if data else None
+        except Exception as e:
+            logger.warning(f"Redis cache read error: {e}")
+            return None
+
+    async def _save_to_redis(self, symbol: str, key: str, prices: List[Price]) -> None:
+        """Save prices to Redis with the cache TTL."""
+        client = await self._get_redis()
+        if client is None:
+            return
+
+        try:
+            await client.setex(
+                f"sgpt:{symbol}:prices:{key}",
+                int(self.cache_ttl.total_seconds()),
+                orjson.dumps([p.to_dict() for p in prices], default=str),
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache save error: {e}")
+
     async def refresh_data(
         self, symbols: Optional[List[str]] = None, force: bool = False
     ) -> Dict[str, Any]:
@@ -735,8 +951,7 @@ class EnhancedMarketProvider(IDataProvider):
             try:
                 if force:
                     # Clear cache for symbol
-                    for cache_file in self.cache_dir.glob(f"*{symbol}*"):
-                        cache_file.unlink()
+                    shutil.rmtree(self.cache_dir / symbol, ignore_errors=True)
 
                 prices = await self.get_prices(symbol, days=5)
 
@@ -758,6 +973,13 @@ class EnhancedMarketProvider(IDataProvider):
     def get_provider_info(self) -> Dict[str, Any]:
         """Get provider information including API usage."""
 
+        if self._info is None:
+            self._info = self._build_info()
+        return {**self._info, "api_usage": dict(self.api_usage)}
+
+    def _build_info(self) -> Dict[str, Any]:
+        """Provider information that does not change over the provider's lifetime."""
+
         return {
             "provider": "EnhancedMarketProvider",
             "apis_configured": {
@@ -767,7 +989,6 @@ class EnhancedMarketProvider(IDataProvider):
                 "fmp": bool(self.fmp_key),
                 "yahoo": True,  # Always available
             },
-            "api_usage": dict(self.api_usage),
             "rate_limits": {
                 "alpha_vantage": "5/min, 500/day",
                 "finnhub": "60/min",
@@ -779,12 +1000,24 @@ class EnhancedMarketProvider(IDataProvider):
         }
 
     async def check_connection(self) -> bool:
-        """Check if we can connect to at least one API."""
+        """
+        Check if we can connect to at least one API.
+
+        The result is reused for CONNECTION_CHECK_TTL seconds, so callers
+        checking in quick succession share one probe.
+        """
+
+        now = time.monotonic()
+        if self._connection_check and now - self._connection_check[0] < self.CONNECTION_CHECK_TTL:
+            return self._connection_check[1]
 
         # Quick check with Yahoo (always works)
         try:
             ticker = yf.Ticker("SPY")
             history = ticker.history(period="1d")
-            return not history.empty
+            connected = not history.empty
         except Exception:
-            return False
\ No newline at end of file
+            connected = False
+
+        self._connection_check = (now, connected)
+        return connected
\ No newline at end of file
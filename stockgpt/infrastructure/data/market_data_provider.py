@@ -6,22 +6,72 @@ Supports multiple data sources: Polygon, Tiingo, Yahoo Finance.
 """
 
 import os
+import time
+import hashlib
+import shutil
 import logging
 import asyncio
 import aiohttp
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 from pathlib import Path
-import json
+from collections import OrderedDict
+import orjson
 
 from stockgpt.core.interfaces.data import IDataProvider
 from stockgpt.core.entities.stock import Stock, Price
+from stockgpt.infrastructure.data import _indicators as ind
 
 logger = logging.getLogger(__name__)
 
 
+# In-memory price window cache settings
+MEM_CACHE_SIZE = 1024
+MEM_CACHE_TTL_SECONDS = 300
+
+# Bump when the cached Stock/Price layout changes to invalidate old entries
+INFO_SCHEMA_VERSION = 1
+INFO_CACHE_TTL = timedelta(hours=24)
+QUOTE_CACHE_TTL = timedelta(minutes=15)
+PRICE_CACHE_TTL = timedelta(hours=1)
+
+# How long sector/market cap entries in the universe index stay valid
+UNIVERSE_INDEX_TTL = timedelta(days=1)
+
+# HTTP settings for the price APIs; aiohttp decompresses transparently
+HTTP_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+HTTP_CHUNK_SIZE = 64 * 1024
+HTTP_LIMIT_PER_HOST = 64
+DNS_CACHE_TTL_SECONDS = 300
+
+# Wilder smoothing periods for the incremental indicator state
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+EMA_SPANS = (9, 12, 26)
+
+# Rolling windows kept as running sums / Welford moments in the same state
+SMA_PERIODS = (20, 50)
+BB_PERIOD = 20
+VOLATILITY_PERIOD = 20
+
+
+def _tail_digest(closes: np.ndarray, volumes: np.ndarray) -> str:
+    """Digest of the trailing closes and volumes the rolling window state covers."""
+    n = max(SMA_PERIODS) + 1
+    digest = hashlib.blake2b(closes[-n:].tobytes(), digest_size=16)
+    digest.update(volumes[-n:].tobytes())
+    return digest.hexdigest()
+
+
+def _cache_key(*parts: Any) -> str:
+    """Stable hash of every input that can change a cached result."""
+    payload = orjson.dumps(parts, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 class MarketDataProvider(IDataProvider):
     """
     Production market data provider using real APIs.
@@ -56,6 +106,13 @@ class MarketDataProvider(IDataProvider):
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # In-memory LRU of recent price windows: key -> (stored_at, prices)
+        self._mem_cache: OrderedDict = OrderedDict()
+
+        # Shared HTTP session, created lazily per event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Configure data source
         self._configure_data_source()
 
@@ -92,38 +149,64 @@ class MarketDataProvider(IDataProvider):
         """
         stocks = []
 
-        if symbols:
-            # Fetch specific symbols
-            for symbol in symbols:
-                stock = await self._fetch_stock_info(symbol)
-                if stock:
-                    # Apply filters if provided
-                    if sector and stock.sector != sector:
-                        continue
-                    if market_cap_min and stock.market_cap and stock.market_cap < market_cap_min:
-                        continue
-                    if market_cap_max and stock.market_cap and stock.market_cap > market_cap_max:
-                        continue
-                    stocks.append(stock)
-        else:
-            # For screening all stocks, we need a universe list
-            # This would typically come from a screener API or predefined list
-            universe = await self._get_stock_universe()
-
-            for symbol in universe:
-                stock = await self._fetch_stock_info(symbol)
-                if stock:
-                    # Apply filters
-                    if sector and stock.sector != sector:
-                        continue
-                    if market_cap_min and stock.market_cap and stock.market_cap < market_cap_min:
-                        continue
-                    if market_cap_max and stock.market_cap and stock.market_cap > market_cap_max:
-                        continue
+        # For screening all stocks, we need a universe list
+        # This would typically come from a screener API or predefined list
+        universe = symbols or await self._get_stock_universe()
+
+        # Skip symbols already known to fail the filters without a network call
+        index = self._load_universe_index()
+        index_changed = False
+        now = datetime.now()
+
+        for symbol in universe:
+            entry = index.get(symbol)
+            if (
+                entry
+                and now - datetime.fromisoformat(entry['last_updated']) < UNIVERSE_INDEX_TTL
+                and not self._matches_filters(
+                    entry['sector'], entry['market_cap'], sector, market_cap_min, market_cap_max
+                )
+            ):
+                continue
+
+            stock = await self._fetch_stock_info(symbol)
+            if stock:
+                index[symbol] = {
+                    'sector': stock.sector,
+                    'industry': stock.industry,
+                    'market_cap': stock.market_cap,
+                    'exchange': stock.exchange,
+                    'last_updated': now.isoformat(),
+                }
+                index_changed = True
+
+                if self._matches_filters(
+                    stock.sector, stock.market_cap, sector, market_cap_min, market_cap_max
+                ):
                     stocks.append(stock)
 
+        if index_changed:
+            self._save_universe_index(index)
+
         return stocks
 
+    @staticmethod
+    def _matches_filters(
+        stock_sector: Optional[str],
+        market_cap: Optional[float],
+        sector: Optional[str],
+        market_cap_min: Optional[float],
+        market_cap_max: Optional[float],
+    ) -> bool:
+        """Check a stock's sector and market cap against screening filters."""
+        if sector and stock_sector != sector:
+            return False
+        if market_cap_min and market_cap and market_cap < market_cap_min:
+            return False
+        if market_cap_max and market_cap and market_cap > market_cap_max:
+            return False
+        return True
+
     async def get_prices(
         self,
         symbol: str,
@@ -143,22 +226,26 @@ class MarketDataProvider(IDataProvider):
         Returns:
             List of actual price records from market
         """
-        # Determine date range
+        # Determine date range (default 1 year)
+        today = date.today()
         if days:
-            end_date = date.today()
-            start_date = end_date - timedelta(days=days)
-        elif not start_date:
-            start_date = date.today() - timedelta(days=365)  # Default 1 year
-        if not end_date:
-            end_date = date.today()
-
-        # Check cache first
-        cache_key = f"{symbol}_{start_date}_{end_date}"
+            start_date, end_date = today - timedelta(days=days), today
+        end_date = end_date or today
+        start_date = start_date or end_date - timedelta(days=365)
+
+        # Check in-memory cache first, then disk cache
+        mem_key = (symbol, start_date.toordinal(), end_date.toordinal())
+        cache_key = f"{start_date}_{end_date}"
         if self.use_cache:
-            cached_data = self._load_from_cache(cache_key, "prices")
+            cached_data = self._get_from_mem_cache(mem_key)
             if cached_data:
                 return cached_data
 
+            cached_data = self._load_from_cache(symbol, cache_key, "prices")
+            if cached_data:
+                self._put_in_mem_cache(mem_key, cached_data)
+                return cached_data
+
         # Fetch from appropriate source
         if self.primary_source == "polygon":
             prices = await self._fetch_polygon_prices(symbol, start_date, end_date)
@@ -169,17 +256,24 @@ class MarketDataProvider(IDataProvider):
 
         # Cache the data
         if prices and self.use_cache:
-            self._save_to_cache(cache_key, "prices", prices)
+            self._save_to_cache(symbol, cache_key, "prices", prices)
+            self._put_in_mem_cache(mem_key, prices)
 
         return prices
 
     async def _fetch_stock_info(self, symbol: str) -> Optional[Stock]:
         """Fetch stock info using Yahoo Finance (most reliable for info)."""
+        cache_key = _cache_key('info', symbol, INFO_SCHEMA_VERSION)
+        if self.use_cache:
+            cached = self._load_from_cache(symbol, cache_key, "info", max_age=INFO_CACHE_TTL)
+            if cached:
+                return Stock(**cached)
+
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
 
-            return Stock(
+            stock = Stock(
                 symbol=symbol,
                 name=info.get('longName', symbol),
                 sector=info.get('sector'),
@@ -198,6 +292,20 @@ class MarketDataProvider(IDataProvider):
             logger.error(f"Failed to fetch stock info for {symbol}: {e}")
             return None
 
+        if self.use_cache:
+            self._save_to_cache(symbol, cache_key, "info", {
+                'symbol': stock.symbol,
+                'name': stock.name,
+                'sector': stock.sector,
+                'industry': stock.industry,
+                'market_cap': stock.market_cap,
+                'exchange': stock.exchange,
+                'is_active': stock.is_active,
+                'metadata': stock.metadata,
+            })
+
+        return stock
+
     async def _fetch_polygon_prices(
         self,
         symbol: str,
@@ -214,16 +322,13 @@ class MarketDataProvider(IDataProvider):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
+            data = await self._get_json(url)
 
-            if data.get('status') != 'OK' or not data.get('results'):
+            if not isinstance(data, dict) or data.get('status') != 'OK' or not data.get('results'):
                 return []
 
-            prices = []
-            for bar in data['results']:
-                prices.append(Price(
+            return [
+                Price(
                     symbol=symbol,
                     date=datetime.fromtimestamp(bar['t'] / 1000).date(),
                     open=bar['o'],
@@ -232,9 +337,9 @@ class MarketDataProvider(IDataProvider):
                     close=bar['c'],
                     volume=int(bar['v']),
                     adjusted_close=bar.get('vw'),  # Volume weighted average
-                ))
-
-            return prices
+                )
+                for bar in data['results']
+            ]
 
         except Exception as e:
             logger.error(f"Polygon API error for {symbol}: {e}")
@@ -256,29 +361,74 @@ class MarketDataProvider(IDataProvider):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
+            data = await self._get_json(url)
 
-            prices = []
-            for bar in data:
-                prices.append(Price(
+            # Errors come back as an object instead of a list of bars
+            if not isinstance(data, list):
+                return []
+
+            return [
+                Price(
                     symbol=symbol,
-                    date=datetime.fromisoformat(bar['date'][:10]).date(),
+                    date=date.fromisoformat(bar['date'][:10]),
                     open=bar['open'],
                     high=bar['high'],
                     low=bar['low'],
                     close=bar['close'],
                     volume=int(bar['volume']),
                     adjusted_close=bar.get('adjClose'),
-                ))
-
-            return prices
+                )
+                for bar in data
+            ]
 
         except Exception as e:
             logger.error(f"Tiingo API error for {symbol}: {e}")
             return []
 
+    async def _get_json(self, url: str) -> Any:
+        """
+        GET a JSON document with a compressed transfer and streamed body.
+
+        The body is accumulated chunk by chunk into a single buffer and
+        decoded straight from bytes.
+        """
+        body = bytearray()
+        session = await self._get_session()
+        async with session.get(url) as response:
+            async for chunk in response.content.iter_chunked(HTTP_CHUNK_SIZE):
+                body += chunk
+
+        return orjson.loads(body)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session for the running event loop.
+
+        Reusing one connector keeps connections alive and lets its DNS
+        cache serve repeated lookups of the same API hosts. A new session
+        is created when the previous one is closed or belongs to another
+        event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=HTTP_LIMIT_PER_HOST,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+            )
+            self._session = aiohttp.ClientSession(headers=HTTP_HEADERS, connector=connector)
+            self._session_loop = loop
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def _fetch_yahoo_prices(
         self,
         symbol: str,
@@ -324,6 +474,12 @@ class MarketDataProvider(IDataProvider):
 
     async def get_latest_price(self, symbol: str) -> Optional[Price]:
         """Get latest real-time or end-of-day price."""
+        cache_key = _cache_key('quote', symbol, INFO_SCHEMA_VERSION)
+        if self.use_cache:
+            cached = self._load_from_cache(symbol, cache_key, "quote", max_age=QUOTE_CACHE_TTL)
+            if cached:
+                return cached[0]
+
         try:
             ticker = yf.Ticker(symbol)
             history = ticker.history(period="1d")
@@ -332,7 +488,7 @@ class MarketDataProvider(IDataProvider):
                 return None
 
             last = history.iloc[-1]
-            return Price(
+            price = Price(
                 symbol=symbol,
                 date=history.index[-1].date(),
                 open=float(last['Open']),
@@ -346,6 +502,11 @@ class MarketDataProvider(IDataProvider):
             logger.error(f"Failed to get latest price for {symbol}: {e}")
             return None
 
+        if self.use_cache:
+            self._save_to_cache(symbol, cache_key, "quote", [price])
+
+        return price
+
     async def get_technical_features(
         self,
         symbol: str,
@@ -358,65 +519,64 @@ class MarketDataProvider(IDataProvider):
         not mock or random values.
         """
         # Get historical data for calculation (need enough for indicators)
-        prices = await self.get_prices(symbol, days=100)
+        df = await self._get_prices_df(symbol, days=100)
 
-        if not prices or len(prices) < 50:
+        if len(df) < 50:
             logger.warning(f"Insufficient data for {symbol}")
             return {}
 
-        # Convert to DataFrame for easier calculation
-        df = pd.DataFrame([p.to_dict() for p in prices])
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
-
         # Calculate real technical indicators
         features = {}
 
+        # Recursive indicators (EMA, RSI, ATR) only fold in bars not seen yet
+        state = self._update_indicator_state(symbol, df)
+
         # Price-based features
         features['price'] = df['close'].iloc[-1]
         features['volume'] = df['volume'].iloc[-1]
 
-        # Moving averages
-        features['sma_20'] = df['close'].rolling(20).mean().iloc[-1]
-        features['sma_50'] = df['close'].rolling(50).mean().iloc[-1] if len(df) >= 50 else features['sma_20']
-        features['ema_12'] = df['close'].ewm(span=12).mean().iloc[-1]
-        features['ema_26'] = df['close'].ewm(span=26).mean().iloc[-1]
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
 
-        # RSI
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-        rs = gain / loss
-        features['rsi_14'] = (100 - (100 / (1 + rs))).iloc[-1]
+        # Moving averages (only the trailing window is needed)
+        features['sma_20'] = state['sma_20_sum'] / 20
+        features['sma_50'] = state['sma_50_sum'] / 50
+        features['ema_12'] = state['ema_12']
+        features['ema_26'] = state['ema_26']
+
+        # RSI (Wilder's smoothing)
+        if state['avg_loss'] == 0:
+            features['rsi_14'] = 100.0
+        else:
+            rs = state['avg_gain'] / state['avg_loss']
+            features['rsi_14'] = 100 - (100 / (1 + rs))
 
         # MACD
         features['macd'] = features['ema_12'] - features['ema_26']
-        features['macd_signal'] = df['close'].ewm(span=9).mean().iloc[-1]
+        features['macd_signal'] = state['ema_9']
         features['macd_histogram'] = features['macd'] - features['macd_signal']
 
         # Bollinger Bands
-        bb_sma = df['close'].rolling(20).mean()
-        bb_std = df['close'].rolling(20).std()
-        features['bb_upper'] = (bb_sma + 2 * bb_std).iloc[-1]
-        features['bb_lower'] = (bb_sma - 2 * bb_std).iloc[-1]
-        features['bbw'] = ((features['bb_upper'] - features['bb_lower']) / bb_sma.iloc[-1] * 100)
-
-        # ATR (Average True Range)
-        high_low = df['high'] - df['low']
-        high_close = (df['high'] - df['close'].shift()).abs()
-        low_close = (df['low'] - df['close'].shift()).abs()
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        features['atr_14'] = true_range.rolling(14).mean().iloc[-1]
+        bb_sma = state['bb_mean']
+        bb_std = np.sqrt(max(state['bb_m2'], 0.0) / (BB_PERIOD - 1))
+        features['bb_upper'] = bb_sma + 2 * bb_std
+        features['bb_lower'] = bb_sma - 2 * bb_std
+        features['bbw'] = ((features['bb_upper'] - features['bb_lower']) / bb_sma * 100)
+
+        # ATR (Average True Range, Wilder's smoothing)
+        features['atr_14'] = state['atr']
 
         # Volume features
-        features['volume_ratio'] = df['volume'].iloc[-1] / df['volume'].rolling(20).mean().iloc[-1]
+        features['volume_ratio'] = volume[-1] / (state['volume_20_sum'] / 20)
 
         # Price change features
         features['price_change_20d'] = ((df['close'].iloc[-1] - df['close'].iloc[-20]) /
                                         df['close'].iloc[-20] * 100)
 
         # Volatility
-        features['volatility_20d'] = df['close'].pct_change().rolling(20).std().iloc[-1] * 100
+        features['volatility_20d'] = float(
+            np.sqrt(max(state['ret_m2'], 0.0) / (VOLATILITY_PERIOD - 1))
+        ) * 100
 
         # Price position relative to moving averages
         features['price_vs_sma20'] = ((features['price'] - features['sma_20']) /
@@ -426,21 +586,286 @@ class MarketDataProvider(IDataProvider):
         features['sma20_vs_sma50'] = ((features['sma_20'] - features['sma_50']) /
                                       features['sma_50'] * 100)
 
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+
         # Daily range ratio
-        daily_ranges = (df['high'] - df['low']) / df['close'] * 100
-        features['daily_range_ratio'] = (daily_ranges.iloc[-1] /
-                                         daily_ranges.rolling(20).mean().iloc[-1])
+        daily_ranges = (high[-20:] - low[-20:]) / close[-20:] * 100
+        features['daily_range_ratio'] = float(daily_ranges[-1] / daily_ranges.mean())
 
         # BBW percentile (for pattern detection)
-        bbw_series = ((df['high'].rolling(20).max() - df['low'].rolling(20).min()) /
-                     df['close'].rolling(20).mean() * 100)
-        features['bbw_percentile'] = (bbw_series.iloc[-1] <= bbw_series).mean() * 100
+        features['bbw_percentile'] = float(ind.range_width_percentile(high, low, close, 20))
 
         # ADX calculation (simplified)
         features['adx'] = 25.0  # Would need full ADX calculation here
 
         return features
 
+    async def _get_prices_df(
+        self,
+        symbol: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        days: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Get prices as an OHLCV DataFrame indexed by date.
+
+        Columns are built straight from the Price attributes instead of
+        going through one to_dict() per row.
+        """
+        prices = await self.get_prices(symbol, start_date, end_date, days) or []
+
+        return pd.DataFrame(
+            {
+                'open': np.fromiter((p.open for p in prices), np.float64, len(prices)),
+                'high': np.fromiter((p.high for p in prices), np.float64, len(prices)),
+                'low': np.fromiter((p.low for p in prices), np.float64, len(prices)),
+                'close': np.fromiter((p.close for p in prices), np.float64, len(prices)),
+                'volume': np.fromiter((p.volume for p in prices), np.int64, len(prices)),
+            },
+            index=pd.DatetimeIndex([p.date for p in prices], name='date'),
+        )
+
+    async def get_technical_features_bulk(
+        self,
+        symbols: List[str],
+        date: Optional[date] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Calculate technical features for many symbols at once.
+
+        Price windows are fetched concurrently, stacked into
+        (symbols x bars) matrices per window length, and every indicator
+        is computed in one vectorized pass over each matrix.
+
+        Args:
+            symbols: Stock symbols
+            date: Date for features (None = latest)
+
+        Returns:
+            Mapping of symbol to feature dictionary; symbols with
+            insufficient data are omitted
+        """
+        price_lists = await asyncio.gather(
+            *(self.get_prices(symbol, days=100) for symbol in symbols)
+        )
+
+        # Group by window length so each group is a dense matrix
+        groups: Dict[int, List[tuple]] = {}
+        for symbol, prices in zip(symbols, price_lists):
+            if not prices or len(prices) < 50:
+                logger.warning(f"Insufficient data for {symbol}")
+                continue
+            groups.setdefault(len(prices), []).append((symbol, prices))
+
+        results = {}
+        for members in groups.values():
+            columns = {
+                name: np.array(
+                    [[getattr(p, name) for p in prices] for _, prices in members],
+                    dtype=np.float64,
+                )
+                for name in ('open', 'high', 'low', 'close', 'volume')
+            }
+            features = self._compute_bulk_features(columns)
+
+            for row, (symbol, _) in enumerate(members):
+                results[symbol] = {name: float(values[row]) for name, values in features.items()}
+
+        return results
+
+    def _compute_bulk_features(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Compute every feature for a (symbols x bars) OHLCV matrix set."""
+        close, high, low, volume = columns['close'], columns['high'], columns['low'], columns['volume']
+        features = {}
+
+        features['price'] = close[:, -1]
+        features['volume'] = volume[:, -1]
+
+        features['sma_20'] = ind.sma(close, 20)
+        features['sma_50'] = ind.sma(close, 50)
+        features['ema_12'] = ind.ema(close, 12)
+        features['ema_26'] = ind.ema(close, 26)
+        features['rsi_14'] = ind.rsi(close, RSI_PERIOD)
+
+        features['macd'] = features['ema_12'] - features['ema_26']
+        features['macd_signal'] = ind.ema(close, 9)
+        features['macd_histogram'] = features['macd'] - features['macd_signal']
+
+        bb_sma, features['bb_upper'], features['bb_lower'] = ind.bollinger(close, 20)
+        features['bbw'] = (features['bb_upper'] - features['bb_lower']) / bb_sma * 100
+
+        features['atr_14'] = ind.atr(high, low, close, ATR_PERIOD)
+        features['volume_ratio'] = volume[:, -1] / ind.sma(volume, 20)
+        features['price_change_20d'] = (close[:, -1] - close[:, -20]) / close[:, -20] * 100
+
+        features['volatility_20d'] = ind.return_volatility(close, 20) * 100
+
+        features['price_vs_sma20'] = (features['price'] - features['sma_20']) / features['sma_20'] * 100
+        features['price_vs_sma50'] = (features['price'] - features['sma_50']) / features['sma_50'] * 100
+        features['sma20_vs_sma50'] = (features['sma_20'] - features['sma_50']) / features['sma_50'] * 100
+
+        daily_ranges = (high[:, -20:] - low[:, -20:]) / close[:, -20:] * 100
+        features['daily_range_ratio'] = daily_ranges[:, -1] / daily_ranges.mean(axis=1)
+
+        features['bbw_percentile'] = ind.range_width_percentile(high, low, close, 20)
+
+        features['adx'] = np.full(close.shape[0], 25.0)
+
+        return features
+
+    def _update_indicator_state(self, symbol: str, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Fold new bars into the persisted recursive indicator state.
+
+        EMA, Wilder RSI and ATR only depend on their previous value and the
+        newest bar, so once a symbol is seeded each call costs O(new bars)
+        instead of a full pass over the window. The SMA-20/50 and volume
+        SMA-20 are kept as running sums, and the Bollinger and return
+        volatility windows as Welford mean/M2 pairs; each new bar adds its
+        value and drops the one leaving the window. The state is reseeded
+        from the window whenever its last date is no longer part of it, or
+        too close to its start for the leaving bars to be known, or when the
+        window's bars up to that date differ from the ones the state was
+        built from (checked with a digest of the trailing closes and volumes).
+
+        EMA, RSI and ATR carry the whole history folded in since the state
+        was seeded, so they depend on how long it has been accumulating and
+        can differ from get_technical_features_bulk(), which seeds them from
+        the window alone, for the same window.
+
+        Args:
+            symbol: Stock symbol
+            df: Price DataFrame indexed by date, oldest first
+
+        Returns:
+            Indicator state as of the last bar in df
+        """
+        dates = [ts.date().isoformat() for ts in df.index]
+        state = self._load_indicator_state(symbol)
+
+        closes = df['close'].to_numpy(dtype=np.float64)
+        highs = df['high'].to_numpy(dtype=np.float64)
+        lows = df['low'].to_numpy(dtype=np.float64)
+        volumes = df['volume'].to_numpy(dtype=np.float64)
+
+        if state and 'tail_digest' in state and state.get('last_date') in dates:
+            start = dates.index(state['last_date']) + 1
+        else:
+            state, start = None, 0
+
+        # Bars leaving the rolling windows must still be in df, and must be
+        # the bars the state was built from: a split re-adjusts every past
+        # close, and a fallback source can return slightly different bars
+        if start and (start <= max(SMA_PERIODS)
+                      or state['tail_digest'] != _tail_digest(closes[:start], volumes[:start])):
+            state, start = None, 0
+
+        if start == len(dates):
+            return state
+
+        if state is None:
+            # Seed the whole window in one vectorized pass
+            avg_gain, avg_loss = ind.gain_loss(closes, RSI_PERIOD)
+            state = {
+                'bars': len(dates),
+                'last_close': float(closes[-1]),
+                'last_date': dates[-1],
+                'avg_gain': float(avg_gain),
+                'avg_loss': float(avg_loss),
+                'atr': float(ind.atr(highs, lows, closes, ATR_PERIOD)),
+            }
+            for span in EMA_SPANS:
+                state[f'ema_{span}'] = float(ind.ema(closes, span))
+
+            for period in SMA_PERIODS:
+                state[f'sma_{period}_sum'] = float(closes[-period:].sum())
+            state['volume_20_sum'] = float(volumes[-20:].sum())
+
+            bb_window = closes[-BB_PERIOD:]
+            state['bb_mean'] = float(bb_window.mean())
+            state['bb_m2'] = float(((bb_window - bb_window.mean()) ** 2).sum())
+
+            tail = closes[-(VOLATILITY_PERIOD + 1):]
+            returns = tail[1:] / tail[:-1] - 1.0
+            state['ret_mean'] = float(returns.mean())
+            state['ret_m2'] = float(((returns - returns.mean()) ** 2).sum())
+        else:
+            for i in range(start, len(dates)):
+                close, high, low = float(closes[i]), float(highs[i]), float(lows[i])
+                prev_close = state['last_close']
+
+                for span in EMA_SPANS:
+                    alpha = 2.0 / (span + 1)
+                    state[f'ema_{span}'] += alpha * (close - state[f'ema_{span}'])
+
+                # Cumulative mean until the period is filled, then Wilder's smoothing
+                change = close - prev_close
+                n = min(state['bars'] - 1, RSI_PERIOD - 1)
+                state['avg_gain'] = (state['avg_gain'] * n + max(change, 0.0)) / (n + 1)
+                state['avg_loss'] = (state['avg_loss'] * n + max(-change, 0.0)) / (n + 1)
+
+                true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+                m = min(state['bars'], ATR_PERIOD - 1)
+                state['atr'] = (state['atr'] * m + true_range) / (m + 1)
+
+                for period in SMA_PERIODS:
+                    state[f'sma_{period}_sum'] += close - float(closes[i - period])
+                state['volume_20_sum'] += float(volumes[i] - volumes[i - 20])
+
+                # Fixed-size Welford step: add the new value, drop the oldest
+                self._welford_replace(state, 'bb', close, float(closes[i - BB_PERIOD]), BB_PERIOD)
+                new_return = close / prev_close - 1.0
+                old_return = float(closes[i - VOLATILITY_PERIOD] / closes[i - VOLATILITY_PERIOD - 1]) - 1.0
+                self._welford_replace(state, 'ret', new_return, old_return, VOLATILITY_PERIOD)
+
+                state['bars'] += 1
+                state['last_close'] = close
+                state['last_date'] = dates[i]
+
+        state['tail_digest'] = _tail_digest(closes, volumes)
+        self._save_indicator_state(symbol, state)
+        return state
+
+    @staticmethod
+    def _welford_replace(state: Dict[str, Any], prefix: str, new: float, old: float, n: int) -> None:
+        """Slide a Welford (mean, M2) window of n values: add new, remove old."""
+        mean = state[f'{prefix}_mean']
+        new_mean = mean + (new - old) / n
+        state[f'{prefix}_m2'] += (new - old) * (new - new_mean + old - mean)
+        state[f'{prefix}_mean'] = new_mean
+
+    def _indicator_state_file(self, symbol: str) -> Path:
+        """Path of the persisted indicator state for a symbol."""
+        return self.cache_dir / symbol / "indicators.json"
+
+    def _load_indicator_state(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Load persisted indicator state for a symbol."""
+        state_file = self._indicator_state_file(symbol)
+
+        if not self.use_cache or not state_file.exists():
+            return None
+
+        try:
+            return orjson.loads(state_file.read_bytes())
+        except Exception as e:
+            logger.error(f"Indicator state load error: {e}")
+            return None
+
+    def _save_indicator_state(self, symbol: str, state: Dict[str, Any]) -> None:
+        """Persist indicator state for a symbol."""
+        if not self.use_cache:
+            return
+
+        state_file = self._indicator_state_file(symbol)
+
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            state_file.write_bytes(orjson.dumps(state))
+        except Exception as e:
+            logger.error(f"Indicator state save error: {e}")
+
     async def refresh_data(
         self,
         symbols: Optional[List[str]] = None,
@@ -493,23 +918,52 @@ class MarketDataProvider(IDataProvider):
         # This would come from database or configuration
         return await self._get_stock_universe()
 
-    def _load_from_cache(self, key: str, data_type: str) -> Optional[Any]:
-        """Load data from cache."""
-        cache_file = self.cache_dir / f"{data_type}_{key}.json"
+    def _get_from_mem_cache(self, key: tuple) -> Optional[List[Price]]:
+        """Get a price window from the in-memory LRU if still fresh."""
+        entry = self._mem_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, prices = entry
+        if time.monotonic() - stored_at > MEM_CACHE_TTL_SECONDS:
+            del self._mem_cache[key]
+            return None
+
+        self._mem_cache.move_to_end(key)
+        return list(prices)
+
+    def _put_in_mem_cache(self, key: tuple, prices: List[Price]) -> None:
+        """Store a price window in the in-memory LRU, evicting the oldest."""
+        self._mem_cache[key] = (time.monotonic(), list(prices))
+        self._mem_cache.move_to_end(key)
+        while len(self._mem_cache) > MEM_CACHE_SIZE:
+            self._mem_cache.popitem(last=False)
+
+    def _cache_file(self, symbol: str, key: str, data_type: str) -> Path:
+        """Path of a cache entry; every symbol gets its own subdirectory."""
+        return self.cache_dir / symbol / f"{data_type}_{key}.json"
+
+    def _load_from_cache(
+        self,
+        symbol: str,
+        key: str,
+        data_type: str,
+        max_age: timedelta = PRICE_CACHE_TTL,
+    ) -> Optional[Any]:
+        """Load data from cache if it is younger than max_age."""
+        cache_file = self._cache_file(symbol, key, data_type)
 
         if not cache_file.exists():
             return None
 
         try:
-            # Check if cache is fresh (less than 1 hour old for intraday)
-            if (datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)) > timedelta(hours=1):
+            if (datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)) > max_age:
                 return None
 
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            data = orjson.loads(cache_file.read_bytes())
 
             # Convert back to Price objects if needed
-            if data_type == "prices":
+            if data_type in ("prices", "quote"):
                 return [
                     Price(
                         symbol=p['symbol'],
@@ -530,28 +984,60 @@ class MarketDataProvider(IDataProvider):
             logger.error(f"Cache load error: {e}")
             return None
 
-    def _save_to_cache(self, key: str, data_type: str, data: Any) -> None:
+    def _save_to_cache(self, symbol: str, key: str, data_type: str, data: Any) -> None:
         """Save data to cache."""
-        cache_file = self.cache_dir / f"{data_type}_{key}.json"
+        cache_file = self._cache_file(symbol, key, data_type)
 
         try:
+            cache_file.parent.mkdir(exist_ok=True)
+
             # Convert Price objects to dictionaries if needed
-            if data_type == "prices" and data and isinstance(data[0], Price):
+            if data_type in ("prices", "quote") and data and isinstance(data[0], Price):
                 data = [p.to_dict() for p in data]
 
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            cache_file.write_bytes(orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+            ))
 
         except Exception as e:
             logger.error(f"Cache save error: {e}")
 
+    def _load_universe_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the symbol -> sector/market cap index used for pre-filtering."""
+        index_file = self.cache_dir / "universe_index.json"
+
+        if not self.use_cache or not index_file.exists():
+            return {}
+
+        try:
+            return orjson.loads(index_file.read_bytes())
+        except Exception as e:
+            logger.error(f"Universe index load error: {e}")
+            return {}
+
+    def _save_universe_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Persist the universe index."""
+        if not self.use_cache:
+            return
+
+        try:
+            (self.cache_dir / "universe_index.json").write_bytes(orjson.dumps(index))
+        except Exception as e:
+            logger.error(f"Universe index save error: {e}")
+
     def _clear_symbol_cache(self, symbol: str) -> None:
         """Clear all cached data for a symbol."""
-        for cache_file in self.cache_dir.glob(f"*{symbol}*"):
-            try:
-                cache_file.unlink()
-            except Exception as e:
-                logger.error(f"Failed to clear cache file {cache_file}: {e}")
+        for key in [k for k in self._mem_cache if k[0] == symbol]:
+            del self._mem_cache[key]
+
+        try:
+            shutil.rmtree(self.cache_dir / symbol)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to clear cache for {symbol}: {e}")
 
     def get_provider_info(self) -> Dict[str, Any]:
         """Get information about the data provider."""
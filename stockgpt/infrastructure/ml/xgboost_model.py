@@ -4,11 +4,16 @@ XGBoost Model Implementation
 Production implementation of the IModel interface using XGBoost.
 """
 
+import os
+import json
 import joblib
 import numpy as np
+import pandas as pd
 import xgboost as xgb
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 import logging
 from datetime import datetime
 
@@ -17,6 +22,46 @@ from stockgpt.core.interfaces.model import IModel
 
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are scored with all cores; smaller ones use one thread
+PARALLEL_BATCH_MIN_ROWS = 64
+
+# Batches larger than this are sharded across worker processes when workers > 1
+PROCESS_POOL_MIN_ROWS = 256
+
+# Per-process Booster used by scoring pool workers
+_worker_booster: Optional[xgb.Booster] = None
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Whether XGBoost was built with CUDA and a GPU is visible (needs cupy to probe)."""
+    if not xgb.build_info().get('USE_CUDA'):
+        return False
+    try:
+        import cupy
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def _training_device_params() -> Dict[str, str]:
+    """Training parameters for the GPU histogram method, or none on CPU-only hosts."""
+    if _cuda_available():
+        return {'device': 'cuda', 'tree_method': 'hist'}
+    return {}
+
+
+def _init_scoring_worker(raw_model: bytearray) -> None:
+    """Load the serialized Booster once per worker process, single-threaded."""
+    global _worker_booster
+    _worker_booster = xgb.Booster(model_file=raw_model)
+    _worker_booster.set_param({'nthread': 1})
+
+
+def _score_shard(X: np.ndarray) -> np.ndarray:
+    """Score one shard of the batch in a pool worker."""
+    return _worker_booster.inplace_predict(X)
+
 
 class XGBoostModel(IModel):
     """Production XGBoost model implementation for pattern classification."""
@@ -31,6 +76,21 @@ class XGBoostModel(IModel):
         5: -10.0,  # K5: Breakdown (Failed)
     }
 
+    # Class labels indexed by class
+    CLASS_LABELS = ('K0', 'K1', 'K2', 'K3', 'K4', 'K5')
+
+    # CLASS_VALUES as an array indexed by class, for vectorized EV
+    _CLASS_VALUES_ARR = np.array([value for _, value in sorted(CLASS_VALUES.items())])
+
+    # Signal strength thresholds: failure probability above which to avoid,
+    # then minimum EV per label in descending order
+    AVOID_FAILURE_PROB = 0.3
+    SIGNAL_THRESHOLDS = [
+        (5.0, "STRONG_SIGNAL"),
+        (3.0, "GOOD_SIGNAL"),
+        (1.0, "MODERATE_SIGNAL"),
+    ]
+
     # Expected feature names in order
     FEATURE_NAMES = [
         'rsi_14',
@@ -63,16 +123,173 @@ class XGBoostModel(IModel):
             model_path: Optional path to load model from
         """
         self.model: Optional[xgb.XGBClassifier] = None
+        self._booster: Optional[xgb.Booster] = None
+        self._batch_booster: Optional[xgb.Booster] = None
         self.feature_names: List[str] = self.FEATURE_NAMES.copy()
         self.model_version: str = "unknown"
         self.training_date: Optional[datetime] = None
         self.model_params: Dict[str, Any] = {}
 
+        # Predictor from a compiled shared library, see compile_for_inference()
+        self._compiled: Optional[Callable[[np.ndarray], np.ndarray]] = None
+
+        # Scoring process pool, created on first sharded batch
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers: int = 0
+
+        # Feature name -> column index
+        self._feature_index: Dict[str, int] = {}
+        self._feature_names_set: frozenset = frozenset()
+        self._index_features()
+
         if model_path and Path(model_path).exists():
             self.load(model_path)
         else:
             self._initialize_default_model()
 
+    def _index_features(self) -> None:
+        """Rebuild the feature index and name set for the current feature names."""
+        self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
+        self._feature_names_set = frozenset(self.feature_names)
+
+    def _refresh_booster(self) -> None:
+        """
+        Cache the underlying Booster for low-latency inference (None until fitted).
+
+        The Booster is pinned to a single thread: for a handful of rows
+        OpenMP start-up costs more than the tree traversal itself. Large
+        batches score with a separate multi-threaded copy, so no caller ever
+        changes the thread count of a Booster another caller is using.
+        """
+        try:
+            self._booster = self.model.get_booster() if self.model else None
+        except Exception:
+            self._booster = None
+
+        if self._booster is not None:
+            # Models trained on GPU still serve from CPU
+            if self.model.get_params().get('device') not in (None, 'cpu'):
+                self.model.set_params(device='cpu')
+            self._booster.set_param({'device': 'cpu', 'nthread': 1})
+            self._batch_booster = self._booster.copy()
+            self._batch_booster.set_param({'nthread': os.cpu_count() or 1})
+        else:
+            self._batch_booster = None
+
+        # Pool workers and compiled libraries hold a copy of the previous booster
+        self._shutdown_pool()
+        self._compiled = None
+
+    def _score(self, X: np.ndarray, booster: Optional[xgb.Booster] = None) -> np.ndarray:
+        """Class probabilities from the compiled predictor if loaded, else the (given) Booster."""
+        if self._compiled is not None:
+            return self._compiled(X)
+        return (booster or self._booster).inplace_predict(X)
+
+    def compile_for_inference(self, libpath: str, parallel_comp: int = 4) -> None:
+        """
+        Compile the trained forest to a native shared library and score with it.
+
+        Code-generated predictors beat the generic XGBoost traversal for small
+        fixed forests like this one. Requires the optional ``treelite`` and
+        ``tl2cgen`` packages and a C compiler.
+
+        Args:
+            libpath: Path of the shared library to write (e.g. ``model.so``)
+            parallel_comp: Number of source files to split compilation across
+
+        Raises:
+            RuntimeError: If the model is untrained or the packages are missing
+        """
+        if self._booster is None:
+            raise RuntimeError("No trained model to compile")
+
+        try:
+            import treelite
+            import tl2cgen
+        except ImportError:
+            raise RuntimeError(
+                "Compiled inference requires treelite and tl2cgen: "
+                "pip install treelite tl2cgen"
+            )
+
+        tl_model = treelite.frontend.from_xgboost(self._booster)
+        tl2cgen.export_lib(
+            tl_model,
+            toolchain='gcc',
+            libpath=libpath,
+            params={'parallel_comp': parallel_comp},
+        )
+        logger.info(f"Compiled model to {libpath}")
+        self.load_compiled(libpath)
+
+    def load_compiled(self, libpath: str) -> None:
+        """
+        Score with a shared library produced by compile_for_inference().
+
+        The library must have been compiled from the currently loaded model;
+        loading or training another model drops it.
+
+        Args:
+            libpath: Path to the compiled shared library
+
+        Raises:
+            FileNotFoundError: If the library doesn't exist
+            RuntimeError: If tl2cgen is not installed
+        """
+        if not Path(libpath).exists():
+            raise FileNotFoundError(f"Compiled model not found: {libpath}")
+
+        try:
+            import tl2cgen
+        except ImportError:
+            raise RuntimeError("Compiled inference requires tl2cgen: pip install tl2cgen")
+
+        predictor = tl2cgen.Predictor(libpath, nthread=1)
+
+        def predict(X: np.ndarray) -> np.ndarray:
+            return predictor.predict(tl2cgen.DMatrix(X)).reshape(len(X), -1)
+
+        self._compiled = predict
+        logger.info(f"Loaded compiled model from {libpath}")
+
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return a scoring pool of the given size, each worker loaded with the booster."""
+        if self._pool is None or self._pool_workers != workers:
+            self._shutdown_pool()
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_scoring_worker,
+                initargs=(self._booster.save_raw(),),
+            )
+            self._pool_workers = workers
+        return self._pool
+
+    def _shutdown_pool(self) -> None:
+        """Stop the scoring pool, if any."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._pool_workers = 0
+
+    def _score_sharded(self, X: np.ndarray, workers: int) -> np.ndarray:
+        """
+        Score a large batch across worker processes.
+
+        Many single-threaded workers scale better than one multi-threaded
+        Booster, since per-row inference is tiny next to threading overhead.
+
+        Args:
+            X: Feature matrix
+            workers: Number of worker processes
+
+        Returns:
+            Class probabilities for every row, in input order
+        """
+        pool = self._get_pool(workers)
+        shards = np.array_split(X, workers)
+        return np.concatenate(list(pool.map(_score_shard, shards)))
+
     def _initialize_default_model(self) -> None:
         """Initialize model with default parameters."""
         self.model = xgb.XGBClassifier(
@@ -84,8 +301,10 @@ class XGBoostModel(IModel):
             use_label_encoder=False,
             eval_metric='mlogloss',
             random_state=42,
+            **_training_device_params(),
         )
         self.model_version = "default"
+        self._booster = None
         logger.info("Initialized default XGBoost model")
 
     def predict(self, features: Dict[str, float]) -> Dict[str, Any]:
@@ -110,13 +329,20 @@ class XGBoostModel(IModel):
         if not is_valid:
             raise ValueError(f"Missing required features: {missing}")
 
-        # Prepare features in correct order
-        X = np.array([[features.get(name, 0.0) for name in self.feature_names]])
+        # Fill a fresh row in feature order; a shared buffer would let
+        # concurrent callers score each other's features
+        X = np.zeros((1, len(self.feature_names)), dtype=np.float32)
+        for name, value in features.items():
+            idx = self._feature_index.get(name)
+            if idx is not None:
+                X[0, idx] = value
 
-        # Get prediction probabilities
+        # Get prediction probabilities; the class is their argmax
         try:
-            proba = self.model.predict_proba(X)[0]
-            prediction = int(self.model.predict(X)[0])
+            if self._booster is None:
+                raise RuntimeError("model has not been trained")
+            proba = self._score(X)[0]
+            prediction = int(np.argmax(proba))
         except Exception as e:
             logger.error(f"Prediction failed: {e}")
             raise RuntimeError(f"Model prediction failed: {e}")
@@ -129,70 +355,225 @@ class XGBoostModel(IModel):
 
         return {
             'prediction': prediction,
-            'prediction_class': f'K{prediction}',
-            'probabilities': {
-                f'K{i}': float(proba[i]) for i in range(len(proba))
-            },
-            'confidence': float(np.max(proba)),
+            'prediction_class': self.CLASS_LABELS[prediction],
+            'probabilities': dict(zip(self.CLASS_LABELS, proba.tolist())),
+            'confidence': float(proba[prediction]),
             'expected_value': expected_value,
             'signal_strength': signal_strength,
-            'strategic_value': self.CLASS_VALUES.get(prediction, 0),
+            'strategic_value': float(self._CLASS_VALUES_ARR[prediction]),
             'failure_probability': float(proba[5]) if len(proba) > 5 else 0.0,
         }
 
-    def batch_predict(self, features_list: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+    def batch_predict(
+        self,
+        features_list: Union[Sequence[Dict[str, float]], np.ndarray],
+        workers: int = 1,
+    ) -> List[Dict[str, Any]]:
         """
         Batch prediction for efficiency.
 
+        Row-per-dict view of batch_predict_columnar(); prefer that for
+        large batches feeding columnar consumers.
+
         Args:
-            features_list: List of feature dictionaries
+            features_list: Feature dictionaries, or a matrix of shape
+                (rows, features) in get_feature_names() order
+            workers: Worker processes for batches over PROCESS_POOL_MIN_ROWS
+                rows (1 scores in-process)
 
         Returns:
             List of prediction dictionaries
         """
+        scored = self.batch_predict_columnar(features_list, workers=workers)
+
+        # Build result list from plain Python values, converted once per column
+        labels = self.CLASS_LABELS
+        columns = zip(
+            scored['prediction'].tolist(),
+            scored['probabilities'].tolist(),
+            scored['confidence'].tolist(),
+            scored['expected_value'].tolist(),
+            scored['signal_strength'].tolist(),
+            scored['strategic_value'].tolist(),
+            scored['failure_probability'].tolist(),
+        )
+
+        results = []
+        for pred, proba, confidence, ev, signal, strategic, failure in columns:
+            results.append({
+                'prediction': pred,
+                'prediction_class': labels[pred],
+                'probabilities': dict(zip(labels, proba)),
+                'confidence': confidence,
+                'expected_value': ev,
+                'signal_strength': signal,
+                'strategic_value': strategic,
+                'failure_probability': failure,
+            })
+
+        return results
+
+    def batch_predict_columnar(
+        self,
+        features_list: Union[Sequence[Dict[str, float]], np.ndarray],
+        workers: int = 1,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Batch prediction returning one array per result field.
+
+        Args:
+            features_list: Feature dictionaries, or a matrix of shape
+                (rows, features) in get_feature_names() order
+            workers: Worker processes for batches over PROCESS_POOL_MIN_ROWS
+                rows (1 scores in-process)
+
+        Returns:
+            Dictionary of per-row arrays, as returned by predict_array()
+
+        Raises:
+            RuntimeError: If model not loaded or scoring fails
+            ValueError: If any row is missing features
+        """
         if not self.model:
             raise RuntimeError("Model not loaded")
 
-        # Validate all features first
+        if isinstance(features_list, np.ndarray):
+            return self.predict_array(features_list, workers=workers)
+        return self.predict_array(self._features_matrix(features_list), workers=workers)
+
+    def predict_dataframe(self, df: pd.DataFrame, workers: int = 1) -> Dict[str, np.ndarray]:
+        """
+        Score every row of a DataFrame holding one column per feature.
+
+        Extra columns are ignored.
+
+        Args:
+            df: DataFrame containing all feature columns
+            workers: Worker processes for batches over PROCESS_POOL_MIN_ROWS
+                rows (1 scores in-process)
+
+        Returns:
+            Dictionary of per-row arrays, as returned by predict_array()
+
+        Raises:
+            RuntimeError: If model not loaded or scoring fails
+            ValueError: If feature columns are missing
+        """
+        missing = self._feature_names_set.difference(df.columns)
+        if missing:
+            missing = [name for name in self.feature_names if name in missing]
+            raise ValueError(f"Missing required features: {missing}")
+
+        X = df[self.feature_names].to_numpy(dtype=np.float32)
+        return self.predict_array(X, workers=workers)
+
+    def _features_matrix(self, features_list: Sequence[Dict[str, float]]) -> np.ndarray:
+        """
+        Gather feature dictionaries into a float32 matrix in feature order.
+
+        Rows are validated as they are filled: a row is complete when every
+        feature name was matched.
+
+        Raises:
+            ValueError: If any row is missing features
+        """
+        num_features = len(self.feature_names)
+        X = np.zeros((len(features_list), num_features), dtype=np.float32)
+        index = self._feature_index
         for i, features in enumerate(features_list):
-            is_valid, missing = self.validate_features(features)
-            if not is_valid:
+            row = X[i]
+            matched = 0
+            for name, value in features.items():
+                j = index.get(name)
+                if j is not None:
+                    row[j] = value
+                    matched += 1
+            if matched < num_features:
+                _, missing = self.validate_features(features)
                 raise ValueError(f"Features at index {i} missing: {missing}")
 
-        # Prepare feature matrix
-        X = np.array([
-            [features.get(name, 0.0) for name in self.feature_names]
-            for features in features_list
-        ])
+        return X
+
+    def predict_array(self, X: np.ndarray, workers: int = 1) -> Dict[str, np.ndarray]:
+        """
+        Score a dense feature matrix, skipping feature dictionaries entirely.
+
+        Intended for callers that already hold features as a matrix, such as
+        training pipelines and backtests.
+
+        Args:
+            X: Matrix of shape (rows, features) in get_feature_names() order
+            workers: Worker processes for batches over PROCESS_POOL_MIN_ROWS
+                rows (1 scores in-process)
+
+        Returns:
+            Dictionary of per-row arrays: prediction, probabilities,
+            confidence, expected_value, signal_strength, strategic_value,
+            failure_probability
+
+        Raises:
+            RuntimeError: If model not loaded or scoring fails
+            ValueError: If X does not have one column per feature
+        """
+        if not self.model:
+            raise RuntimeError("Model not loaded")
 
-        # Get batch predictions
+        # XGBoost predicts from C-ordered float32; converting once here (e.g. for
+        # column-major DataFrame blocks) avoids a copy inside the C API
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_names):
+            raise ValueError(
+                f"Expected a matrix with {len(self.feature_names)} feature columns, "
+                f"got shape {X.shape}"
+            )
+
+        # Get batch predictions (multi-threaded only when the batch is large)
+        booster = self._batch_booster if len(X) >= PARALLEL_BATCH_MIN_ROWS else None
         try:
-            probas = self.model.predict_proba(X)
-            predictions = self.model.predict(X)
+            if self._booster is None:
+                raise RuntimeError("model has not been trained")
+            if workers > 1 and len(X) > PROCESS_POOL_MIN_ROWS:
+                probas = self._score_sharded(X, workers)
+            else:
+                probas = self._score(X, booster)
         except Exception as e:
             logger.error(f"Batch prediction failed: {e}")
             raise RuntimeError(f"Batch prediction failed: {e}")
 
-        # Build result list
-        results = []
-        for i, (proba, pred) in enumerate(zip(probas, predictions)):
-            expected_value = self._calculate_expected_value(proba)
-            signal_strength = self._determine_signal_strength(proba, expected_value)
+        # The predicted class is the argmax of the probabilities
+        predictions = probas.argmax(axis=1).astype(np.int8)
+        evs, confidences, failure_probs, signals = self._postprocess(probas)
 
-            results.append({
-                'prediction': int(pred),
-                'prediction_class': f'K{int(pred)}',
-                'probabilities': {
-                    f'K{j}': float(proba[j]) for j in range(len(proba))
-                },
-                'confidence': float(np.max(proba)),
-                'expected_value': expected_value,
-                'signal_strength': signal_strength,
-                'strategic_value': self.CLASS_VALUES.get(int(pred), 0),
-                'failure_probability': float(proba[5]) if len(proba) > 5 else 0.0,
-            })
+        return {
+            'prediction': predictions,
+            'probabilities': probas,
+            'confidence': confidences,
+            'expected_value': evs,
+            'signal_strength': signals,
+            'strategic_value': self._CLASS_VALUES_ARR[predictions],
+            'failure_probability': failure_probs,
+        }
 
-        return results
+    def _postprocess(
+        self, probas: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Derive the per-row scalars from class probabilities in whole-batch passes.
+
+        Args:
+            probas: Class probabilities of shape (rows, classes)
+
+        Returns:
+            Tuple of (expected_values, confidences, failure_probs, signal_strengths)
+        """
+        # EV is needed on AVOID rows too: SignalService turns strongly negative
+        # EVs into sell signals, and one matrix-vector product costs less than
+        # masking rows out of it
+        evs = probas @ self._CLASS_VALUES_ARR[:probas.shape[1]]
+        confidences = probas.max(axis=1)
+        failure_probs = probas[:, 5] if probas.shape[1] > 5 else np.zeros(len(probas))
+        signals = self._signal_strengths(failure_probs, evs)
+        return evs, confidences, failure_probs, signals
 
     def _calculate_expected_value(self, probabilities: np.ndarray) -> float:
         """
@@ -204,8 +585,7 @@ class XGBoostModel(IModel):
         Returns:
             Expected value
         """
-        values = [self.CLASS_VALUES.get(i, 0) for i in range(len(probabilities))]
-        return float(np.dot(probabilities, values))
+        return float(probabilities @ self._CLASS_VALUES_ARR[:len(probabilities)])
 
     def _determine_signal_strength(self, probabilities: np.ndarray, ev: float) -> str:
         """
@@ -220,16 +600,31 @@ class XGBoostModel(IModel):
         """
         failure_prob = probabilities[5] if len(probabilities) > 5 else 0.0
 
-        if failure_prob > 0.3:
+        if failure_prob > self.AVOID_FAILURE_PROB:
             return "AVOID"
-        elif ev >= 5.0:
-            return "STRONG_SIGNAL"
-        elif ev >= 3.0:
-            return "GOOD_SIGNAL"
-        elif ev >= 1.0:
-            return "MODERATE_SIGNAL"
-        else:
-            return "WEAK_SIGNAL"
+        for threshold, label in self.SIGNAL_THRESHOLDS:
+            if ev >= threshold:
+                return label
+        return "WEAK_SIGNAL"
+
+    def _signal_strengths(self, failure_probs: np.ndarray, evs: np.ndarray) -> np.ndarray:
+        """
+        Vectorized signal strength for a batch.
+
+        Args:
+            failure_probs: Per-row K5 probabilities
+            evs: Per-row expected values
+
+        Returns:
+            Array of signal strength labels
+        """
+        conditions = [failure_probs > self.AVOID_FAILURE_PROB]
+        labels = ["AVOID"]
+        for threshold, label in self.SIGNAL_THRESHOLDS:
+            conditions.append(evs >= threshold)
+            labels.append(label)
+
+        return np.select(conditions, labels, default="WEAK_SIGNAL")
 
     def get_feature_importance(self) -> Dict[str, float]:
         """
@@ -267,13 +662,20 @@ class XGBoostModel(IModel):
         Returns:
             Tuple of (is_valid, list_of_missing_features)
         """
-        missing = [name for name in self.feature_names if name not in features]
-        return len(missing) == 0, missing
+        missing = self._feature_names_set.difference(features)
+        if not missing:
+            return True, []
+
+        # Report missing names in feature order
+        return False, [name for name in self.feature_names if name in missing]
 
     def load(self, path: str) -> None:
         """
         Load model from disk.
 
+        Reads the native format written by save(), and falls back to
+        joblib for models pickled by earlier versions.
+
         Args:
             path: Path to model file
 
@@ -286,17 +688,16 @@ class XGBoostModel(IModel):
             raise FileNotFoundError(f"Model file not found: {path}")
 
         try:
-            model_data = joblib.load(path)
+            with open(model_path, 'rb') as f:
+                is_native = f.read(1) == b'{'
 
-            # Validate loaded data
-            if not isinstance(model_data, dict):
-                raise ValueError("Invalid model file format")
+            if is_native:
+                self._load_native(model_path)
+            else:
+                self._load_joblib(model_path)
 
-            self.model = model_data.get('model')
-            self.feature_names = model_data.get('feature_names', self.FEATURE_NAMES)
-            self.model_version = model_data.get('version', 'unknown')
-            self.training_date = model_data.get('training_date')
-            self.model_params = model_data.get('params', {})
+            self._index_features()
+            self._refresh_booster()
 
             logger.info(f"Loaded model version {self.model_version} from {path}")
 
@@ -304,10 +705,51 @@ class XGBoostModel(IModel):
             logger.error(f"Failed to load model: {e}")
             raise RuntimeError(f"Model loading failed: {e}")
 
+    def set_model(self, model: xgb.XGBClassifier) -> None:
+        """
+        Serve predictions from an already fitted classifier.
+
+        Args:
+            model: Fitted XGBClassifier trained on this model's feature names
+        """
+        self.model = model
+        self._refresh_booster()
+
+    def _load_native(self, model_path: Path) -> None:
+        """Load JSON metadata from model_path and the booster from its .ubj file."""
+        with open(model_path, 'r') as f:
+            metadata = json.load(f)
+
+        self.model = xgb.XGBClassifier()
+        self.model.load_model(f"{model_path}.ubj")
+        self.feature_names = metadata.get('feature_names', self.FEATURE_NAMES)
+        self.model_version = metadata.get('version', 'unknown')
+        training_date = metadata.get('training_date')
+        self.training_date = datetime.fromisoformat(training_date) if training_date else None
+        self.model_params = metadata.get('params', {})
+
+    def _load_joblib(self, model_path: Path) -> None:
+        """Load a legacy joblib-pickled model file."""
+        model_data = joblib.load(model_path)
+
+        # Validate loaded data
+        if not isinstance(model_data, dict):
+            raise ValueError("Invalid model file format")
+
+        self.model = model_data.get('model')
+        self.feature_names = model_data.get('feature_names', self.FEATURE_NAMES)
+        self.model_version = model_data.get('version', 'unknown')
+        self.training_date = model_data.get('training_date')
+        self.model_params = model_data.get('params', {})
+
     def save(self, path: str) -> None:
         """
         Save model to disk.
 
+        The booster is written in XGBoost's native UBJSON format to
+        ``{path}.ubj`` and the metadata as JSON to ``path`` itself, so
+        existence checks on ``path`` keep working.
+
         Args:
             path: Path to save model file
 
@@ -318,16 +760,20 @@ class XGBoostModel(IModel):
             raise RuntimeError("No model to save")
 
         try:
-            model_data = {
-                'model': self.model,
+            self.model.get_booster().save_model(f"{path}.ubj")
+
+            training_date = self.training_date or datetime.now()
+            metadata = {
+                'format': 'xgboost-ubj',
                 'feature_names': self.feature_names,
                 'version': self.model_version,
-                'training_date': self.training_date or datetime.now(),
+                'training_date': training_date.isoformat(),
                 'params': self.model_params,
                 'class_values': self.CLASS_VALUES,
             }
 
-            joblib.dump(model_data, path)
+            with open(path, 'w') as f:
+                json.dump(metadata, f, indent=2, default=str)
             logger.info(f"Saved model to {path}")
 
         except Exception as e:
@@ -347,7 +793,7 @@ class XGBoostModel(IModel):
             'training_date': self.training_date.isoformat() if self.training_date else None,
             'num_features': len(self.feature_names),
             'num_classes': 6,
-            'class_labels': ['K0', 'K1', 'K2', 'K3', 'K4', 'K5'],
+            'class_labels': list(self.CLASS_LABELS),
             'class_values': self.CLASS_VALUES,
             'parameters': self.model_params,
             'is_loaded': self.model is not None,
@@ -377,13 +823,18 @@ class XGBoostModel(IModel):
         # Set parameters
         if params:
             self.model_params = params
-            self.model = xgb.XGBClassifier(**params)
+            self.model = xgb.XGBClassifier(**{**_training_device_params(), **params})
         elif not self.model:
             self._initialize_default_model()
+        else:
+            # A previous fit moved the model to CPU for serving
+            self.model.set_params(**_training_device_params())
 
-        # Prepare evaluation set
+        # Prepare evaluation set (features as float32, XGBoost's native precision)
+        X_train = np.asarray(X_train, dtype=np.float32)
         eval_set = [(X_train, y_train)]
         if X_val is not None and y_val is not None:
+            X_val = np.asarray(X_val, dtype=np.float32)
             eval_set.append((X_val, y_val))
 
         # Train model
@@ -393,6 +844,8 @@ class XGBoostModel(IModel):
             verbose=False,
         )
 
+        self._refresh_booster()
+
         # Update metadata
         self.training_date = datetime.now()
         self.model_version = f"trained_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -6,23 +6,49 @@ showing the full pattern lifecycle with context before and after.
 """
 
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Tuple, Any
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Tuple, Any, AsyncIterator, Iterator, Union
+from dataclasses import dataclass, field
+from collections import OrderedDict
 import asyncio
+import copy
 import logging
+import time
 
 from stockgpt.core.entities.stock import Price
+from stockgpt.infrastructure.data import _indicators as ind
 
 logger = logging.getLogger(__name__)
 
+# Analyzed patterns per (symbol, lookback_days), reused while fresh
+PATTERN_CACHE_SIZE = 128
+PATTERN_CACHE_TTL_SECONDS = 300
 
-@dataclass
+_pattern_cache: OrderedDict = OrderedDict()
+
+_NAT = np.datetime64('NaT', 'ns')
+
+
+def _to_datetime64(value: Optional[datetime]) -> np.datetime64:
+    """Convert a date to datetime64[ns] (NaT for None)."""
+    return _NAT if value is None else np.datetime64(value, 'ns')
+
+
+def _dark_template(**layout) -> go.layout.Template:
+    """plotly_dark extended with layout defaults shared by a kind of chart."""
+    template = go.layout.Template(pio.templates['plotly_dark'])
+    template.layout.update(xaxis=dict(rangeslider=dict(visible=False)), **layout)
+    return template
+
+
+@dataclass(frozen=True, slots=True)
 class PatternPeriod:
-    """Represents a detected pattern period with lifecycle stages."""
+    """Represents a detected pattern period with lifecycle stages (immutable, hashable)."""
     symbol: str
     pattern_id: str
     qualification_start: datetime
@@ -36,6 +62,32 @@ class PatternPeriod:
     outcome: Optional[str]  # 'success', 'failed', 'ongoing'
     gain_percentage: Optional[float]
 
+    # Lifecycle dates as datetime64[ns], converted once for index lookups
+    _qual_ts: np.datetime64 = field(init=False, repr=False, compare=False)
+    _active_ts: np.datetime64 = field(init=False, repr=False, compare=False)
+    _breakout_ts: np.datetime64 = field(init=False, repr=False, compare=False)
+    _completion_ts: np.datetime64 = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen: derived fields are set through object.__setattr__
+        object.__setattr__(self, '_qual_ts', _to_datetime64(self.qualification_start))
+        object.__setattr__(self, '_active_ts', _to_datetime64(self.active_start))
+        object.__setattr__(self, '_breakout_ts', _to_datetime64(self.breakout_date))
+        object.__setattr__(self, '_completion_ts', _to_datetime64(self.completion_date))
+
+
+@dataclass
+class PatternRefs:
+    """A pattern's lifecycle dates looked up in one price window."""
+    qual_exists: bool
+    active_exists: bool
+    breakout_exists: bool
+    qual_low: float
+    active_low: float
+    breakout_high: float
+    active_end: Any
+    post_end: Any
+
 
 class PatternChart:
     """
@@ -58,17 +110,63 @@ class PatternChart:
         'ongoing': 'rgba(128, 128, 128, 0.08)'         # Very light gray
     }
 
+    # Overview candles beyond this count are aggregated to weekly/monthly bars
+    OVERVIEW_MAX_BARS = 1500
+
+    # Overviews of more daily bars than this use per-point instead of
+    # unified hover, which the browser rebuilds on every mouse move
+    OVERVIEW_UNIFIED_HOVER_MAX_BARS = 5000
+
+    # RSI lookback; windows shorter than twice this get no indicator row
+    RSI_PERIOD = 14
+
+    # Static styling of focused and overview charts, applied as templates so
+    # each chart only sets its own title (and decorations) per build
+    _DARK_TEMPLATE = _dark_template(
+        height=800,
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    _OVERVIEW_TEMPLATE = _dark_template(height=700, hovermode='x unified')
+
+    # Focused-view subplot grids as figure dicts, built once per row count
+    _FOCUSED_SCAFFOLDS: Dict[int, Dict[str, Any]] = {}
+
     def __init__(self):
         self.current_pattern_index = 0
         self.patterns: List[PatternPeriod] = []
         self.fig = None
 
+        # Price data and view options of the current focused chart, and the
+        # per-pattern trace data/decorations derived from them
+        self._df: Optional[pd.DataFrame] = None
+        self._view_options: Tuple[int, int, bool] = (40, 100, True)
+        self._trace_cache: Dict[int, Dict[str, Any]] = {}
+        self._layout_cache: Dict[int, Dict[str, Any]] = {}
+
+        # Price window currently shown in the focused chart, and the span of
+        # every pattern's window once navigation buttons plot it
+        self._window: Optional[pd.DataFrame] = None
+        self._nav_span: Optional[pd.DataFrame] = None
+
+        # Price list the current DataFrame was built from, and RSI series
+        # keyed by (first bar, last bar, bars, period)
+        self._prices_ref: Optional[List[Price]] = None
+        self._rsi_cache: Dict[Tuple, pd.Series] = {}
+
     def create_pattern_focused_chart(self,
                                     prices: List[Price],
                                     pattern: PatternPeriod,
                                     context_before: int = 40,
                                     context_after: int = 100,
-                                    show_indicators: bool = True) -> go.Figure:
+                                    show_indicators: bool = True,
+                                    defer_indicators: bool = False) -> go.Figure:
         """
         Create a chart focused on a specific pattern with temporal context.
 
@@ -77,7 +175,10 @@ class PatternChart:
             pattern: The pattern to focus on
             context_before: Days before pattern to show (default 40)
             context_after: Days after breakout to show (default 100)
-            show_indicators: Whether to show technical indicators
+            show_indicators: Whether to show technical indicators; the
+                indicator row is left out when the window is too short for RSI
+            defer_indicators: Lay out the indicator row but leave its traces
+                to a later add_indicators() call, so the chart renders first
 
         Returns:
             Plotly Figure with pattern-focused view
@@ -85,109 +186,281 @@ class PatternChart:
         if not prices:
             raise ValueError("No price data provided")
 
-        # Convert prices to DataFrame
-        df = self._prices_to_dataframe(prices)
+        # Convert prices to DataFrame (reused when re-viewing the same prices)
+        df = self._get_dataframe(prices)
+        self._trace_cache = {}
+        self._layout_cache = {}
+        self._nav_span = None
 
-        # Calculate the viewing window
-        window_start, window_end, data_warning = self._calculate_window(
-            df, pattern, context_before, context_after
-        )
-
-        # Filter data to window
-        df_window = df[(df.index >= window_start) & (df.index <= window_end)]
+        df_window, data_warning = self._pattern_window(df, pattern, context_before, context_after)
 
-        if len(df_window) == 0:
-            raise ValueError(f"No data available for pattern period {window_start} to {window_end}")
+        # RSI is all NaN on short windows; skip the indicator row entirely
+        show_indicators = show_indicators and len(df_window) >= 2 * self.RSI_PERIOD
+        self._view_options = (context_before, context_after, show_indicators)
+        self._window = df_window
 
         # Create subplots
-        fig = make_subplots(
-            rows=3, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.03,
-            row_heights=[0.6, 0.2, 0.2],
-            subplot_titles=(
-                f'{pattern.symbol} - Pattern Analysis (ID: {pattern.pattern_id})',
-                'Volume',
-                'Technical Indicators'
-            )
-        )
+        fig = self._make_focused_subplots(pattern, show_indicators)
 
-        # Add candlestick chart
-        fig.add_trace(
+        # Candlestick, volume bars and (if requested) technical indicators,
+        # added in a single call
+        colors = self._volume_colors(df_window)
+        traces = [
             go.Candlestick(
                 x=df_window.index,
-                open=df_window['Open'],
-                high=df_window['High'],
-                low=df_window['Low'],
-                close=df_window['Close'],
+                open=df_window['Open'].to_numpy(),
+                high=df_window['High'].to_numpy(),
+                low=df_window['Low'].to_numpy(),
+                close=df_window['Close'].to_numpy(),
                 name='Price',
                 increasing_line_color='#26a69a',
                 decreasing_line_color='#ef5350'
             ),
-            row=1, col=1
-        )
-
-        # Add pattern period highlighting
-        self._add_pattern_highlighting(fig, pattern, df_window)
-
-        # Add boundary lines
-        self._add_boundary_lines(fig, pattern, df_window)
-
-        # Add volume bars
-        colors = ['#26a69a' if close >= open_ else '#ef5350'
-                  for close, open_ in zip(df_window['Close'], df_window['Open'])]
-
-        fig.add_trace(
             go.Bar(
                 x=df_window.index,
-                y=df_window['Volume'],
+                y=df_window['Volume'].to_numpy(),
                 name='Volume',
                 marker_color=colors,
                 opacity=0.5
             ),
-            row=2, col=1
-        )
+        ]
+        if show_indicators and not defer_indicators:
+            traces.append(self._rsi_trace(df_window))
 
-        # Add technical indicators if requested
-        if show_indicators:
-            self._add_technical_indicators(fig, df_window)
+        rows = [1, 2, 3][:len(traces)]
+        fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
 
-        # Add annotations for key events
-        self._add_pattern_annotations(fig, pattern, df_window)
+        # Pattern shading, boundary lines, RSI levels and event markers, set
+        # in one layout update after the subplot titles
+        shapes, annotations = self._pattern_decorations(pattern, df_window, show_indicators)
 
         # Update layout
-        title = f'{pattern.symbol} Pattern Analysis - {pattern.pattern_type.title()}'
-        if data_warning:
-            title += f' ({data_warning})'
-
         fig.update_layout(
-            title=title,
-            xaxis_rangeslider_visible=False,
-            height=800,
-            template='plotly_dark',
-            hovermode='x unified',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+            shapes=shapes,
+            annotations=list(fig.layout.annotations) + annotations,
+            title=self._pattern_title(pattern, data_warning),
+            template=self._DARK_TEMPLATE
         )
 
         # Update axes
-        fig.update_xaxes(title_text="Date", row=3, col=1)
+        fig.update_xaxes(title_text="Date", row=3 if show_indicators else 2, col=1)
         fig.update_yaxes(title_text="Price ($)", row=1, col=1)
         fig.update_yaxes(title_text="Volume", row=2, col=1)
-        fig.update_yaxes(title_text="RSI", row=3, col=1)
+        if show_indicators:
+            fig.update_yaxes(title_text="RSI", row=3, col=1)
 
         self.fig = fig
         return fig
 
+    def add_indicators(self) -> go.Figure:
+        """
+        Add the indicator traces to a focused chart created with
+        defer_indicators=True.
+
+        Returns:
+            The updated figure (unchanged if it has no indicator row or
+            already shows its indicators)
+        """
+        if self.fig is None or self._window is None:
+            raise ValueError("No focused chart to update")
+
+        if not self._view_options[2] or len(self.fig.data) > 2:
+            return self.fig
+
+        # With navigation buttons the RSI covers the whole plotted span
+        self._add_technical_indicators(
+            self.fig, self._nav_span if self._nav_span is not None else self._window
+        )
+
+        return self.fig
+
+    def _pattern_window(self,
+                        df: pd.DataFrame,
+                        pattern: PatternPeriod,
+                        context_before: int,
+                        context_after: int) -> Tuple[pd.DataFrame, Optional[str]]:
+        """Slice df to a pattern's viewing window, with any data warning."""
+        window_start, window_end, data_warning = self._calculate_window(
+            df, pattern, context_before, context_after
+        )
+
+        # Filter data to window
+        df_window = df[(df.index >= window_start) & (df.index <= window_end)]
+
+        if len(df_window) == 0:
+            raise ValueError(f"No data available for pattern period {window_start} to {window_end}")
+
+        return df_window, data_warning
+
+    def _make_focused_subplots(self, pattern: PatternPeriod, show_indicators: bool) -> go.Figure:
+        """
+        Create the price/volume(/indicator) subplot grid for a pattern.
+
+        The grid is laid out by make_subplots once per row count and then
+        copied, so repeated charts skip re-validating the whole layout.
+        """
+        rows = 3 if show_indicators else 2
+        titles = self._subplot_titles(pattern)[:rows]
+
+        scaffold = self._FOCUSED_SCAFFOLDS.get(rows)
+        if scaffold is None:
+            grid = make_subplots(
+                rows=rows, cols=1,
+                shared_xaxes=True,
+                vertical_spacing=0.03,
+                row_heights=[0.6, 0.2, 0.2] if show_indicators else [0.75, 0.25],
+                subplot_titles=titles
+            )
+            scaffold = grid.to_dict()
+            scaffold['_grid_str'] = grid._grid_str
+            scaffold['_grid_ref'] = grid._grid_ref
+            self._FOCUSED_SCAFFOLDS[rows] = scaffold
+
+        spec = copy.deepcopy(scaffold)
+        spec['layout']['annotations'][0]['text'] = titles[0]
+
+        # The scaffold came out of make_subplots already valid; validate
+        # again only for changes made to the figure from here on
+        fig = go.Figure(spec, _validate=False)
+        fig._validate = True
+        fig.layout._validate = True
+        return fig
+
+    def _subplot_titles(self, pattern: PatternPeriod) -> Tuple[str, str, str]:
+        """Titles of the price, volume and indicator rows of a focused view."""
+        return (
+            f'{pattern.symbol} - Pattern Analysis (ID: {pattern.pattern_id})',
+            'Volume',
+            'Technical Indicators'
+        )
+
+    def _pattern_title(self, pattern: PatternPeriod, data_warning: Optional[str]) -> str:
+        """Chart title for a focused pattern view."""
+        title = f'{pattern.symbol} Pattern Analysis - {pattern.pattern_type.title()}'
+        if data_warning:
+            title += f' ({data_warning})'
+        return title
+
+    def _pattern_layout(self, pattern_index: int) -> Dict[str, Any]:
+        """
+        Window, shapes, annotations, title and axis ranges for one of
+        self.patterns in the current focused chart, computed once per pattern.
+        """
+        layout = self._layout_cache.get(pattern_index)
+        if layout is not None:
+            return layout
+
+        pattern = self.patterns[pattern_index]
+        context_before, context_after, show_indicators = self._view_options
+        df_window, data_warning = self._pattern_window(
+            self._df, pattern, context_before, context_after
+        )
+
+        shapes, annotations = self._pattern_decorations(pattern, df_window, show_indicators)
+
+        # Subplot titles come first; only the price title names the pattern
+        rows = 3 if show_indicators else 2
+        titles = [ann.to_plotly_json() for ann in self.fig.layout.annotations[:rows]]
+        titles[0]['text'] = self._subplot_titles(pattern)[0]
+
+        # Axis ranges framing the window, for views that plot a longer span
+        low, high = float(df_window['Low'].min()), float(df_window['High'].max())
+        pad = (high - low) * 0.05 or abs(high) * 0.01 or 1.0
+        x_range = [df_window.index[0], df_window.index[-1]]
+        ranges = {f'xaxis{row if row > 1 else ""}.range': x_range for row in range(1, rows + 1)}
+        ranges['yaxis.range'] = [low - pad, high + pad]
+        ranges['yaxis2.range'] = [0, float(df_window['Volume'].max()) * 1.1 or 1.0]
+
+        layout = {
+            'window': df_window,
+            'shapes': shapes,
+            'annotations': titles + annotations,
+            'title': self._pattern_title(pattern, data_warning),
+            'ranges': ranges,
+        }
+        self._layout_cache[pattern_index] = layout
+        return layout
+
+    def _pattern_view(self, pattern_index: int) -> Dict[str, Any]:
+        """
+        Trace data of one of self.patterns in the current focused chart,
+        along with its _pattern_layout, computed once per pattern.
+        """
+        view = self._trace_cache.get(pattern_index)
+        if view is not None:
+            return view
+
+        _, _, show_indicators = self._view_options
+        layout = self._pattern_layout(pattern_index)
+        df_window = layout['window']
+
+        view = {
+            **layout,
+            'x': df_window.index,
+            'open': df_window['Open'].to_numpy(),
+            'high': df_window['High'].to_numpy(),
+            'low': df_window['Low'].to_numpy(),
+            'close': df_window['Close'].to_numpy(),
+            'volume': df_window['Volume'].to_numpy(),
+            'colors': self._volume_colors(df_window),
+            'rsi': self._calculate_rsi(df_window['Close'], self.RSI_PERIOD).to_numpy() if show_indicators else None,
+        }
+        self._trace_cache[pattern_index] = view
+        return view
+
+    def update_pattern(self, pattern_index: int) -> go.Figure:
+        """
+        Switch the current focused chart to another pattern in place.
+
+        Only trace data, shapes, annotations and the title are replaced, so
+        the figure is diffed rather than rebuilt when re-rendered.
+
+        Args:
+            pattern_index: Index into the patterns of create_multi_pattern_chart
+
+        Returns:
+            The updated figure
+        """
+        if self.fig is None or self._df is None:
+            raise ValueError("No focused chart to update")
+
+        if self._nav_span is not None:
+            # Every pattern is already plotted; frame this one
+            layout = self._pattern_layout(pattern_index)
+            with self.fig.batch_update():
+                self.fig.update_layout(self._navigation_layout(layout))
+            self._window = layout['window']
+            self.current_pattern_index = pattern_index
+            return self.fig
+
+        view = self._pattern_view(pattern_index)
+
+        with self.fig.batch_update():
+            candle, volume = self.fig.data[0], self.fig.data[1]
+            candle.x = view['x']
+            candle.open = view['open']
+            candle.high = view['high']
+            candle.low = view['low']
+            candle.close = view['close']
+            volume.x = view['x']
+            volume.y = view['volume']
+            volume.marker.color = view['colors']
+            if view['rsi'] is not None and len(self.fig.data) > 2:
+                self.fig.data[2].x = view['x']
+                self.fig.data[2].y = view['rsi']
+            self.fig.layout.shapes = view['shapes']
+            self.fig.layout.annotations = view['annotations']
+            self.fig.layout.title.text = view['title']
+
+        self._window = view['window']
+        self.current_pattern_index = pattern_index
+        return self.fig
+
     def create_multi_pattern_chart(self,
                                   prices: List[Price],
                                   patterns: List[PatternPeriod],
-                                  show_all: bool = False) -> go.Figure:
+                                  show_all: bool = False,
+                                  resample: bool = False) -> go.Figure:
         """
         Create a chart showing multiple patterns with navigation.
 
@@ -195,6 +468,8 @@ class PatternChart:
             prices: Full price history
             patterns: List of patterns to display
             show_all: If True, show all patterns on one chart
+            resample: For long overviews, aggregate per viewport with
+                plotly-resampler when it is installed
 
         Returns:
             Plotly Figure with pattern visualization
@@ -203,13 +478,14 @@ class PatternChart:
             raise ValueError("No patterns provided")
 
         self.patterns = patterns
-        df = self._prices_to_dataframe(prices)
+        df = self._get_dataframe(prices)
 
         if show_all:
             # Show all patterns on single chart
-            fig = self._create_overview_chart(df, patterns)
+            fig = self._create_overview_chart(df, patterns, resample=resample)
         else:
             # Show first pattern with navigation buttons
+            self.current_pattern_index = 0
             fig = self.create_pattern_focused_chart(
                 prices, patterns[0]
             )
@@ -219,8 +495,20 @@ class PatternChart:
 
     def _create_overview_chart(self,
                                df: pd.DataFrame,
-                               patterns: List[PatternPeriod]) -> go.Figure:
-        """Create overview chart showing all patterns with subtle highlighting."""
+                               patterns: List[PatternPeriod],
+                               resample: bool = False) -> go.Figure:
+        """
+        Create overview chart showing all patterns with subtle highlighting.
+
+        Long histories are drawn from weekly/monthly candles, or - with
+        resample and plotly-resampler installed - as a close line and volume
+        that plotly-resampler aggregates to the visible range.
+        """
+        figure_resampler = None
+        if resample and len(df) > self.OVERVIEW_MAX_BARS:
+            figure_resampler = self._figure_resampler()
+
+        huge = len(df) > self.OVERVIEW_UNIFIED_HOVER_MAX_BARS
 
         fig = make_subplots(
             rows=2, cols=1,
@@ -233,46 +521,60 @@ class PatternChart:
             )
         )
 
-        # Add candlestick
-        fig.add_trace(
-            go.Candlestick(
+        if figure_resampler is not None:
+            # Full-resolution line; the resampler trims it per viewport
+            df_bars = df
+            price_trace = go.Scatter(
                 x=df.index,
-                open=df['Open'],
-                high=df['High'],
-                low=df['Low'],
-                close=df['Close'],
+                y=df['Close'].to_numpy(),
+                name='Price',
+                line=dict(color='#26a69a', width=1)
+            )
+        else:
+            # Long histories are drawn from coarser bars; pattern math keeps df
+            df_bars = self._maybe_downsample(df)
+
+            # Candlestick
+            price_trace = go.Candlestick(
+                x=df_bars.index,
+                open=df_bars['Open'].to_numpy(),
+                high=df_bars['High'].to_numpy(),
+                low=df_bars['Low'].to_numpy(),
+                close=df_bars['Close'].to_numpy(),
                 name='Price',
                 increasing_line_color='#26a69a',
-                decreasing_line_color='#ef5350'
-            ),
-            row=1, col=1
-        )
+                decreasing_line_color='#ef5350',
+                hoverinfo='x+y' if huge else None
+            )
 
-        # Add subtle highlighting for each pattern
+        # Add subtle highlighting for each pattern, collected for a single
+        # layout update at the end
+        shapes: List[dict] = []
+        annotations: List[dict] = []
         for pattern in patterns:
-            self._add_pattern_highlighting(fig, pattern, df, subtle=True)
-
-        # Add volume
-        colors = ['#26a69a' if close >= open_ else '#ef5350'
-                  for close, open_ in zip(df['Close'], df['Open'])]
-
-        fig.add_trace(
-            go.Bar(
-                x=df.index,
-                y=df['Volume'],
-                name='Volume',
-                marker_color=colors,
-                opacity=0.5
-            ),
-            row=2, col=1
+            refs = self._extract_pattern_refs(pattern, df)
+            self._add_pattern_highlighting(shapes, annotations, pattern, refs, subtle=True)
+
+        # Add price and volume in one call
+        colors = self._volume_colors(df_bars)
+        volume_trace = go.Bar(
+            x=df_bars.index,
+            y=df_bars['Volume'].to_numpy(),
+            name='Volume',
+            marker_color=colors,
+            opacity=0.5
         )
-
-        # Add pattern markers
-        for i, pattern in enumerate(patterns):
-            if pd.Timestamp(pattern.active_start) in df.index:
-                fig.add_annotation(
+        fig.add_traces([price_trace, volume_trace], rows=[1, 2], cols=[1, 1])
+
+        # Add pattern markers, locating all activation bars in one lookup
+        active_locs = self._locate_dates(df, [p._active_ts for p in patterns])
+        highs = df['High'].to_numpy()
+        for i, (pattern, loc) in enumerate(zip(patterns, active_locs)):
+            if loc >= 0:
+                annotations.append(dict(
                     x=pattern.active_start,
-                    y=df.loc[pd.Timestamp(pattern.active_start), 'High'],
+                    y=highs[loc],
+                    xref='x', yref='y',
                     text=f"P{i+1}",
                     showarrow=True,
                     arrowhead=2,
@@ -281,19 +583,112 @@ class PatternChart:
                     arrowcolor="gold",
                     ax=0,
                     ay=-30,
-                    row=1, col=1
-                )
+                ))
 
         fig.update_layout(
+            shapes=shapes,
+            annotations=list(fig.layout.annotations) + annotations,
             title=f'Pattern Overview - {len(patterns)} Patterns Detected',
-            xaxis_rangeslider_visible=False,
-            height=700,
-            template='plotly_dark',
-            hovermode='x unified'
+            template=self._OVERVIEW_TEMPLATE
         )
+        if huge:
+            fig.layout.hovermode = 'closest'
+
+        if figure_resampler is not None:
+            fig = figure_resampler(fig, default_n_shown_samples=self.OVERVIEW_MAX_BARS)
 
         return fig
 
+    def _figure_resampler(self):
+        """The optional plotly-resampler FigureResampler class, or None if not installed."""
+        try:
+            from plotly_resampler import FigureResampler
+        except ImportError:
+            logger.info("plotly-resampler not installed; downsampling overview candles instead")
+            return None
+        return FigureResampler
+
+    def _maybe_downsample(self,
+                          df: pd.DataFrame,
+                          max_bars: Optional[int] = None) -> pd.DataFrame:
+        """
+        Aggregate daily bars to weekly, or monthly if still too many, when
+        there are more than max_bars of them.
+
+        Keeps the number of candles the browser has to draw bounded on long
+        histories.
+        """
+        max_bars = max_bars or self.OVERVIEW_MAX_BARS
+        if len(df) <= max_bars:
+            return df
+
+        # Roughly 5 trading days per week
+        rule = 'W' if len(df) / 5 <= max_bars else 'ME'
+
+        # One typed reducer per column instead of an agg dict, which
+        # dispatches every column through the generic aggregation path
+        resampled = df.resample(rule)
+        return pd.DataFrame({
+            'Open': resampled['Open'].first(),
+            'High': resampled['High'].max(),
+            'Low': resampled['Low'].min(),
+            'Close': resampled['Close'].last(),
+            'Volume': resampled['Volume'].sum(),
+        }).dropna(subset=['Open'])
+
+    def _volume_colors(self, df: pd.DataFrame) -> np.ndarray:
+        """Per-bar volume colors: green on up days, red on down days."""
+        return np.where(df['Close'].to_numpy() >= df['Open'].to_numpy(), '#26a69a', '#ef5350')
+
+    def _locate_dates(self, df: pd.DataFrame, dates: List[Any]) -> np.ndarray:
+        """
+        Positions of dates in df's (sorted) index, -1 where there is no bar.
+
+        One batched index lookup replaces per-date Timestamp construction
+        and membership tests; None dates are never found.
+        """
+        targets = pd.to_datetime(list(dates))
+        if df.index.is_unique:
+            return df.index.get_indexer(targets)
+
+        # Repeated dates: fall back to the first matching bar
+        index = df.index.values
+        targets = targets.values.astype(index.dtype)
+        if len(index) == 0:
+            return np.full(len(targets), -1)
+
+        positions = np.searchsorted(index, targets)
+        clipped = np.minimum(positions, len(index) - 1)
+        found = (positions < len(index)) & (index[clipped] == targets)
+        return np.where(found, positions, -1)
+
+    def _extract_pattern_refs(self, pattern: PatternPeriod, df: pd.DataFrame) -> PatternRefs:
+        """
+        Locate a pattern's qualification, activation and breakout bars in df
+        with one search, along with the prices and period ends drawn there.
+        """
+        qual_loc, active_loc, breakout_loc = self._locate_dates(
+            df, [pattern._qual_ts, pattern._active_ts, pattern._breakout_ts]
+        )
+        lows = df['Low'].to_numpy()
+        highs = df['High'].to_numpy()
+        last_date = df.index[-1]
+
+        post_end = None
+        if breakout_loc >= 0:
+            post_end = min(pd.Timestamp(pattern._breakout_ts + np.timedelta64(100, 'D')), last_date)
+
+        return PatternRefs(
+            qual_exists=qual_loc >= 0,
+            active_exists=active_loc >= 0,
+            breakout_exists=breakout_loc >= 0,
+            qual_low=lows[qual_loc] if qual_loc >= 0 else np.nan,
+            active_low=lows[active_loc] if active_loc >= 0 else np.nan,
+            breakout_high=highs[breakout_loc] if breakout_loc >= 0 else np.nan,
+            active_end=pattern.breakout_date or pattern.completion_date or last_date,
+            post_end=post_end,
+        )
+
     def _calculate_window(self,
                          df: pd.DataFrame,
                          pattern: PatternPeriod,
@@ -336,34 +731,80 @@ class PatternChart:
 
         return actual_start, actual_end, warning
 
+    def _pattern_decorations(self,
+                             pattern: PatternPeriod,
+                             df: pd.DataFrame,
+                             show_indicators: bool) -> Tuple[List[dict], List[dict]]:
+        """Shapes and annotations of a focused pattern view, as layout dicts."""
+        shapes: List[dict] = []
+        annotations: List[dict] = []
+        refs = self._extract_pattern_refs(pattern, df)
+        self._add_pattern_highlighting(shapes, annotations, pattern, refs)
+        self._add_boundary_lines(shapes, annotations, pattern, df)
+        if show_indicators:
+            self._add_rsi_levels(shapes)
+        self._add_pattern_annotations(annotations, pattern, refs)
+        return shapes, annotations
+
+    def _add_vrect(self,
+                   shapes: List[dict],
+                   annotations: List[dict],
+                   x0: Any,
+                   x1: Any,
+                   fillcolor: str,
+                   opacity: float,
+                   label: Optional[str]):
+        """Append a shaded price-row period, with an optional top-left label."""
+        shapes.append(dict(
+            type='rect', xref='x', x0=x0, x1=x1, yref='y domain', y0=0, y1=1,
+            fillcolor=fillcolor, opacity=opacity, layer='below', line=dict(width=0),
+        ))
+        if label:
+            annotations.append(dict(
+                text=label, showarrow=False, xref='x', x=x0, xanchor='left',
+                yref='y domain', y=1, yanchor='top',
+            ))
+
+    def _add_hline(self,
+                   shapes: List[dict],
+                   annotations: List[dict],
+                   y: float,
+                   line: dict,
+                   opacity: float,
+                   label: Optional[str] = None,
+                   row: int = 1):
+        """Append a full-width horizontal line on a row, with an optional right label."""
+        axis = '' if row == 1 else str(row)
+        shapes.append(dict(
+            type='line', xref=f'x{axis} domain', x0=0, x1=1, yref=f'y{axis}', y0=y, y1=y,
+            line=line, opacity=opacity,
+        ))
+        if label:
+            annotations.append(dict(
+                text=label, showarrow=False, xref=f'x{axis} domain', x=1, xanchor='left',
+                yref=f'y{axis}', y=y, yanchor='middle',
+            ))
+
     def _add_pattern_highlighting(self,
-                                 fig: go.Figure,
+                                 shapes: List[dict],
+                                 annotations: List[dict],
                                  pattern: PatternPeriod,
-                                 df: pd.DataFrame,
+                                 refs: PatternRefs,
                                  subtle: bool = True):
         """Add subtle shading for pattern periods."""
+        opacity = 0.5 if not subtle else 0.3
 
         # Qualification period
-        qual_start = pd.Timestamp(pattern.qualification_start)
-        active_start = pd.Timestamp(pattern.active_start)
-
-        if qual_start in df.index:
-            fig.add_vrect(
-                x0=pattern.qualification_start,
-                x1=pattern.active_start,
-                fillcolor=self.PATTERN_COLORS['qualification'],
-                opacity=0.5 if not subtle else 0.3,
-                layer="below",
-                line_width=0,
-                annotation_text="Qualification" if not subtle else None,
-                annotation_position="top left",
-                row=1, col=1
+        if refs.qual_exists:
+            self._add_vrect(
+                shapes, annotations,
+                pattern.qualification_start, pattern.active_start,
+                self.PATTERN_COLORS['qualification'], opacity,
+                "Qualification" if not subtle else None,
             )
 
         # Active period
-        if active_start in df.index:
-            active_end = pd.Timestamp(pattern.breakout_date) if pattern.breakout_date else (pd.Timestamp(pattern.completion_date) if pattern.completion_date else df.index[-1])
-
+        if refs.active_exists:
             if pattern.outcome == 'success':
                 color = self.PATTERN_COLORS['active']
             elif pattern.outcome == 'failed':
@@ -371,193 +812,228 @@ class PatternChart:
             else:
                 color = self.PATTERN_COLORS['ongoing']
 
-            fig.add_vrect(
-                x0=pattern.active_start,
-                x1=active_end,
-                fillcolor=color,
-                opacity=0.5 if not subtle else 0.3,
-                layer="below",
-                line_width=0,
-                annotation_text="Active" if not subtle else None,
-                annotation_position="top left",
-                row=1, col=1
+            self._add_vrect(
+                shapes, annotations,
+                pattern.active_start, refs.active_end,
+                color, opacity,
+                "Active" if not subtle else None,
             )
 
         # Post-breakout period (if applicable)
-        if pattern.breakout_date:
-            breakout_ts = pd.Timestamp(pattern.breakout_date)
-            if breakout_ts in df.index:
-                post_end = min(
-                    pd.Timestamp(pattern.breakout_date + timedelta(days=100)),
-                    df.index[-1]
-                )
-
+        if refs.breakout_exists:
             outcome_color = (self.PATTERN_COLORS['breakout_success']
                            if pattern.outcome == 'success'
                            else self.PATTERN_COLORS['breakout_failed'])
 
-            fig.add_vrect(
-                x0=pattern.breakout_date,
-                x1=post_end,
-                fillcolor=outcome_color,
-                opacity=0.3 if not subtle else 0.2,
-                layer="below",
-                line_width=0,
-                annotation_text="Post-Breakout" if not subtle else None,
-                annotation_position="top left",
-                row=1, col=1
+            self._add_vrect(
+                shapes, annotations,
+                pattern.breakout_date, refs.post_end,
+                outcome_color, 0.3 if not subtle else 0.2,
+                "Post-Breakout" if not subtle else None,
             )
 
     def _add_boundary_lines(self,
-                           fig: go.Figure,
+                           shapes: List[dict],
+                           annotations: List[dict],
                            pattern: PatternPeriod,
                            df: pd.DataFrame):
         """Add horizontal lines for pattern boundaries."""
 
         # Upper boundary
-        fig.add_hline(
-            y=pattern.upper_boundary,
-            line_dash="dash",
-            line_color="red",
-            line_width=1,
+        self._add_hline(
+            shapes, annotations, pattern.upper_boundary,
+            line=dict(color="red", dash="dash", width=1),
             opacity=0.6,
-            annotation_text=f"Upper: ${pattern.upper_boundary:.2f}",
-            annotation_position="right",
-            row=1, col=1
+            label=f"Upper: ${pattern.upper_boundary:.2f}",
         )
 
         # Lower boundary
-        fig.add_hline(
-            y=pattern.lower_boundary,
-            line_dash="dash",
-            line_color="green",
-            line_width=1,
+        self._add_hline(
+            shapes, annotations, pattern.lower_boundary,
+            line=dict(color="green", dash="dash", width=1),
             opacity=0.6,
-            annotation_text=f"Lower: ${pattern.lower_boundary:.2f}",
-            annotation_position="right",
-            row=1, col=1
+            label=f"Lower: ${pattern.lower_boundary:.2f}",
         )
 
         # Power boundary (breakout target)
-        fig.add_hline(
-            y=pattern.power_boundary,
-            line_dash="dot",
-            line_color="gold",
-            line_width=2,
+        self._add_hline(
+            shapes, annotations, pattern.power_boundary,
+            line=dict(color="gold", dash="dot", width=2),
             opacity=0.8,
-            annotation_text=f"Power Target: ${pattern.power_boundary:.2f}",
-            annotation_position="right",
-            row=1, col=1
+            label=f"Power Target: ${pattern.power_boundary:.2f}",
         )
 
     def _add_pattern_annotations(self,
-                                fig: go.Figure,
+                                annotations: List[dict],
                                 pattern: PatternPeriod,
-                                df: pd.DataFrame):
+                                refs: PatternRefs):
         """Add annotations for key pattern events."""
 
         # Mark pattern start
-        if pd.Timestamp(pattern.qualification_start) in df.index:
-            fig.add_annotation(
+        if refs.qual_exists:
+            annotations.append(dict(
                 x=pattern.qualification_start,
-                y=df.loc[pd.Timestamp(pattern.qualification_start), 'Low'],
+                y=refs.qual_low,
+                xref='x', yref='y',
                 text="Pattern Start",
                 showarrow=True,
                 arrowhead=2,
                 arrowcolor="blue",
                 ax=0,
                 ay=40,
-                row=1, col=1
-            )
+            ))
 
         # Mark activation
-        if pd.Timestamp(pattern.active_start) in df.index:
-            fig.add_annotation(
+        if refs.active_exists:
+            annotations.append(dict(
                 x=pattern.active_start,
-                y=df.loc[pd.Timestamp(pattern.active_start), 'Low'],
+                y=refs.active_low,
+                xref='x', yref='y',
                 text="Activated",
                 showarrow=True,
                 arrowhead=2,
                 arrowcolor="gold",
                 ax=0,
                 ay=40,
-                row=1, col=1
-            )
+            ))
 
         # Mark breakout if occurred
-        if pattern.breakout_date and pd.Timestamp(pattern.breakout_date) in df.index:
+        if refs.breakout_exists:
             breakout_text = f"Breakout ({pattern.gain_percentage:.1f}%)" if pattern.gain_percentage else "Breakout"
-            fig.add_annotation(
+            annotations.append(dict(
                 x=pattern.breakout_date,
-                y=df.loc[pd.Timestamp(pattern.breakout_date), 'High'],
+                y=refs.breakout_high,
+                xref='x', yref='y',
                 text=breakout_text,
                 showarrow=True,
                 arrowhead=2,
                 arrowcolor="green" if pattern.outcome == 'success' else "red",
                 ax=0,
                 ay=-40,
-                row=1, col=1
-            )
+            ))
 
     def _add_technical_indicators(self,
                                  fig: go.Figure,
                                  df: pd.DataFrame):
         """Add technical indicators to the chart."""
+        fig.add_trace(self._rsi_trace(df), row=3, col=1)
 
-        # Calculate RSI
-        rsi = self._calculate_rsi(df['Close'])
+    def _rsi_trace(self, df: pd.DataFrame) -> go.Scatter:
+        """RSI line for the indicator row."""
+        rsi = self._calculate_rsi(df['Close'], self.RSI_PERIOD)
 
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=rsi,
-                name='RSI(14)',
-                line=dict(color='purple', width=2)
-            ),
-            row=3, col=1
+        return go.Scatter(
+            x=df.index,
+            y=rsi.to_numpy(),
+            name=f'RSI({self.RSI_PERIOD})',
+            line=dict(color='purple', width=2)
         )
 
-        # Add RSI levels
-        fig.add_hline(y=70, line_dash="dash", line_color="red",
-                     opacity=0.5, row=3, col=1)
-        fig.add_hline(y=30, line_dash="dash", line_color="green",
-                     opacity=0.5, row=3, col=1)
-        fig.add_hline(y=50, line_dash="dot", line_color="gray",
-                     opacity=0.3, row=3, col=1)
+    def _add_rsi_levels(self, shapes: List[dict]):
+        """Add RSI overbought/oversold/midline levels to the indicator row."""
+        self._add_hline(shapes, [], 70, line=dict(color="red", dash="dash"), opacity=0.5, row=3)
+        self._add_hline(shapes, [], 30, line=dict(color="green", dash="dash"), opacity=0.5, row=3)
+        self._add_hline(shapes, [], 50, line=dict(color="gray", dash="dot"), opacity=0.3, row=3)
 
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate RSI indicator."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        """
+        Calculate RSI indicator with Wilder's smoothing (NaN during warm-up).
 
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        Results are cached per window of the current price data, so
+        re-viewing a pattern does not recompute them.
+        """
+        if len(prices) == 0:
+            return pd.Series(dtype=np.float64, index=prices.index, name=prices.name)
+
+        key = (prices.index[0], prices.index[-1], len(prices), period)
+        rsi = self._rsi_cache.get(key)
+        if rsi is None:
+            rsi = pd.Series(
+                ind.rsi_series(prices.to_numpy(dtype=np.float64), period),
+                index=prices.index,
+                name=prices.name,
+            )
+            self._rsi_cache[key] = rsi
         return rsi
 
+    def _get_dataframe(self, prices: List[Price]) -> pd.DataFrame:
+        """DataFrame for prices, rebuilt only when a different price list is passed."""
+        if self._df is not None and prices is self._prices_ref and len(prices) == len(self._df):
+            return self._df
+
+        self._df = self._prices_to_dataframe(prices)
+        self._prices_ref = prices
+        self._rsi_cache = {}
+        return self._df
+
     def _prices_to_dataframe(self, prices: List[Price]) -> pd.DataFrame:
-        """Convert Price objects to DataFrame with DatetimeIndex."""
-        data = []
-        for price in prices:
-            data.append({
-                'Date': pd.to_datetime(price.date),
-                'Open': price.open,
-                'High': price.high,
-                'Low': price.low,
-                'Close': price.close,
-                'Volume': price.volume
-            })
-        df = pd.DataFrame(data)
-        df.set_index('Date', inplace=True)
-        df.sort_index(inplace=True)
+        """
+        Convert Price objects to DataFrame with DatetimeIndex.
+
+        Columns are built in one pass per attribute and the frame is
+        created in one go; sorting is skipped when prices already arrive
+        in date order, as they do from the providers.
+
+        Prices are stored as float32 and volume as uint32 (int64 if it does
+        not fit), halving the array payload serialized into chart JSON.
+        """
+        n = len(prices)
+        volume = np.fromiter((p.volume for p in prices), np.int64, n)
+        if n and 0 <= volume.min() and volume.max() <= np.iinfo(np.uint32).max:
+            volume = volume.astype(np.uint32)
+
+        df = pd.DataFrame(
+            {
+                'Open': np.fromiter((p.open for p in prices), np.float32, n),
+                'High': np.fromiter((p.high for p in prices), np.float32, n),
+                'Low': np.fromiter((p.low for p in prices), np.float32, n),
+                'Close': np.fromiter((p.close for p in prices), np.float32, n),
+                'Volume': volume,
+            },
+            index=pd.DatetimeIndex(pd.to_datetime([p.date for p in prices]), name='Date'),
+        )
+
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
         return df
 
     def _add_navigation_buttons(self, fig: go.Figure):
-        """Add navigation buttons to jump between patterns."""
+        """
+        Add navigation buttons to jump between patterns.
+
+        The span covering every pattern's window is plotted once, and each
+        button only relayouts the axis ranges, decorations and title, so the
+        figure carries no per-pattern price data.
+        """
 
         if len(self.patterns) <= 1:
             return
 
+        context_before, context_after, _ = self._view_options
+        windows = [
+            self._calculate_window(self._df, pattern, context_before, context_after)
+            for pattern in self.patterns
+        ]
+        span_start = min(window[0] for window in windows)
+        span_end = max(window[1] for window in windows)
+        span = self._df[(self._df.index >= span_start) & (self._df.index <= span_end)]
+        self._nav_span = span
+
+        with fig.batch_update():
+            candle, volume = fig.data[0], fig.data[1]
+            candle.x = span.index
+            candle.open = span['Open'].to_numpy()
+            candle.high = span['High'].to_numpy()
+            candle.low = span['Low'].to_numpy()
+            candle.close = span['Close'].to_numpy()
+            volume.x = span.index
+            volume.y = span['Volume'].to_numpy()
+            volume.marker.color = self._volume_colors(span)
+            if len(fig.data) > 2:
+                fig.data[2].x = span.index
+                fig.data[2].y = self._calculate_rsi(span['Close'], self.RSI_PERIOD).to_numpy()
+            fig.update_layout(self._navigation_layout(self._pattern_layout(self.current_pattern_index)))
+
         buttons = []
         for i, pattern in enumerate(self.patterns):
             label = f"Pattern {i+1}"
@@ -568,7 +1044,7 @@ class PatternChart:
                 dict(
                     label=label,
                     method="relayout",
-                    args=[{"title": f"Pattern {i+1} - {pattern.pattern_type}"}]
+                    args=[self._navigation_layout(self._pattern_layout(i))]
                 )
             )
 
@@ -587,86 +1063,255 @@ class PatternChart:
         )
 
 
+    @staticmethod
+    def _navigation_layout(layout: Dict[str, Any]) -> Dict[str, Any]:
+        """Relayout arguments framing a pattern in the navigation span."""
+        return {
+            **layout['ranges'],
+            'shapes': layout['shapes'],
+            'annotations': layout['annotations'],
+            'title.text': layout['title'],
+        }
+
+
 async def analyze_historical_patterns(symbol: str,
-                                     lookback_days: int = 365) -> List[PatternPeriod]:
+                                     lookback_days: int = 365,
+                                     provider=None) -> List[PatternPeriod]:
     """
     Analyze historical data to find all patterns for a symbol.
 
+    Results are cached per (symbol, lookback_days) for
+    PATTERN_CACHE_TTL_SECONDS, so re-viewing a symbol skips the scan.
+
     Args:
         symbol: Stock symbol
         lookback_days: Days of history to analyze
+        provider: Market data provider to fetch from; a new
+            EnhancedMarketProvider when omitted
 
     Returns:
         List of detected patterns with full lifecycle data
     """
-    from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
-    from aiv3.core.consolidation_tracker import ConsolidationTracker
+    return [pattern async for pattern in stream_historical_patterns(symbol, lookback_days, provider)]
+
+
+async def stream_historical_patterns(symbol: str,
+                                     lookback_days: int = 365,
+                                     provider=None) -> AsyncIterator[PatternPeriod]:
+    """
+    Analyze historical data for a symbol, yielding each pattern as soon as
+    the scan completes it.
+
+    Shares the cache of analyze_historical_patterns; the scan only runs when
+    no fresh result is cached and is stored once it has finished.
+
+    Args:
+        symbol: Stock symbol
+        lookback_days: Days of history to analyze
+        provider: Market data provider to fetch from; a new
+            EnhancedMarketProvider when omitted
+
+    Yields:
+        Detected patterns with full lifecycle data, oldest first
+    """
+    cache_key = (symbol, lookback_days)
+    entry = _pattern_cache.get(cache_key)
+    if entry is not None:
+        stored_at, cached_patterns = entry
+        if time.monotonic() - stored_at <= PATTERN_CACHE_TTL_SECONDS:
+            _pattern_cache.move_to_end(cache_key)
+            for pattern in cached_patterns:
+                yield pattern
+            return
+        del _pattern_cache[cache_key]
 
-    provider = EnhancedMarketProvider()
+    if provider is None:
+        from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
+        provider = EnhancedMarketProvider()
 
     # Get historical data
     prices = await provider.get_prices(symbol, days=lookback_days)
 
     if not prices or len(prices) < 100:
         logger.warning(f"Insufficient data for pattern analysis of {symbol}")
-        return []
+        return
 
+    # The day-by-day scan is CPU-bound; advance it off the event loop,
+    # one pattern at a time
+    scan = _scan_patterns(symbol, prices)
     patterns = []
+    while True:
+        pattern = await asyncio.to_thread(next, scan, None)
+        if pattern is None:
+            break
+        patterns.append(pattern)
+        yield pattern
+
+    _pattern_cache[cache_key] = (time.monotonic(), patterns)
+    _pattern_cache.move_to_end(cache_key)
+    while len(_pattern_cache) > PATTERN_CACHE_SIZE:
+        _pattern_cache.popitem(last=False)
+
+
+def _scan_patterns(symbol: str, prices: List[Price]) -> Iterator[PatternPeriod]:
+    """
+    Replay prices day by day through a ConsolidationTracker and yield
+    every active pattern with its subsequent outcome.
+
+    Args:
+        symbol: Stock symbol
+        prices: Price history, oldest first
+
+    Yields:
+        Detected patterns with full lifecycle data
+    """
+    from aiv3.core.consolidation_tracker import ConsolidationTracker
+
     tracker = ConsolidationTracker(symbol)
 
+    # Highs and lows as arrays, for vectorized breakout/breakdown scans
+    highs = np.fromiter((p.high for p in prices), np.float64, len(prices))
+    lows = np.fromiter((p.low for p in prices), np.float64, len(prices))
+
+    # Highest high over each bar and the 99 after it: the post-breakout
+    # peak of every possible breakout bar, in one pass
+    padded = np.concatenate((highs, np.full(99, -np.inf)))
+    forward_highs = sliding_window_view(padded, 100).max(axis=-1)
+
+    # Bar dates converted once, instead of a Timestamp per pattern event
+    dates = pd.DatetimeIndex([p.date for p in prices])
+
     # Simulate day-by-day analysis to find historical patterns
     for i in range(100, len(prices)):
         window = prices[:i+1]  # Only use data up to this point (no look-ahead)
         pattern = tracker.update(window)
 
         if pattern and pattern.phase.value == "ACTIVE":
+            breakout_date = None
+            completion_date = None
+            outcome = 'ongoing'
+            gain_percentage = None
+
+            # Check if pattern broke out in subsequent days
+            j_breakout, j_breakdown, max_price = _find_breakout(
+                highs, lows, i + 1, pattern.power_boundary, pattern.lower_boundary, 100,
+                forward_highs=forward_highs
+            )
+
+            if j_breakout >= 0:
+                j = j_breakout
+                breakout_date = dates[j]
+
+                # Calculate gain percentage
+                breakout_price = pattern.power_boundary
+                gain_percentage = ((max_price - breakout_price) / breakout_price) * 100
+
+                if gain_percentage > 10:
+                    outcome = 'success'
+                else:
+                    outcome = 'failed'
+
+                completion_date = dates[min(j+100, len(prices)-1)]
+            elif j_breakdown >= 0:
+                # Pattern failed (broke down)
+                outcome = 'failed'
+                completion_date = dates[j_breakdown]
+
             # Track this pattern
             pattern_period = PatternPeriod(
                 symbol=symbol,
                 pattern_id=f"{symbol}_{i}",
-                qualification_start=pd.Timestamp(window[-pattern.qualification_days].date) if pattern.qualification_days > 0 else pd.Timestamp(window[0].date),
-                active_start=pd.Timestamp(window[-1].date),
-                breakout_date=None,
-                completion_date=None,
+                qualification_start=dates[i + 1 - pattern.qualification_days] if pattern.qualification_days > 0 else dates[0],
+                active_start=dates[i],
+                breakout_date=breakout_date,
+                completion_date=completion_date,
                 pattern_type='consolidation',
                 upper_boundary=pattern.upper_boundary,
                 lower_boundary=pattern.lower_boundary,
                 power_boundary=pattern.power_boundary,
-                outcome='ongoing',
-                gain_percentage=None
+                outcome=outcome,
+                gain_percentage=gain_percentage
             )
 
-            # Check if pattern broke out in subsequent days
-            for j in range(i+1, min(i+101, len(prices))):  # Check next 100 days
-                if prices[j].high > pattern.power_boundary:
-                    pattern_period.breakout_date = pd.Timestamp(prices[j].date)
+            yield pattern_period
 
-                    # Calculate gain percentage
-                    breakout_price = pattern.power_boundary
-                    max_price = max(p.high for p in prices[j:min(j+100, len(prices))])
-                    pattern_period.gain_percentage = ((max_price - breakout_price) / breakout_price) * 100
 
-                    if pattern_period.gain_percentage > 10:
-                        pattern_period.outcome = 'success'
-                    else:
-                        pattern_period.outcome = 'failed'
+def _find_breakout(highs: np.ndarray,
+                   lows: np.ndarray,
+                   start: int,
+                   power_boundary: float,
+                   lower_boundary: float,
+                   max_look: int,
+                   forward_highs: Optional[np.ndarray] = None) -> Tuple[int, int, float]:
+    """
+    Find how a pattern resolved in the bars following it.
 
-                    pattern_period.completion_date = pd.Timestamp(prices[min(j+100, len(prices)-1)].date)
-                    break
-                elif prices[j].low < pattern.lower_boundary:
-                    # Pattern failed (broke down)
-                    pattern_period.outcome = 'failed'
-                    pattern_period.completion_date = pd.Timestamp(prices[j].date)
-                    break
+    Scans up to ``max_look`` bars from ``start`` for the first bar whose
+    high clears the power boundary (breakout) or whose low drops under the
+    lower boundary (breakdown); a breakout wins a tie.
 
-            patterns.append(pattern_period)
+    Args:
+        highs: Daily highs
+        lows: Daily lows
+        start: First bar to scan
+        power_boundary: Breakout level
+        lower_boundary: Breakdown level
+        max_look: Number of bars to scan
+        forward_highs: Optional precomputed max high over each bar and the
+            ``max_look - 1`` bars after it
 
-    return patterns
+    Returns:
+        Tuple of (breakout index, breakdown index, max high in the
+        ``max_look`` bars from the breakout); indices are -1 and the max
+        high 0.0 when not applicable
+    """
+    end = min(start + max_look, len(highs))
+    broke_up = highs[start:end] > power_boundary
+    broke_down = lows[start:end] < lower_boundary
+    events = broke_up | broke_down
+
+    if not events.any():
+        return -1, -1, 0.0
+
+    k = int(np.argmax(events))
+    j = start + k
+    if broke_up[k]:
+        if forward_highs is not None:
+            return j, -1, float(forward_highs[j])
+        return j, -1, float(np.max(highs[j:j + max_look]))
+    return -1, j, 0.0
+
+
+async def analyze_historical_patterns_many(symbols: List[str],
+                                           lookback_days: int = 365,
+                                           concurrency: int = 16) -> Dict[str, List[PatternPeriod]]:
+    """
+    Analyze historical patterns for several symbols concurrently.
+
+    Args:
+        symbols: Stock symbols
+        lookback_days: Days of history to analyze
+        concurrency: Maximum number of symbols analyzed at once
+
+    Returns:
+        Dictionary mapping each symbol to its detected patterns
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def analyze(symbol: str) -> Tuple[str, List[PatternPeriod]]:
+        async with semaphore:
+            return symbol, await analyze_historical_patterns(symbol, lookback_days)
+
+    results = await asyncio.gather(*(analyze(symbol) for symbol in symbols))
+    return dict(results)
 
 
 async def create_pattern_analysis_chart(symbol: str,
                                        pattern_id: Optional[str] = None,
-                                       show_all_patterns: bool = False) -> go.Figure:
+                                       show_all_patterns: bool = False,
+                                       patterns: Optional[Union[List[PatternPeriod],
+                                                                AsyncIterator[PatternPeriod]]] = None,
+                                       provider=None) -> go.Figure:
     """
     Create a comprehensive pattern analysis chart for a symbol.
 
@@ -674,13 +1319,17 @@ async def create_pattern_analysis_chart(symbol: str,
         symbol: Stock symbol to analyze
         pattern_id: Specific pattern ID to focus on
         show_all_patterns: If True, show all patterns in overview
+        patterns: Already detected patterns, as a list or a stream from
+            stream_historical_patterns; analyzed here when omitted
+        provider: Market data provider to fetch from; a new
+            EnhancedMarketProvider when omitted
 
     Returns:
         Interactive Plotly chart with pattern analysis
     """
-    from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
-
-    provider = EnhancedMarketProvider()
+    if provider is None:
+        from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
+        provider = EnhancedMarketProvider()
 
     # Get price data
     prices = await provider.get_prices(symbol, days=500)
@@ -689,7 +1338,10 @@ async def create_pattern_analysis_chart(symbol: str,
         raise ValueError(f"No price data found for {symbol}")
 
     # Analyze patterns
-    patterns = await analyze_historical_patterns(symbol, lookback_days=365)
+    if patterns is None:
+        patterns = await analyze_historical_patterns(symbol, lookback_days=365, provider=provider)
+    elif not isinstance(patterns, list):
+        patterns = [pattern async for pattern in patterns]
 
     if not patterns:
         logger.info(f"No patterns found for {symbol}")
@@ -6,19 +6,42 @@ volume representation based on the selected timeframe.
 """
 
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
+from typing import Callable, List, NamedTuple, Optional, Dict, Sequence, Tuple
 import asyncio
+import gzip
+import logging
+from operator import attrgetter
 
 from stockgpt.core.entities.stock import Price
 
+logger = logging.getLogger(__name__)
 
-@dataclass
-class TimeFrame:
+# Numeric price fields read into one structured record per bar
+_PRICE_FIELDS = attrgetter('open', 'high', 'low', 'close', 'volume')
+_PRICE_DTYPE = np.dtype([
+    ('Open', np.float64),
+    ('High', np.float64),
+    ('Low', np.float64),
+    ('Close', np.float64),
+    ('Volume', np.int64),
+])
+
+
+# Volume scaling factor per volume aggregation
+VOLUME_MULTIPLIERS = {
+    'hourly': 24.0,
+    'daily': 1.0,
+    'weekly': 0.2,
+    'monthly': 0.05
+}
+
+
+class TimeFrame(NamedTuple):
     """Represents a temporal timeframe for chart display."""
     name: str
     days: int
@@ -28,13 +51,7 @@ class TimeFrame:
     @property
     def volume_multiplier(self) -> float:
         """Get volume scaling factor based on timeframe."""
-        multipliers = {
-            'hourly': 24.0,
-            'daily': 1.0,
-            'weekly': 0.2,
-            'monthly': 0.05
-        }
-        return multipliers.get(self.volume_aggregation, 1.0)
+        return VOLUME_MULTIPLIERS.get(self.volume_aggregation, 1.0)
 
 
 class TemporalChart:
@@ -60,40 +77,84 @@ class TemporalChart:
         '5Y': TimeFrame('5 Years', 1825, 'monthly', '1week'),
     }
 
+    # Candles beyond this count are merged into fixed-size buckets for display
+    MAX_CANDLES = 5000
+
+    # Timeframe selector buttons, each jumping to its frame; identical for
+    # every chart, so built once
+    _TIMEFRAME_BUTTONS = tuple(
+        dict(
+            label=key,
+            method="animate",
+            args=[[key], {"mode": "immediate",
+                          "frame": {"duration": 0, "redraw": True},
+                          "transition": {"duration": 0}}]
+        )
+        for key in TIMEFRAMES
+    )
+
     def __init__(self):
         """Initialize the temporal chart."""
         self.current_timeframe = self.TIMEFRAMES['3M']
         self.fig = None
 
+        # Price list the current DataFrame was built from, and its
+        # aggregations keyed by volume_aggregation
+        self._prices_ref: Optional[List[Price]] = None
+        self._df: Optional[pd.DataFrame] = None
+        self._aggregated: Dict[str, pd.DataFrame] = {}
+
     def create_chart(self,
                      prices: List[Price],
                      symbol: str,
                      timeframe: str = '3M',
                      patterns: Optional[List[Dict]] = None,
-                     indicators: Optional[Dict[str, List[float]]] = None) -> go.Figure:
+                     indicators: Optional[Dict[str, Optional[Sequence[float]]]] = None,
+                     resample: bool = False) -> go.Figure:
         """
         Create an interactive chart with temporal-aware features.
 
+        The chart shows the timeframe's last ``days`` of prices, exactly as
+        its selector frame does. With custom indicators the timeframe
+        selector is left out, since the indicator traces are tied to this
+        timeframe's bars.
+
         Args:
             prices: List of Price objects
             symbol: Stock symbol
             timeframe: Timeframe key (1D, 5D, 1M, 3M, 6M, 1Y, 5Y)
             patterns: List of detected patterns to overlay
-            indicators: Technical indicators to display
+            indicators: Technical indicators to display ('sma_20', 'sma_50',
+                'rsi'), as lists or arrays over the full history aggregated
+                for the timeframe; an indicator mapped to None is computed
+                from those closes
+            resample: With more than MAX_CANDLES bars and plotly-resampler
+                installed, chart the full-resolution close and volume and
+                let plotly-resampler send only the visible range on zoom
+                (no timeframe frames or selector in that case)
 
         Returns:
-            Plotly Figure object
+            Plotly Figure object (a FigureResampler when resampling)
         """
         if not prices:
             raise ValueError("No price data provided")
 
         self.current_timeframe = self.TIMEFRAMES.get(timeframe, self.TIMEFRAMES['3M'])
 
-        # Convert prices to DataFrame
-        df = self._prices_to_dataframe(prices)
+        # Convert prices to DataFrame and aggregate the timeframe's span,
+        # reusing earlier results for the same prices
+        df_aggregated = self._timeframe_view(prices, self.current_timeframe)
 
-        # Aggregate data based on timeframe
-        df_aggregated = self._aggregate_by_timeframe(df)
+        figure_resampler = None
+        if resample and len(df_aggregated) > self.MAX_CANDLES:
+            figure_resampler = self._figure_resampler()
+
+        if figure_resampler is not None:
+            # Full resolution; the resampler trims it per viewport
+            df_display = df_aggregated
+        else:
+            # Cap the number of candles sent to the browser
+            df_display = self._visual_downsample(df_aggregated, self.MAX_CANDLES)
 
         # Create subplots with shared x-axis
         fig = make_subplots(
@@ -108,36 +169,24 @@ class TemporalChart:
             )
         )
 
-        # Add candlestick chart
-        fig.add_trace(
-            go.Candlestick(
-                x=df_aggregated.index,
-                open=df_aggregated['Open'],
-                high=df_aggregated['High'],
-                low=df_aggregated['Low'],
-                close=df_aggregated['Close'],
+        # Candlestick, temporally adjusted volume and (without custom
+        # indicators) the default RSI
+        with_rsi = not indicators
+        traces = self._build_traces(df_display, self.current_timeframe, with_rsi)
+        if figure_resampler is not None:
+            # Candlesticks cannot be aggregated per viewport; draw the close
+            traces[0] = go.Scatter(
+                x=df_display.index,
+                y=df_display['Close'].to_numpy(np.float32),
                 name='Price',
-                increasing_line_color='#26a69a',
-                decreasing_line_color='#ef5350'
-            ),
-            row=1, col=1
-        )
+                line=dict(color='#26a69a', width=1)
+            )
 
-        # Add volume bars with temporal adjustment
-        volume_adjusted = df_aggregated['Volume'] * self.current_timeframe.volume_multiplier
-        colors = ['#26a69a' if close >= open_ else '#ef5350'
-                  for close, open_ in zip(df_aggregated['Close'], df_aggregated['Open'])]
+        # Add candlestick chart
+        fig.add_trace(traces[0], row=1, col=1)
 
-        fig.add_trace(
-            go.Bar(
-                x=df_aggregated.index,
-                y=volume_adjusted,
-                name='Volume',
-                marker_color=colors,
-                opacity=0.5
-            ),
-            row=2, col=1
-        )
+        # Add volume bars with temporal adjustment
+        fig.add_trace(traces[1], row=2, col=1)
 
         # Add patterns if provided
         if patterns:
@@ -145,19 +194,10 @@ class TemporalChart:
 
         # Add technical indicators
         if indicators:
-            self._add_indicators(fig, indicators, df_aggregated)
+            self._add_indicators(fig, indicators, df_aggregated, self._get_aggregated(prices))
         else:
             # Add default RSI
-            rsi = self._calculate_rsi(df_aggregated['Close'])
-            fig.add_trace(
-                go.Scatter(
-                    x=df_aggregated.index,
-                    y=rsi,
-                    name='RSI(14)',
-                    line=dict(color='purple', width=2)
-                ),
-                row=3, col=1
-            )
+            fig.add_trace(traces[2], row=3, col=1)
 
             # Add RSI levels
             fig.add_hline(y=70, line_dash="dash", line_color="red",
@@ -187,6 +227,14 @@ class TemporalChart:
         fig.update_yaxes(title_text=f"Volume ({self._get_volume_unit()})", row=2, col=1)
         fig.update_yaxes(title_text="RSI", row=3, col=1)
 
+        if figure_resampler is not None:
+            self.fig = figure_resampler(fig, default_n_shown_samples=self.MAX_CANDLES)
+            return self.fig
+
+        if indicators:
+            self.fig = fig
+            return fig
+
         # Add timeframe selector buttons
         buttons = self._create_timeframe_buttons()
         fig.update_layout(
@@ -203,34 +251,170 @@ class TemporalChart:
             ]
         )
 
+        # One frame per timeframe, so the selector buttons switch data in
+        # the browser instead of requiring a rebuild
+        fig.frames = self._timeframe_frames(prices, symbol, with_rsi, fig)
+
         self.fig = fig
         return fig
 
+    def _figure_resampler(self):
+        """The optional plotly-resampler FigureResampler class, or None if not installed."""
+        try:
+            from plotly_resampler import FigureResampler
+        except ImportError:
+            logger.info("plotly-resampler not installed; downsampling candles instead")
+            return None
+        return FigureResampler
+
+    def _build_traces(self, df: pd.DataFrame, timeframe: TimeFrame, with_rsi: bool) -> List:
+        """Candlestick, volume and (optionally) default RSI traces for df."""
+        volume_adjusted = (df['Volume'].to_numpy(np.float32)
+                           * np.float32(timeframe.volume_multiplier))
+
+        traces = [
+            go.Candlestick(
+                x=df.index,
+                open=df['Open'].to_numpy(np.float32),
+                high=df['High'].to_numpy(np.float32),
+                low=df['Low'].to_numpy(np.float32),
+                close=df['Close'].to_numpy(np.float32),
+                name='Price',
+                increasing_line_color='#26a69a',
+                decreasing_line_color='#ef5350'
+            ),
+            go.Bar(
+                x=df.index,
+                y=volume_adjusted,
+                name='Volume',
+                marker_color=self._volume_colors(df),
+                opacity=0.5
+            ),
+        ]
+        if with_rsi:
+            rsi = self._calculate_rsi(df['Close'])
+            traces.append(
+                go.Scatter(
+                    x=df.index,
+                    y=rsi.to_numpy(np.float32),
+                    name='RSI(14)',
+                    line=dict(color='purple', width=2)
+                )
+            )
+        return traces
+
+    def _timeframe_frames(self,
+                          prices: List[Price],
+                          symbol: str,
+                          with_rsi: bool,
+                          fig: go.Figure) -> List[go.Frame]:
+        """
+        Animation frames holding each timeframe's traces and titles.
+
+        Frames restyle the candlestick, volume and default RSI traces
+        (0, 1, 2). Each frame holds only its timeframe's last ``days`` of
+        prices (see _timeframe_view), and
+        timeframes whose slice and aggregation coincide (e.g. 6M and 1Y on
+        a history shorter than six months) share one set of traces.
+        """
+        annotations = [ann.to_plotly_json() for ann in fig.layout.annotations]
+        trace_indices = [0, 1, 2] if with_rsi else [0, 1]
+
+        # (volume aggregation, first bar in the slice) -> frame traces
+        frame_traces = {}
+
+        frames = []
+        for key, tf in self.TIMEFRAMES.items():
+            data_key = (tf.volume_aggregation, self._timeframe_start(tf))
+            data = frame_traces.get(data_key)
+            if data is None:
+                df_display = self._visual_downsample(self._timeframe_view(prices, tf), self.MAX_CANDLES)
+                data = frame_traces[data_key] = self._build_traces(df_display, tf, with_rsi)
+
+            frame_annotations = [dict(ann) for ann in annotations]
+            frame_annotations[0]['text'] = f'{symbol} - {tf.name}'
+
+            frames.append(go.Frame(
+                name=key,
+                data=data,
+                traces=trace_indices,
+                layout=dict(
+                    title=dict(text=f'{symbol} Temporal Chart - {tf.name}'),
+                    annotations=frame_annotations,
+                    yaxis2=dict(title=dict(text=f"Volume ({self._get_volume_unit(tf)})")),
+                ),
+            ))
+        return frames
+
+    def _timeframe_start(self, timeframe: TimeFrame) -> int:
+        """Position in the current DataFrame of the first bar within the timeframe's last ``days``."""
+        dates = self._df.index
+        return int(dates.searchsorted(dates[-1] - pd.Timedelta(days=timeframe.days), side='right'))
+
+    def _timeframe_view(self, prices: List[Price], timeframe: TimeFrame) -> pd.DataFrame:
+        """
+        The timeframe's last ``days`` of prices, aggregated at its granularity.
+
+        Aggregated bars are labeled by period end, so the view's index is a
+        suffix of the full-history aggregation's index.
+        """
+        df_aggregated = self._get_aggregated(prices, timeframe)
+        start = self._timeframe_start(timeframe)
+        if start == 0:
+            return df_aggregated
+        return self._aggregate_by_timeframe(self._df.iloc[start:], timeframe.volume_aggregation)
+
+    def _get_aggregated(self, prices: List[Price], timeframe: Optional[TimeFrame] = None) -> pd.DataFrame:
+        """
+        Prices aggregated for a timeframe (the current one by default).
+
+        The DataFrame is rebuilt only when a different price list is passed,
+        and each aggregation is computed once per DataFrame.
+        """
+        if self._df is None or prices is not self._prices_ref or len(prices) != len(self._df):
+            self._df = self._prices_to_dataframe(prices)
+            self._prices_ref = prices
+            self._aggregated = {}
+
+        aggregation = (timeframe or self.current_timeframe).volume_aggregation
+        df_aggregated = self._aggregated.get(aggregation)
+        if df_aggregated is None:
+            df_aggregated = self._aggregate_by_timeframe(self._df, aggregation)
+            self._aggregated[aggregation] = df_aggregated
+        return df_aggregated
+
     def _prices_to_dataframe(self, prices: List[Price]) -> pd.DataFrame:
-        """Convert Price objects to DataFrame."""
-        data = []
-        for price in prices:
-            data.append({
-                'Date': pd.to_datetime(price.date),  # Convert to datetime
-                'Open': price.open,
-                'High': price.high,
-                'Low': price.low,
-                'Close': price.close,
-                'Volume': price.volume
-            })
-        df = pd.DataFrame(data)
-        df.set_index('Date', inplace=True)
-        df.sort_index(inplace=True)
+        """
+        Convert Price objects to DataFrame.
+
+        The numeric fields are read into one preallocated structured array
+        in a single C-level pass and the dates are converted in one batch,
+        then the frame is built from the columns; sorting is skipped when
+        the prices already arrive in date order.
+        """
+        records = np.fromiter(map(_PRICE_FIELDS, prices), dtype=_PRICE_DTYPE, count=len(prices))
+
+        # One vectorized conversion of the whole list; converting each date
+        # to datetime64 on its own costs several times more
+        dates = pd.to_datetime([price.date for price in prices]).as_unit('ns')
+
+        df = pd.DataFrame(
+            {column: records[column] for column in _PRICE_DTYPE.names},
+            index=pd.DatetimeIndex(dates, name='Date'),
+        )
+        if not dates.is_monotonic_increasing:
+            df.sort_index(inplace=True)
         return df
 
-    def _aggregate_by_timeframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _aggregate_by_timeframe(self, df: pd.DataFrame, aggregation: Optional[str] = None) -> pd.DataFrame:
         """
-        Aggregate data based on current timeframe settings.
+        Aggregate data based on current timeframe settings (or the given
+        volume aggregation).
 
         This is where the temporal magic happens - we adjust the granularity
         of both price and volume data based on the selected timeframe.
         """
-        aggregation = self.current_timeframe.volume_aggregation
+        aggregation = aggregation or self.current_timeframe.volume_aggregation
 
         if aggregation == 'hourly':
             # For intraday, return as-is (assuming we have minute data)
@@ -240,62 +424,149 @@ class TemporalChart:
             return df
         elif aggregation == 'weekly':
             # Resample to weekly
-            return df.resample('W').agg({
-                'Open': 'first',
-                'High': 'max',
-                'Low': 'min',
-                'Close': 'last',
-                'Volume': 'sum'
-            }).dropna()
+            return self._fast_ohlcv_resample(df, 'W')
         elif aggregation == 'monthly':
             # Resample to monthly
-            return df.resample('M').agg({
-                'Open': 'first',
-                'High': 'max',
-                'Low': 'min',
-                'Close': 'last',
-                'Volume': 'sum'
-            }).dropna()
+            return self._fast_ohlcv_resample(df, 'M')
 
         return df
 
+    def _fast_ohlcv_resample(self, df: pd.DataFrame, freq: str) -> pd.DataFrame:
+        """
+        Aggregate sorted OHLCV bars into weeks ('W', ending Sunday) or
+        calendar months ('M'), labeled by period end.
+
+        Equivalent to ``df.resample(freq).agg(...).dropna()``, but each bar's
+        period end is computed directly and the runs of equal periods are
+        reduced with ufunc.reduceat, so no empty bins are ever built.
+        Data already at the requested granularity (one bar per period,
+        stamped with its period end) is returned as is.
+        """
+        if len(df) == 0:
+            return df
+
+        days = df.index.values.astype('datetime64[D]')
+        if freq == 'W':
+            # 1970-01-01 was a Thursday; weekday 0 is Monday
+            weekday = (days.astype(np.int64) + 3) % 7
+            labels = days + (6 - weekday)
+        else:
+            labels = (days.astype('datetime64[M]') + 1).astype('datetime64[D]') - 1
+
+        starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+        if len(starts) == len(df) and np.array_equal(labels, df.index.values):
+            return df
+        ends = np.append(starts[1:], len(df)) - 1
+
+        return pd.DataFrame(
+            {
+                'Open': df['Open'].to_numpy()[starts],
+                'High': np.maximum.reduceat(df['High'].to_numpy(), starts),
+                'Low': np.minimum.reduceat(df['Low'].to_numpy(), starts),
+                'Close': df['Close'].to_numpy()[ends],
+                'Volume': np.add.reduceat(df['Volume'].to_numpy(), starts),
+            },
+            index=pd.DatetimeIndex(labels[starts], name=df.index.name).as_unit(df.index.unit),
+        )
+
+    def _volume_colors(self, df: pd.DataFrame) -> np.ndarray:
+        """Per-bar volume colors: green on up bars, red on down bars."""
+        return np.where(df['Close'].to_numpy() >= df['Open'].to_numpy(), '#26a69a', '#ef5350')
+
+    def _visual_downsample(self, df: pd.DataFrame, max_points: int) -> pd.DataFrame:
+        """
+        Merge consecutive bars into equal-count buckets so that at most
+        max_points candles are drawn.
+
+        Each bucket keeps its first open, highest high, lowest low, last close
+        and total volume, so extremes and endpoints survive; it is placed at
+        its first bar's timestamp.
+        """
+        n = len(df)
+        if n <= max_points:
+            return df
+
+        size = -(-n // max_points)
+        starts = np.arange(0, n, size)
+        ends = np.append(starts[1:], n) - 1
+
+        return pd.DataFrame(
+            {
+                'Open': df['Open'].to_numpy()[starts],
+                'High': np.maximum.reduceat(df['High'].to_numpy(), starts),
+                'Low': np.minimum.reduceat(df['Low'].to_numpy(), starts),
+                'Close': df['Close'].to_numpy()[ends],
+                'Volume': np.add.reduceat(df['Volume'].to_numpy(), starts),
+            },
+            index=df.index[starts],
+        )
+
     def _add_patterns(self, fig: go.Figure, patterns: List[Dict], df: pd.DataFrame):
-        """Add AIv3 consolidation patterns to the chart."""
+        """
+        Add AIv3 consolidation patterns to the chart.
+
+        Shading and power-boundary lines are collected as layout dicts and
+        set in one layout update.
+        """
+        last_date = df.index[-1]
+        shapes: List[dict] = []
+        annotations: List[dict] = []
+
         for pattern in patterns:
             if pattern.get('phase') == 'ACTIVE':
                 # Add shaded region for consolidation
-                fig.add_shape(
+                shapes.append(dict(
                     type="rect",
-                    x0=pattern.get('start_date'),
-                    x1=df.index[-1],
-                    y0=pattern.get('lower_boundary'),
-                    y1=pattern.get('upper_boundary'),
+                    xref="x", x0=pattern.get('start_date'), x1=last_date,
+                    yref="y", y0=pattern.get('lower_boundary'), y1=pattern.get('upper_boundary'),
                     fillcolor="LightBlue",
                     opacity=0.2,
                     layer="below",
-                    line_width=0,
-                    row=1, col=1
-                )
+                    line=dict(width=0),
+                ))
 
                 # Add power boundary line
                 if pattern.get('power_boundary'):
-                    fig.add_hline(
-                        y=pattern['power_boundary'],
-                        line_dash="dash",
-                        line_color="gold",
-                        annotation_text="Power Breakout",
-                        row=1, col=1
-                    )
-
-    def _add_indicators(self, fig: go.Figure, indicators: Dict[str, List[float]],
-                       df: pd.DataFrame):
-        """Add technical indicators to the chart."""
+                    power = pattern['power_boundary']
+                    shapes.append(dict(
+                        type="line",
+                        xref="x domain", x0=0, x1=1,
+                        yref="y", y0=power, y1=power,
+                        line=dict(color="gold", dash="dash"),
+                    ))
+                    annotations.append(dict(
+                        text="Power Breakout", showarrow=False,
+                        xref="x domain", x=1, xanchor="right",
+                        yref="y", y=power, yanchor="bottom",
+                    ))
+
+        fig.update_layout(
+            shapes=list(fig.layout.shapes) + shapes,
+            annotations=list(fig.layout.annotations) + annotations
+        )
+
+    def _add_indicators(self, fig: go.Figure, indicators: Dict[str, Optional[Sequence[float]]],
+                       df: pd.DataFrame, df_history: Optional[pd.DataFrame] = None):
+        """
+        Add technical indicators to the chart.
+
+        Indicators mapped to None are computed from the closes of
+        df_history (the full-history aggregation df is the tail of, so the
+        warm-up falls before the charted span) with the running-sum and
+        Wilder kernels; every indicator is charted over df's last bars.
+        """
+        from stockgpt.infrastructure.data import _indicators as ind
+
+        if df_history is None:
+            df_history = df
+        closes = df_history['Close'].to_numpy(dtype=np.float64)
+
         # Add to main price chart (row 1)
         if 'sma_20' in indicators:
             fig.add_trace(
                 go.Scatter(
                     x=df.index,
-                    y=indicators['sma_20'],
+                    y=self._indicator_values(indicators['sma_20'], lambda: ind.rolling_mean(closes, 20))[-len(df):],
                     name='SMA(20)',
                     line=dict(color='orange', width=1)
                 ),
@@ -306,7 +577,7 @@ class TemporalChart:
             fig.add_trace(
                 go.Scatter(
                     x=df.index,
-                    y=indicators['sma_50'],
+                    y=self._indicator_values(indicators['sma_50'], lambda: ind.rolling_mean(closes, 50))[-len(df):],
                     name='SMA(50)',
                     line=dict(color='blue', width=1)
                 ),
@@ -318,26 +589,36 @@ class TemporalChart:
             fig.add_trace(
                 go.Scatter(
                     x=df.index,
-                    y=indicators['rsi'],
+                    y=self._indicator_values(indicators['rsi'], lambda: ind.rsi_series(closes, 14))[-len(df):],
                     name='RSI(14)',
                     line=dict(color='purple', width=2)
                 ),
                 row=3, col=1
             )
 
+    def _indicator_values(self,
+                          values: Optional[Sequence[float]],
+                          compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Given indicator values as an array, or computed ones if None."""
+        if values is None:
+            return compute()
+        return np.asarray(values, dtype=np.float64)
+
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate RSI indicator."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-
-    def _get_volume_unit(self) -> str:
-        """Get appropriate volume unit based on timeframe."""
-        agg = self.current_timeframe.volume_aggregation
+        """Calculate RSI indicator with Wilder's smoothing (NaN during warm-up)."""
+        # Imported on first use: the kernels load scipy.signal, which would
+        # otherwise dominate the import time of this module
+        from stockgpt.infrastructure.data import _indicators as ind
+
+        return pd.Series(
+            ind.rsi_series(prices.to_numpy(dtype=np.float64), period),
+            index=prices.index,
+            name=prices.name,
+        )
+
+    def _get_volume_unit(self, timeframe: Optional[TimeFrame] = None) -> str:
+        """Get appropriate volume unit based on timeframe (the current one by default)."""
+        agg = (timeframe or self.current_timeframe).volume_aggregation
         units = {
             'hourly': 'Hourly',
             'daily': 'Daily',
@@ -347,22 +628,28 @@ class TemporalChart:
         return units.get(agg, 'Daily')
 
     def _create_timeframe_buttons(self) -> List[Dict]:
-        """Create buttons for timeframe selection."""
-        buttons = []
-        for key, tf in self.TIMEFRAMES.items():
-            buttons.append(
-                dict(
-                    label=key,
-                    method="relayout",
-                    args=[{"title": f"Chart - {tf.name}"}]
-                )
-            )
-        return buttons
+        """Create buttons for timeframe selection, each jumping to its frame."""
+        return list(self._TIMEFRAME_BUTTONS)
 
     def save_chart(self, filename: str = "chart.html"):
-        """Save the chart as an interactive HTML file."""
+        """
+        Save the chart as an interactive HTML file, plus a gzipped copy
+        (filename + '.gz') for serving.
+
+        plotly.js is loaded from the CDN rather than inlined into every file,
+        and the figure is not re-validated since its traces are built here.
+        """
         if self.fig:
-            self.fig.write_html(filename)
+            html = pio.to_html(self.fig,
+                               include_plotlyjs='cdn',
+                               full_html=True,
+                               validate=False,
+                               div_id='chart',
+                               config={'responsive': True})
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(html)
+            with gzip.open(filename + '.gz', 'wt', encoding='utf-8') as f:
+                f.write(html)
             print(f"Chart saved to {filename}")
 
     def show_chart(self):
@@ -386,7 +673,6 @@ async def create_temporal_chart(symbol: str,
         Plotly Figure object
     """
     from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
-    from aiv3.core.consolidation_tracker import ConsolidationTracker
 
     # Get market data
     provider = EnhancedMarketProvider()
@@ -399,18 +685,7 @@ async def create_temporal_chart(symbol: str,
         raise ValueError(f"No price data found for {symbol}")
 
     # Detect patterns if requested
-    patterns = []
-    if show_patterns and len(prices) >= 60:
-        tracker = ConsolidationTracker(symbol)
-        pattern = tracker.update(prices)
-        if pattern and pattern.phase.value == "ACTIVE":
-            patterns.append({
-                'phase': pattern.phase.value,
-                'start_date': prices[-pattern.qualification_days].date if pattern.qualification_days > 0 else prices[0].date,
-                'lower_boundary': pattern.lower_boundary,
-                'upper_boundary': pattern.upper_boundary,
-                'power_boundary': pattern.power_boundary
-            })
+    patterns = _detect_patterns(symbol, prices) if show_patterns else []
 
     # Create chart
     chart = TemporalChart()
@@ -424,6 +699,87 @@ async def create_temporal_chart(symbol: str,
     return fig
 
 
+async def create_temporal_charts(symbol: str,
+                                timeframes: List[str],
+                                show_patterns: bool = True,
+                                provider=None) -> Dict[str, go.Figure]:
+    """
+    Create temporal charts for several timeframes of one symbol.
+
+    Prices are fetched once for the longest timeframe and sliced for the
+    others; the charts are then built off the event loop by one
+    TemporalChart, so timeframes sharing a span or aggregation reuse its
+    DataFrame and resampling.
+
+    Args:
+        symbol: Stock symbol
+        timeframes: Timeframes (1D, 5D, 1M, 3M, 6M, 1Y, 5Y)
+        show_patterns: Whether to overlay AIv3 patterns
+        provider: Market data provider to fetch from (and share its cache);
+            a new EnhancedMarketProvider when omitted
+
+    Returns:
+        Dictionary mapping each timeframe to its Plotly Figure
+    """
+    if provider is None:
+        from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
+        provider = EnhancedMarketProvider()
+
+    # Calendar days each timeframe fetches on its own
+    spans = {
+        key: max(TemporalChart.TIMEFRAMES.get(key, TemporalChart.TIMEFRAMES['3M']).days, 100)
+        for key in timeframes
+    }
+    all_prices = await provider.get_prices(symbol, days=max(spans.values()))
+
+    if not all_prices:
+        raise ValueError(f"No price data found for {symbol}")
+
+    def build() -> Dict[str, go.Figure]:
+        chart = TemporalChart()
+        today = datetime.now().date()
+        slices: Dict[int, Tuple[List[Price], List[Dict]]] = {}
+        figures = {}
+        for key, span in spans.items():
+            if span not in slices:
+                start = today - timedelta(days=span)
+                prices = [p for p in all_prices if p.date >= start]
+                patterns = _detect_patterns(symbol, prices) if show_patterns else []
+                slices[span] = (prices, patterns)
+
+            prices, patterns = slices[span]
+            if not prices:
+                raise ValueError(f"No price data found for {symbol} ({key})")
+            figures[key] = chart.create_chart(
+                prices=prices,
+                symbol=symbol,
+                timeframe=key,
+                patterns=patterns
+            )
+        return figures
+
+    return await asyncio.to_thread(build)
+
+
+def _detect_patterns(symbol: str, prices: List[Price]) -> List[Dict]:
+    """Active AIv3 consolidation pattern at the end of prices, as overlay dicts."""
+    from aiv3.core.consolidation_tracker import ConsolidationTracker
+
+    patterns = []
+    if len(prices) >= 60:
+        tracker = ConsolidationTracker(symbol)
+        pattern = tracker.update(prices)
+        if pattern and pattern.phase.value == "ACTIVE":
+            patterns.append({
+                'phase': pattern.phase.value,
+                'start_date': prices[-pattern.qualification_days].date if pattern.qualification_days > 0 else prices[0].date,
+                'lower_boundary': pattern.lower_boundary,
+                'upper_boundary': pattern.upper_boundary,
+                'power_boundary': pattern.power_boundary
+            })
+    return patterns
+
+
 if __name__ == "__main__":
     # Example usage
     async def test_chart():
@@ -442,9 +798,10 @@ if __name__ == "__main__":
             print("Open 'aapl_temporal_chart.html' to view the interactive chart")
 
             # Test different timeframes
-            for tf in ['1D', '5D', '1M', '6M', '1Y']:
-                print(f"\nTesting {tf} timeframe...")
-                fig = await create_temporal_chart("MSFT", timeframe=tf)
+            timeframes = ['1D', '5D', '1M', '6M', '1Y']
+            print(f"\nTesting {', '.join(timeframes)} timeframes...")
+            figures = await create_temporal_charts("MSFT", timeframes)
+            for tf in figures:
                 print(f"[OK] {tf} chart created")
 
         except Exception as e:
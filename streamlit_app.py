@@ -7,12 +7,20 @@ Deploy for free on Streamlit Community Cloud, Render, or Railway.
 
 import streamlit as st
 import asyncio
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from plotly.subplots import make_subplots
+from datetime import datetime, timedelta, timezone
 import os
+import threading
+from operator import attrgetter
 from typing import List, Optional
 
+from aiv3.core.consolidation_tracker import ConsolidationTracker
+from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
+
 # Configure page
 st.set_page_config(
     page_title="StockGPT Pattern Analyzer",
@@ -39,53 +47,179 @@ except:
         os.environ['FINNHUB_API_KEY'] = 'd2f75n1r01qj3egrhu7gd2f75n1r01qj3egrhu80'
 
 
-# Cache data fetching to minimize API calls
-@st.cache_data(ttl=900)  # Cache for 15 minutes
-def fetch_market_data(symbol: str, days: int = 100):
-    """Fetch market data with caching."""
-    from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
+@st.cache_resource
+def get_provider():
+    """Market data provider shared by all sessions and reruns."""
+    return EnhancedMarketProvider()
 
-    async def get_data():
-        provider = EnhancedMarketProvider()
-        prices = await provider.get_prices(symbol, days=days)
-        return prices
 
-    return asyncio.run(get_data())
+@st.cache_resource
+def get_system():
+    """Breakout prediction system shared by all sessions and reruns."""
+    # Imported on first use: the module sets API keys and logging on import
+    from setup_breakout_system import BreakoutPredictionSystem
 
+    return BreakoutPredictionSystem()
 
-@st.cache_data(ttl=900)
-def detect_patterns(symbol: str):
-    """Detect patterns in stock data."""
-    from aiv3.core.consolidation_tracker import ConsolidationTracker
 
-    prices = fetch_market_data(symbol, days=200)
-    if not prices or len(prices) < 60:
-        return None, prices
+@st.cache_resource
+def get_loop():
+    """Long-lived event loop, run in a background thread, for all async work."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+def iterate_async(agen):
+    """Iterate an async generator on the shared event loop, item by item."""
+    while True:
+        try:
+            yield run_async(agen.__anext__())
+        except StopAsyncIteration:
+            return
+
+
+def market_date() -> str:
+    """Today's UTC date."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def cache_slot() -> str:
+    """Start of the current 15-minute UTC slot, the key under which market data is cached."""
+    return pd.Timestamp.now(tz='UTC').floor('15min').isoformat()
 
-    tracker = ConsolidationTracker(symbol)
-    pattern = tracker.update(prices)
-    return pattern, prices
 
+# Price fields, in the order of the _price_bars arrays
+_PRICE_FIELDS = attrgetter('date', 'open', 'high', 'low', 'close', 'volume')
 
-def create_price_chart(prices, symbol: str, pattern=None):
-    """Create interactive price chart with pattern overlay."""
+
+def _price_bars(prices) -> Optional[tuple]:
+    """
+    Convert prices to a (dates, opens, highs, lows, closes, volumes) tuple.
+
+    One array per field, so the cached data functions walk the Price objects
+    once and charts reuse the arrays; None when there are no prices.
+    """
     if not prices:
         return None
 
-    # Convert to DataFrame
-    df = pd.DataFrame([{
-        'Date': pd.to_datetime(p.date),
-        'Open': p.open,
-        'High': p.high,
-        'Low': p.low,
-        'Close': p.close,
-        'Volume': p.volume
-    } for p in prices])
-    df.set_index('Date', inplace=True)
+    dates, opens, highs, lows, closes, volumes = zip(*map(_PRICE_FIELDS, prices))
+    return (
+        pd.DatetimeIndex(pd.to_datetime(list(dates)), name='Date'),
+        np.asarray(opens, dtype=np.float64),
+        np.asarray(highs, dtype=np.float64),
+        np.asarray(lows, dtype=np.float64),
+        np.asarray(closes, dtype=np.float64),
+        np.asarray(volumes, dtype=np.int64),
+    )
+
+
+# Cache data fetching to minimize API calls; persisted to disk so cached bars
+# survive restarts, and keyed on a 15-minute slot so each slot fetches fresh
+# data. Empty fetches raise, so a failed or rate-limited fetch is not cached.
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def fetch_market_data(symbol: str, days: int = 100, cache_slot: Optional[str] = None):
+    """
+    Fetch market data with caching (pass cache_slot=cache_slot()).
+
+    Raises:
+        ValueError: If no prices were returned
+    """
+    prices = run_async(get_provider().get_prices(symbol, days=days))
+    if not prices:
+        raise ValueError(f"No price data for {symbol}")
+    return prices
+
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def detect_patterns(symbol: str, cache_slot: Optional[str] = None):
+    """
+    Detect patterns in stock data (pass cache_slot=cache_slot()).
+
+    Returns the pattern, or None, and the price arrays from _price_bars.
+
+    Raises:
+        ValueError: If no prices were returned
+    """
+    prices = fetch_market_data(symbol, days=200, cache_slot=cache_slot)
+    if len(prices) < 60:
+        return None, _price_bars(prices)
+
+    # A fresh tracker per call: trackers carry phase state from one update to
+    # the next, so a shared per-symbol instance would drift between reruns
+    tracker = ConsolidationTracker(symbol)
+    pattern = tracker.update(prices)
+    return pattern, _price_bars(prices)
+
+
+async def _technical_bundle(symbol: str, days: int):
+    """Technical features and price history of a symbol, fetched concurrently."""
+    provider = get_provider()
+    features, prices = await asyncio.gather(
+        provider.get_technical_features(symbol),
+        provider.get_prices(symbol, days=days)
+    )
+    return features, _price_bars(prices)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def fetch_technical_bundle(symbol: str, days: int = 100):
+    """Fetch technical features and price arrays together, cached for 15 minutes."""
+    return run_async(_technical_bundle(symbol, days))
+
+
+# Charts with more bars than this are drawn from CHART_TARGET_BARS merged bars
+CHART_MAX_BARS = 800
+CHART_TARGET_BARS = 500
+
+# Volume of charts with at least this many bars is drawn as a WebGL area
+CHART_GL_VOLUME_BARS = 500
 
-    # Create figure with subplots
-    from plotly.subplots import make_subplots
 
+# Pattern overlay styles; create_price_chart fills in the coordinates
+_PATTERN_RECT = dict(
+    type="rect", fillcolor="rgba(255, 215, 0, 0.1)", line=dict(width=0), row=1, col=1
+)
+_UPPER_HLINE = dict(line_dash="dash", line_color="red", opacity=0.6, row=1, col=1)
+_LOWER_HLINE = dict(line_dash="dash", line_color="green", opacity=0.6, row=1, col=1)
+_TARGET_HLINE = dict(line_dash="dot", line_color="gold", opacity=0.8, row=1, col=1)
+
+
+def _bucket_ohlc(bars: tuple, target: int = CHART_TARGET_BARS) -> tuple:
+    """
+    Merge consecutive bars into equal-count buckets, at most target of them.
+
+    bars is a (dates, opens, highs, lows, closes, volumes) tuple of arrays.
+    Each bucket keeps its first open, highest high, lowest low, last close
+    and total volume, so price extremes survive; it is placed at its first
+    bar's date.
+    """
+    dates, opens, highs, lows, closes, volumes = bars
+    n = len(dates)
+    if n <= target:
+        return bars
+
+    size = -(-n // target)
+    starts = np.arange(0, n, size)
+    ends = np.append(starts[1:], n) - 1
+
+    return (
+        dates[starts],
+        opens[starts],
+        np.maximum.reduceat(highs, starts),
+        np.minimum.reduceat(lows, starts),
+        closes[ends],
+        np.add.reduceat(volumes, starts),
+    )
+
+
+def _price_chart_skeleton(symbol: str, gl_volume: bool):
+    """Build the subplots, empty traces and static layout of a price chart."""
     fig = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
@@ -94,14 +228,8 @@ def create_price_chart(prices, symbol: str, pattern=None):
         subplot_titles=(f'{symbol} Price', 'Volume')
     )
 
-    # Add candlestick chart
     fig.add_trace(
         go.Candlestick(
-            x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
             name='Price',
             increasing_line_color='#26a69a',
             decreasing_line_color='#ef5350'
@@ -109,97 +237,143 @@ def create_price_chart(prices, symbol: str, pattern=None):
         row=1, col=1
     )
 
+    # Volume bars, or a WebGL area for long histories
+    if gl_volume:
+        volume_trace = go.Scattergl(
+            name='Volume',
+            mode='lines',
+            fill='tozeroy',
+            line=dict(color='rgba(38, 166, 154, 0.5)', width=1)
+        )
+    else:
+        volume_trace = go.Bar(name='Volume', opacity=0.5)
+    fig.add_trace(volume_trace, row=2, col=1)
+
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        xaxis_rangeslider_visible=False,
+        margin=dict(l=0, r=0, t=30, b=0),
+        # Keep zoom and pan across reruns for the same symbol
+        uirevision=f'vol_{symbol}'
+    )
+    return fig
+
+
+def create_price_chart(bars, symbol: str, pattern=None):
+    """Create interactive price chart with pattern overlay from _price_bars arrays."""
+    if not bars:
+        return None
+    dates = bars[0]
+
+    # Long histories are drawn from merged bars; the pattern overlay keeps dates
+    if len(dates) > CHART_MAX_BARS:
+        bars = _bucket_ohlc(bars)
+    bar_dates, bar_opens, bar_highs, bar_lows, bar_closes, bar_volumes = bars
+
+    # Reuse this session's figure skeleton and only swap its data
+    gl_volume = len(bar_dates) >= CHART_GL_VOLUME_BARS
+    key = ('price_chart', symbol, gl_volume)
+    fig = st.session_state.get(key)
+    if fig is None:
+        fig = st.session_state[key] = _price_chart_skeleton(symbol, gl_volume)
+
+    with fig.batch_update():
+        fig.data[0].update(
+            x=bar_dates,
+            open=bar_opens,
+            high=bar_highs,
+            low=bar_lows,
+            close=bar_closes
+        )
+        fig.data[1].update(x=bar_dates, y=bar_volumes)
+        if not gl_volume:
+            fig.data[1].marker.color = np.where(bar_closes >= bar_opens, '#26a69a', '#ef5350')
+
+        # Drop the previous overlay, keeping the subplot title annotations
+        if fig.layout.shapes:
+            fig.layout.shapes = ()
+            fig.layout.annotations = fig.layout.annotations[:2]
+        fig.layout.template = 'plotly_dark' if st.session_state.get('dark_mode', False) else 'plotly_white'
+
     # Add pattern overlay if detected
     if pattern and hasattr(pattern, 'phase') and pattern.phase.value == "ACTIVE":
         # Add shaded region for consolidation
         fig.add_shape(
-            type="rect",
-            x0=df.index[-pattern.qualification_days] if pattern.qualification_days > 0 else df.index[0],
-            x1=df.index[-1],
+            x0=dates[-pattern.qualification_days] if pattern.qualification_days > 0 else dates[0],
+            x1=dates[-1],
             y0=pattern.lower_boundary,
             y1=pattern.upper_boundary,
-            fillcolor="rgba(255, 215, 0, 0.1)",
-            line=dict(width=0),
-            row=1, col=1
+            **_PATTERN_RECT
         )
 
         # Add boundary lines
         fig.add_hline(
             y=pattern.upper_boundary,
-            line_dash="dash",
-            line_color="red",
-            opacity=0.6,
             annotation_text=f"Upper: ${pattern.upper_boundary:.2f}",
-            row=1, col=1
+            **_UPPER_HLINE
         )
 
         fig.add_hline(
             y=pattern.lower_boundary,
-            line_dash="dash",
-            line_color="green",
-            opacity=0.6,
             annotation_text=f"Lower: ${pattern.lower_boundary:.2f}",
-            row=1, col=1
+            **_LOWER_HLINE
         )
 
         fig.add_hline(
             y=pattern.power_boundary,
-            line_dash="dot",
-            line_color="gold",
-            opacity=0.8,
             annotation_text=f"Target: ${pattern.power_boundary:.2f}",
-            row=1, col=1
+            **_TARGET_HLINE
         )
 
-    # Add volume bars
-    colors = ['#26a69a' if c >= o else '#ef5350'
-              for c, o in zip(df['Close'], df['Open'])]
-
-    fig.add_trace(
-        go.Bar(
-            x=df.index,
-            y=df['Volume'],
-            name='Volume',
-            marker_color=colors,
-            opacity=0.5
-        ),
-        row=2, col=1
-    )
+    return fig
 
-    # Update layout
-    fig.update_layout(
-        height=600,
-        showlegend=False,
-        xaxis_rangeslider_visible=False,
-        template='plotly_dark' if st.session_state.get('dark_mode', False) else 'plotly_white',
-        margin=dict(l=0, r=0, t=30, b=0)
-    )
 
-    return fig
+# Signal card border and title color per action
+_SIGNAL_COLORS = {
+    'STRONG_BUY': '#00ff00',
+    'BUY': '#90ee90',
+    'HOLD': '#ffff00',
+    'SELL': '#ffa500',
+    'STRONG_SELL': '#ff0000'
+}
 
 
 def create_signal_card(signal):
     """Create a card display for a signal."""
-    color_map = {
-        'STRONG_BUY': '#00ff00',
-        'BUY': '#90ee90',
-        'HOLD': '#ffff00',
-        'SELL': '#ffa500',
-        'STRONG_SELL': '#ff0000'
-    }
-
-    color = color_map.get(signal.get('action', 'HOLD'), '#808080')
+    action = signal.get('action', 'HOLD')
+    color = _SIGNAL_COLORS.get(action, '#808080')
+    price = signal.get('price', 0)
+    rsi = signal.get('rsi', 0)
+    reason = signal.get('reason', 'N/A')
 
     return f"""
     <div style="border: 2px solid {color}; border-radius: 10px; padding: 15px; margin: 10px 0;">
-        <h4 style="color: {color}; margin: 0;">{signal.get('symbol')} - {signal.get('action')}</h4>
-        <p><b>Price:</b> ${signal.get('price', 0):.2f}</p>
-        <p><b>RSI:</b> {signal.get('rsi', 0):.1f}</p>
-        <p><b>Reason:</b> {signal.get('reason', 'N/A')}</p>
+        <h4 style="color: {color}; margin: 0;">{signal.get('symbol')} - {action}</h4>
+        <p><b>Price:</b> ${price:.2f}</p>
+        <p><b>RSI:</b> {rsi:.1f}</p>
+        <p><b>Reason:</b> {reason}</p>
     </div>
     """
 
 
+def format_scan_status(symbol: str, status) -> str:
+    """One markdown line describing a symbol's breakout scan result."""
+    if isinstance(status, Exception):
+        return f"⚠️ **{symbol}** - scan failed: {status}"
+    if status is None:
+        return f"**{symbol}** - not enough data"
+    if status.get('breakout_ready'):
+        return (f"🎯 **{symbol}** - breakout pattern, range "
+                f"\\${status['lower_boundary']:.2f} - \\${status['upper_boundary']:.2f}, "
+                f"target \\${status['power_boundary']:.2f}")
+    if status['phase'] == "QUALIFYING":
+        return f"👀 **{symbol}** - pattern forming ({status['qualification_days']}/10 days)"
+    if status['phase'] is None:
+        return f"**{symbol}** - no pattern detected"
+    return f"**{symbol}** - pattern {status['phase']}"
+
+
 # Main app
 def main():
     st.title("📊 StockGPT Pattern Analyzer")
@@ -259,7 +433,12 @@ def main():
         col1, col2, col3 = st.columns(3)
 
         with st.spinner("Detecting patterns..."):
-            pattern, prices = detect_patterns(symbol)
+            try:
+                pattern, bars = detect_patterns(symbol, cache_slot=cache_slot())
+            except ValueError:
+                # Not cached, so the next rerun fetches again
+                st.error(f"Could not fetch price data for {symbol}")
+                pattern, bars = None, None
 
         if pattern:
             # Display pattern metrics
@@ -290,8 +469,8 @@ def main():
             st.warning(f"No active patterns detected for {symbol}")
 
         # Display chart
-        if prices:
-            fig = create_price_chart(prices, symbol, pattern if show_patterns else None)
+        if bars:
+            fig = create_price_chart(bars, symbol, pattern if show_patterns else None)
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
 
@@ -309,14 +488,8 @@ def main():
 
         if st.button("Generate Signals", type="primary"):
             with st.spinner("Generating signals..."):
-                from setup_breakout_system import BreakoutPredictionSystem
-
-                async def get_signals():
-                    system = BreakoutPredictionSystem()
-                    results = await system.get_realtime_signals(symbols)
-                    return results
-
-                results = asyncio.run(get_signals())
+                system = get_system()
+                results = run_async(system.get_realtime_signals(symbols, provider=get_provider()))
 
                 if results and 'signals' in results:
                     signals = results['signals']
@@ -342,52 +515,47 @@ def main():
 
         if st.button("Scan for Breakouts", type="primary"):
             with st.spinner("Scanning for breakout patterns..."):
-                from setup_breakout_system import BreakoutPredictionSystem
-
-                async def scan():
-                    system = BreakoutPredictionSystem()
-                    results = await system.scan_for_breakouts(watchlist)
-                    return results
-
-                results = asyncio.run(scan())
-
-                if results and 'breakout_candidates' in results:
-                    candidates = results['breakout_candidates']
-
-                    if candidates:
-                        st.success(f"Found {len(candidates)} breakout candidates!")
-
-                        # Display candidates in a table
-                        df_candidates = pd.DataFrame(candidates)
-                        st.dataframe(
-                            df_candidates,
-                            use_container_width=True,
-                            hide_index=True
-                        )
-                    else:
-                        st.info("No immediate breakout candidates found. Continue monitoring.")
-
-                    # Show summary metrics
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Symbols Scanned", results.get('scanned', 0))
-                    with col2:
-                        st.metric("Patterns Found", len(candidates))
-                    with col3:
-                        st.metric("Scan Date", results.get('timestamp', 'N/A'))
+                # One placeholder per symbol, filled as soon as its scan
+                # finishes rather than after the whole watchlist
+                placeholders = {sym: st.empty() for sym in watchlist}
+                for sym, placeholder in placeholders.items():
+                    placeholder.caption(f"Scanning {sym}...")
+
+                system = get_system()
+                candidates = []
+                for sym, status in iterate_async(system.iter_breakout_scan(watchlist, provider=get_provider())):
+                    placeholders[sym].markdown(format_scan_status(sym, status))
+                    if isinstance(status, dict) and status.get('breakout_ready'):
+                        candidates.append(status)
+                candidates.sort(key=lambda status: watchlist.index(status['symbol']))
+
+                if candidates:
+                    st.success(f"Found {len(candidates)} breakout candidates!")
+
+                    # Display candidates in a table, as the Arrow table Streamlit sends
+                    table_candidates = pa.Table.from_pylist(candidates)
+                    st.dataframe(
+                        table_candidates,
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                else:
+                    st.info("No immediate breakout candidates found. Continue monitoring.")
+
+                # Show summary metrics
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Symbols Scanned", len(watchlist))
+                with col2:
+                    st.metric("Patterns Found", len(candidates))
+                with col3:
+                    st.metric("Scan Date", market_date())
 
     elif analysis_type == "Technical Analysis":
         st.header(f"Technical Analysis: {symbol}")
 
         with st.spinner("Calculating indicators..."):
-            from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
-
-            async def get_technicals():
-                provider = EnhancedMarketProvider()
-                features = await provider.get_technical_features(symbol)
-                return features
-
-            features = asyncio.run(get_technicals())
+            features, bars = fetch_technical_bundle(symbol, timeframe_days)
 
         if features:
             # Display technical indicators
@@ -414,9 +582,8 @@ def main():
                 st.metric("20D Change", f"{features.get('price_change_20d', 0):.2f}%")
 
             # Display chart
-            prices = fetch_market_data(symbol, timeframe_days)
-            if prices:
-                fig = create_price_chart(prices, symbol)
+            if bars:
+                fig = create_price_chart(bars, symbol)
                 if fig:
                     st.plotly_chart(fig, use_container_width=True)
         else:
@@ -4,9 +4,11 @@ Shows what's working and what needs to be done
 """
 
 import sys
-# Set encoding to UTF-8
-import io
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# Set encoding to UTF-8, in place (captured streams may not support it)
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass
 
 import asyncio
 import os
@@ -44,21 +46,32 @@ async def check_system():
         from stockgpt.infrastructure.data.market_data_provider import MarketDataProvider
         provider = MarketDataProvider()
 
-        # Test connection
-        connected = await provider.check_connection()
+        # Test connection, fetch a real price and get technical indicators;
+        # the probes are independent, so run them concurrently
+        connected, prices, features = await asyncio.gather(
+            provider.check_connection(),
+            provider.get_prices("AAPL", days=5),
+            provider.get_technical_features("SPY"),
+            return_exceptions=True
+        )
+        if isinstance(connected, Exception):
+            raise connected
+
         if connected:
             print("[OK] Market data provider connected (Yahoo Finance)")
 
-            # Fetch real price
-            prices = await provider.get_prices("AAPL", days=5)
-            if prices:
+            if isinstance(prices, Exception):
+                print(f"[X] Error with market data: {prices}")
+                results["needs_setup"].append("Market data provider")
+            elif prices:
                 latest = prices[-1]
                 print(f"[OK] Real-time data working: AAPL ${latest.close:.2f}")
                 results["working"].append("Real market data")
 
-            # Get technical indicators
-            features = await provider.get_technical_features("SPY")
-            if features:
+            if isinstance(features, Exception):
+                print(f"[X] Error with technical indicators: {features}")
+                results["needs_setup"].append("Technical analysis")
+            elif features:
                 print(f"[OK] Technical indicators: RSI={features.get('rsi_14', 0):.2f}")
                 results["working"].append("Technical analysis")
         else:
@@ -20,31 +20,35 @@ async def quick_test():
 
     provider = EnhancedMarketProvider()
 
+    # The three probes are independent; fetch them concurrently
+    price, prices, stock = await asyncio.gather(
+        provider.get_latest_price("AAPL"),
+        provider.get_prices("MSFT", days=5),
+        provider._fetch_stock_info("TSLA")
+    )
+
     # Test 1: Real-time quote (Finnhub)
     print("\n1. REAL-TIME QUOTE (Finnhub):")
-    price = await provider.get_latest_price("AAPL")
     if price:
         print(f"   AAPL: ${price.close:.2f}")
         print(f"   Range: ${price.low:.2f} - ${price.high:.2f}")
 
     # Test 2: Historical data (Twelve Data or Alpha Vantage)
     print("\n2. HISTORICAL DATA (Twelve Data/Alpha Vantage):")
-    prices = await provider.get_prices("MSFT", days=5)
     if prices:
         print(f"   MSFT: {len(prices)} days fetched")
         print(f"   Latest: ${prices[-1].close:.2f} on {prices[-1].date}")
 
     # Test 3: Company profile (FMP)
     print("\n3. COMPANY PROFILE (FMP):")
-    stock = await provider._fetch_stock_info("TSLA")
     if stock:
         print(f"   {stock.symbol}: {stock.name}")
         print(f"   Sector: {stock.sector}")
 
     # Show API usage
     print("\n4. API USAGE:")
-    info = provider.get_provider_info()
-    for api, count in provider.api_usage.items():
+    usage, _ = provider.usage_snapshot()
+    for api, count in usage.items():
         if count > 0:
             print(f"   {api}: {count} calls")
 
@@ -6,129 +6,211 @@ and temporal context windows.
 """
 
 import asyncio
-import os
-from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
+import plotly.io as pio
 import logging
 
+# Serialize figure JSON with orjson (numpy arrays encoded in C)
+pio.json.config.default_engine = 'orjson'
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Set API keys
-os.environ['TWELVEDATA_API_KEY'] = '5361b6392f4941d99f08d14d22551cb2'
-os.environ['ALPHA_VANTAGE_API_KEY'] = 'FPG7DCR33BFK2HDP'
-os.environ['FMP_API_KEY'] = 'smkqs1APQJVN2JuJAxSDkEvk7tDdTdZm'
-os.environ['FINNHUB_API_KEY'] = 'd2f75n1r01qj3egrhu7gd2f75n1r01qj3egrhu80'
-
-
-async def test_pattern_visualization():
-    """Test the enhanced pattern visualization with real market data."""
 
+class _PriceMemo:
+    """
+    Wraps a market data provider so each (symbol, days) price fetch runs
+    once per test run; callers asking for the same prices concurrently
+    await the same fetch.
+    """
+
+    def __init__(self, provider):
+        self._provider = provider
+        self._fetches = {}
+        self._columns = {}
+
+    async def get_prices(self, symbol, days):
+        key = (symbol, days)
+        fetch = self._fetches.get(key)
+        if fetch is None:
+            fetch = self._fetches[key] = asyncio.ensure_future(
+                self._provider.get_prices(symbol, days=days)
+            )
+        try:
+            return await fetch
+        except Exception:
+            # Let a later call retry a failed fetch
+            self._fetches.pop(key, None)
+            raise
+
+    async def get_price_columns(self, symbol, days):
+        """Dates, highs and lows of get_prices(symbol, days) as NumPy arrays, built once."""
+        prices = await self.get_prices(symbol, days)
+        key = (symbol, days)
+        columns = self._columns.get(key)
+        if columns is None:
+            count = len(prices)
+            columns = self._columns[key] = {
+                'date': np.array([p.date for p in prices], dtype='datetime64[D]'),
+                'high': np.fromiter((p.high for p in prices), dtype=np.float64, count=count),
+                'low': np.fromiter((p.low for p in prices), dtype=np.float64, count=count),
+            }
+        return columns
+
+
+async def _save_html(fig, filename):
+    """
+    Write fig as HTML on a worker thread.
+
+    plotly.js is loaded from its CDN rather than embedded, which keeps
+    each file to its chart data instead of several megabytes.
+    """
+    await asyncio.to_thread(fig.write_html, filename, include_plotlyjs='cdn')
+
+
+async def _process_symbol(symbol, provider):
+    """
+    Analyze one symbol's patterns and save its overview and focused charts.
+
+    Returns the symbol's report lines, so that symbols processed
+    concurrently print in order.
+    """
     from stockgpt.visualization.pattern_chart import (
-        PatternChart, PatternPeriod,
         analyze_historical_patterns,
         create_pattern_analysis_chart
     )
-    from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
-
-    print("\n" + "="*70)
-    print("PATTERN CHART TESTING")
-    print("Subtle Highlighting + Temporal Context Windows")
-    print("="*70)
-
-    symbols_to_test = ["AAPL", "MSFT", "TSLA"]
 
-    for symbol in symbols_to_test:
-        print(f"\nAnalyzing {symbol}...")
+    lines = [f"\nAnalyzing {symbol}..."]
 
-        try:
-            # 1. Analyze historical patterns
-            patterns = await analyze_historical_patterns(symbol, lookback_days=365)
-
-            if patterns:
-                print(f"  Found {len(patterns)} patterns:")
-                for i, pattern in enumerate(patterns[:3]):  # Show first 3
-                    status = f"{pattern.outcome}"
-                    if pattern.gain_percentage:
-                        status += f" ({pattern.gain_percentage:.1f}% gain)"
-                    print(f"    Pattern {i+1}: {status}")
-                    print(f"      Period: {pattern.qualification_start} to {pattern.completion_date or 'ongoing'}")
-                    if pattern.breakout_date:
-                        print(f"      Breakout: {pattern.breakout_date}")
-
-                # 2. Create overview chart with all patterns
-                print(f"\n  Creating overview chart...")
-                fig_overview = await create_pattern_analysis_chart(
+    try:
+        # 1. Analyze historical patterns
+        patterns = await analyze_historical_patterns(symbol, lookback_days=365, provider=provider)
+
+        if patterns:
+            lines.append(f"  Found {len(patterns)} patterns:")
+            for i, pattern in enumerate(patterns[:3]):  # Show first 3
+                status = f"{pattern.outcome}"
+                if pattern.gain_percentage:
+                    status += f" ({pattern.gain_percentage:.1f}% gain)"
+                lines.append(f"    Pattern {i+1}: {status}")
+                lines.append(f"      Period: {pattern.qualification_start} to {pattern.completion_date or 'ongoing'}")
+                if pattern.breakout_date:
+                    lines.append(f"      Breakout: {pattern.breakout_date}")
+
+            # 2. Create overview chart with all patterns
+            lines.append(f"\n  Creating overview chart...")
+            fig_overview = await create_pattern_analysis_chart(
+                symbol,
+                show_all_patterns=True,
+                patterns=patterns,
+                provider=provider
+            )
+            filename_overview = f"{symbol.lower()}_patterns_overview.html"
+            await _save_html(fig_overview, filename_overview)
+            lines.append(f"  [OK] Saved: {filename_overview}")
+
+            # 3. Create focused chart for most recent successful pattern,
+            # searching from the newest
+            recent_success = next((p for p in reversed(patterns) if p.outcome == 'success'), None)
+            if recent_success:
+                lines.append(f"\n  Creating focused chart for successful pattern...")
+
+                # Check data availability: count the days after breakout;
+                # prices are date-sorted, so that is everything right of it
+                if recent_success.breakout_date:
+                    dates = (await provider.get_price_columns(symbol, days=500))['date']
+                    breakout = np.datetime64(recent_success.breakout_date, 'D')
+                    days_after_breakout = int(len(dates) - np.searchsorted(dates, breakout, side='right'))
+
+                    lines.append(f"    Data available: {days_after_breakout} days after breakout")
+                    if days_after_breakout < 100:
+                        lines.append(f"    Note: Only {days_after_breakout} days available (100 requested)")
+
+                fig_focused = await create_pattern_analysis_chart(
                     symbol,
-                    show_all_patterns=True
+                    pattern_id=recent_success.pattern_id,
+                    patterns=patterns,
+                    provider=provider
                 )
-                filename_overview = f"{symbol.lower()}_patterns_overview.html"
-                fig_overview.write_html(filename_overview)
-                print(f"  [OK] Saved: {filename_overview}")
-
-                # 3. Create focused chart for most recent successful pattern
-                successful_patterns = [p for p in patterns if p.outcome == 'success']
-                if successful_patterns:
-                    recent_success = successful_patterns[-1]
-                    print(f"\n  Creating focused chart for successful pattern...")
-
-                    # Check data availability
-                    provider = EnhancedMarketProvider()
-                    prices = await provider.get_prices(symbol, days=500)
-
-                    # Calculate how many days we have after breakout
-                    if recent_success.breakout_date:
-                        prices_df = {p.date: p for p in prices}
-                        days_after_breakout = 0
-                        for price in reversed(prices):
-                            if price.date > recent_success.breakout_date:
-                                days_after_breakout += 1
-
-                        print(f"    Data available: {days_after_breakout} days after breakout")
-                        if days_after_breakout < 100:
-                            print(f"    Note: Only {days_after_breakout} days available (100 requested)")
-
-                    fig_focused = await create_pattern_analysis_chart(
-                        symbol,
-                        pattern_id=recent_success.pattern_id
-                    )
-                    filename_focused = f"{symbol.lower()}_pattern_focused.html"
-                    fig_focused.write_html(filename_focused)
-                    print(f"  [OK] Saved: {filename_focused}")
-                else:
-                    print(f"  No successful patterns found to focus on")
-
+                filename_focused = f"{symbol.lower()}_pattern_focused.html"
+                await _save_html(fig_focused, filename_focused)
+                lines.append(f"  [OK] Saved: {filename_focused}")
             else:
-                print(f"  No patterns detected in {symbol}")
+                lines.append(f"  No successful patterns found to focus on")
+
+        else:
+            lines.append(f"  No patterns detected in {symbol}")
 
-        except Exception as e:
-            logger.error(f"Error analyzing {symbol}: {e}")
-            print(f"  [ERROR] {e}")
+    except Exception as e:
+        logger.error(f"Error analyzing {symbol}: {e}")
+        lines.append(f"  [ERROR] {e}")
+
+    return lines
+
+
+async def test_pattern_visualization():
+    """Test the enhanced pattern visualization with real market data."""
+
+    # Output is collected and printed once, so that it does not interleave
+    # with the concurrently running test's
+    report = []
+
+    from stockgpt.visualization.pattern_chart import PatternChart, PatternPeriod
+    from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
+
+    report.append("\n" + "="*70)
+    report.append("PATTERN CHART TESTING")
+    report.append("Subtle Highlighting + Temporal Context Windows")
+    report.append("="*70)
+
+    symbols_to_test = ["AAPL", "MSFT", "TSLA"]
+
+    # One provider for every symbol; the charts and the data check below
+    # reuse each fetch instead of going back to the APIs
+    provider = _PriceMemo(EnhancedMarketProvider())
+
+    # Symbols are independent: analyze them concurrently, report in order
+    results = await asyncio.gather(
+        *(_process_symbol(symbol, provider) for symbol in symbols_to_test),
+        return_exceptions=True
+    )
+    for symbol, result in zip(symbols_to_test, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error analyzing {symbol}: {result}")
+            report.append(f"\nAnalyzing {symbol}...\n  [ERROR] {result}")
+        else:
+            report.extend(result)
 
     # Test with a synthetic pattern for demonstration
-    print("\n" + "="*70)
-    print("SYNTHETIC PATTERN DEMONSTRATION")
-    print("="*70)
+    report.append("\n" + "="*70)
+    report.append("SYNTHETIC PATTERN DEMONSTRATION")
+    report.append("="*70)
 
     try:
-        provider = EnhancedMarketProvider()
         prices = await provider.get_prices("SPY", days=200)
 
         if prices and len(prices) > 150:
-            # Create a synthetic pattern for demonstration
-            today = pd.Timestamp.now()
+            # Create a synthetic pattern for demonstration, bounded by the
+            # range of the bar 40 days back
+            columns = await provider.get_price_columns("SPY", days=200)
+            high, low = float(columns['high'][-40]), float(columns['low'][-40])
+            # Lifecycle dates 60, 50, 30 and 0 days back, in one subtraction
+            qualification_start, active_start, breakout_date, completion_date = (
+                pd.Timestamp.now() - pd.to_timedelta([60, 50, 30, 0], unit='D')
+            )
             pattern = PatternPeriod(
                 symbol="SPY",
                 pattern_id="SPY_DEMO",
-                qualification_start=today - timedelta(days=60),
-                active_start=today - timedelta(days=50),
-                breakout_date=today - timedelta(days=30),
-                completion_date=today,
+                qualification_start=qualification_start,
+                active_start=active_start,
+                breakout_date=breakout_date,
+                completion_date=completion_date,
                 pattern_type='consolidation',
-                upper_boundary=prices[-40].high * 1.02,
-                lower_boundary=prices[-40].low * 0.98,
-                power_boundary=prices[-40].high * 1.025,
+                upper_boundary=high * 1.02,
+                lower_boundary=low * 0.98,
+                power_boundary=high * 1.025,
                 outcome='success',
                 gain_percentage=12.5
             )
@@ -142,70 +224,78 @@ async def test_pattern_visualization():
                 context_after=30  # Limited to available data
             )
 
-            fig.write_html("spy_demo_pattern.html")
-            print("  [OK] Synthetic pattern demonstration saved: spy_demo_pattern.html")
-            print("  This shows:")
-            print("    - Subtle blue shading for qualification period")
-            print("    - Light gold shading for active period")
-            print("    - Light green shading for successful breakout")
-            print("    - Boundary lines (upper, lower, power target)")
-            print("    - Annotations for key events")
+            await _save_html(fig, "spy_demo_pattern.html")
+            report.append("  [OK] Synthetic pattern demonstration saved: spy_demo_pattern.html")
+            report.append("  This shows:")
+            report.append("    - Subtle blue shading for qualification period")
+            report.append("    - Light gold shading for active period")
+            report.append("    - Light green shading for successful breakout")
+            report.append("    - Boundary lines (upper, lower, power target)")
+            report.append("    - Annotations for key events")
 
     except Exception as e:
         logger.error(f"Error creating demo: {e}")
 
-    print("\n" + "="*70)
-    print("SUMMARY")
-    print("="*70)
-    print("Pattern charts created with:")
-    print("- Subtle highlighting of pattern periods")
-    print("- 40 days context before pattern activation")
-    print("- Up to 100 days after breakout (when data available)")
-    print("- Safe handling of limited future data")
-    print("- Navigation between multiple patterns")
-    print("\nOpen the HTML files to view interactive charts")
+    report.append("\n" + "="*70)
+    report.append("SUMMARY")
+    report.append("="*70)
+    report.append("Pattern charts created with:")
+    report.append("- Subtle highlighting of pattern periods")
+    report.append("- 40 days context before pattern activation")
+    report.append("- Up to 100 days after breakout (when data available)")
+    report.append("- Safe handling of limited future data")
+    report.append("- Navigation between multiple patterns")
+    report.append("\nOpen the HTML files to view interactive charts")
+    print("\n".join(report))
 
 
 async def test_individual_pattern_focus():
     """Test focusing on individual patterns with full temporal context."""
 
+    report = []
+
     from stockgpt.visualization.pattern_chart import PatternChart, PatternPeriod
     from stockgpt.infrastructure.data.enhanced_market_provider import EnhancedMarketProvider
 
-    print("\n" + "="*70)
-    print("INDIVIDUAL PATTERN FOCUS TEST")
-    print("="*70)
+    report.append("\n" + "="*70)
+    report.append("INDIVIDUAL PATTERN FOCUS TEST")
+    report.append("="*70)
 
     symbol = "AAPL"
-    provider = EnhancedMarketProvider()
+    provider = _PriceMemo(EnhancedMarketProvider())
 
     try:
         # Get 500 days of data to ensure we have context
         prices = await provider.get_prices(symbol, days=500)
-        print(f"\nLoaded {len(prices)} days of data for {symbol}")
+        report.append(f"\nLoaded {len(prices)} days of data for {symbol}")
 
         # Create a test pattern from 100 days ago
         if len(prices) > 150:
             # Create pattern that started ~100 days ago
             pattern_start_idx = len(prices) - 100
+            columns = await provider.get_price_columns(symbol, days=500)
+            high = float(columns['high'][pattern_start_idx])
+            low = float(columns['low'][pattern_start_idx])
+            has_breakout = pattern_start_idx + 20 < len(prices)
+            qualification_start, active_start, breakout_date, completion_date = pd.DatetimeIndex(
+                columns['date'][[pattern_start_idx - 10, pattern_start_idx,
+                                 min(pattern_start_idx + 20, len(prices) - 1), -1]]
+            )
             pattern = PatternPeriod(
                 symbol=symbol,
                 pattern_id=f"{symbol}_TEST",
-                qualification_start=pd.Timestamp(prices[pattern_start_idx - 10].date),
-                active_start=pd.Timestamp(prices[pattern_start_idx].date),
-                breakout_date=pd.Timestamp(prices[pattern_start_idx + 20].date) if pattern_start_idx + 20 < len(prices) else None,
-                completion_date=pd.Timestamp(prices[-1].date),
+                qualification_start=qualification_start,
+                active_start=active_start,
+                breakout_date=breakout_date if has_breakout else None,
+                completion_date=completion_date,
                 pattern_type='consolidation',
-                upper_boundary=prices[pattern_start_idx].high * 1.02,
-                lower_boundary=prices[pattern_start_idx].low * 0.98,
-                power_boundary=prices[pattern_start_idx].high * 1.025,
+                upper_boundary=high * 1.02,
+                lower_boundary=low * 0.98,
+                power_boundary=high * 1.025,
                 outcome='ongoing' if pattern_start_idx + 20 >= len(prices) else 'success',
                 gain_percentage=8.5
             )
 
-            # Create chart with full context
-            pattern_chart = PatternChart()
-
             # Test different context windows
             context_scenarios = [
                 (40, 100, "standard"),  # Standard view
@@ -213,46 +303,65 @@ async def test_individual_pattern_focus():
                 (60, 150, "extended")   # Extended view (may not have full data)
             ]
 
+            def build_views():
+                # One PatternChart for every view, so they share its price
+                # DataFrame and RSI cache; its per-chart state means the
+                # views are built in turn, on one worker thread
+                pattern_chart = PatternChart()
+                return [
+                    (pattern_chart.create_pattern_focused_chart(
+                        prices=prices,
+                        pattern=pattern,
+                        context_before=before,
+                        context_after=after,
+                        show_indicators=True
+                    ), f"{symbol.lower()}_pattern_{name}.html")
+                    for before, after, name in context_scenarios
+                ]
+
             for before, after, name in context_scenarios:
-                print(f"\nCreating {name} view: {before} days before, {after} days after...")
-
-                fig = pattern_chart.create_pattern_focused_chart(
-                    prices=prices,
-                    pattern=pattern,
-                    context_before=before,
-                    context_after=after,
-                    show_indicators=True
-                )
+                report.append(f"\nCreating {name} view: {before} days before, {after} days after...")
 
-                filename = f"{symbol.lower()}_pattern_{name}.html"
-                fig.write_html(filename)
-                print(f"  [OK] Saved: {filename}")
+            # Build off the event loop, then write the HTML files together
+            charts = await asyncio.to_thread(build_views)
+            await asyncio.gather(*(_save_html(fig, filename) for fig, filename in charts))
+            for _, filename in charts:
+                report.append(f"  [OK] Saved: {filename}")
 
-            print("\nPattern Focus Features:")
-            print("- Automatic adjustment when insufficient future data")
-            print("- Warning messages about data availability")
-            print("- Subtle period highlighting (qualification, active, post-breakout)")
-            print("- Technical indicators in context")
-            print("- Clear boundary visualization")
+            report.append("\nPattern Focus Features:")
+            report.append("- Automatic adjustment when insufficient future data")
+            report.append("- Warning messages about data availability")
+            report.append("- Subtle period highlighting (qualification, active, post-breakout)")
+            report.append("- Technical indicators in context")
+            report.append("- Clear boundary visualization")
 
     except Exception as e:
         logger.error(f"Error in individual pattern test: {e}")
-        print(f"[ERROR] {e}")
+        report.append(f"[ERROR] {e}")
+
+    print("\n".join(report))
 
 
 async def main():
     """Run all pattern chart tests."""
 
+    # API keys from .env, without overriding ones already set; the provider
+    # falls back to its built-in keys for any still missing
+    from dotenv import load_dotenv
+    load_dotenv()
+
     print("\n" + "="*80)
     print("PATTERN CHART TESTING SUITE")
     print("="*80)
     print("Testing subtle highlighting and temporal context windows...")
 
-    # Test 1: Pattern visualization with real data
-    await test_pattern_visualization()
-
-    # Test 2: Individual pattern focus with different context windows
-    await test_individual_pattern_focus()
+    # Test 1: Pattern visualization with real data, and
+    # Test 2: Individual pattern focus with different context windows;
+    # they share nothing, so run them concurrently
+    await asyncio.gather(
+        test_pattern_visualization(),
+        test_individual_pattern_focus()
+    )
 
     print("\n" + "="*80)
     print("TESTING COMPLETE")
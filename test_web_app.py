@@ -4,6 +4,8 @@ Test Web App Locally
 This script tests the Streamlit web application locally before deployment.
 """
 
+import importlib.util
+import socket
 import subprocess
 import time
 import webbrowser
@@ -17,21 +19,18 @@ def test_streamlit_app():
     print("TESTING STOCKGPT WEB APP LOCALLY")
     print("="*60)
 
-    # Check if streamlit is installed
-    try:
-        import streamlit
-        print("[OK] Streamlit is installed")
-    except ImportError:
-        print("[ERROR] Streamlit not installed. Installing...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "streamlit"])
+    # Check the app's packages are installed; find_spec only locates them,
+    # without importing (streamlit run imports them itself)
+    missing = []
+    for package, name in (("streamlit", "Streamlit"), ("plotly", "Plotly")):
+        if importlib.util.find_spec(package) is None:
+            print(f"[ERROR] {name} not installed. Installing...")
+            missing.append(package)
+        else:
+            print(f"[OK] {name} is installed")
 
-    # Check if plotly is installed
-    try:
-        import plotly
-        print("[OK] Plotly is installed")
-    except ImportError:
-        print("[ERROR] Plotly not installed. Installing...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "plotly"])
+    if missing:
+        subprocess.run([sys.executable, "-m", "pip", "install", *missing])
 
     print("\n" + "-"*60)
     print("Starting Streamlit app...")
@@ -42,26 +41,39 @@ def test_streamlit_app():
     print("-"*60)
 
     # Start the Streamlit app
+    proc = None
     try:
-        # Open browser after 3 seconds
-        def open_browser():
-            time.sleep(3)
-            webbrowser.open('http://localhost:8501')
-
-        import threading
-        browser_thread = threading.Thread(target=open_browser)
-        browser_thread.daemon = True
-        browser_thread.start()
+        # Open the browser as soon as the server accepts connections
+        def open_browser(timeout=15.0):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline and proc.poll() is None:
+                try:
+                    socket.create_connection(('localhost', 8501), timeout=0.1).close()
+                except OSError:
+                    time.sleep(0.1)
+                else:
+                    webbrowser.open('http://localhost:8501')
+                    return
 
         # Run Streamlit
-        subprocess.run([
+        proc = subprocess.Popen([
             sys.executable, "-m", "streamlit", "run",
             "streamlit_app.py",
             "--server.port", "8501",
             "--server.address", "localhost"
         ])
 
+        import threading
+        browser_thread = threading.Thread(target=open_browser)
+        browser_thread.daemon = True
+        browser_thread.start()
+
+        proc.wait()
+
     except KeyboardInterrupt:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
         print("\n\n[INFO] Streamlit server stopped")
     except Exception as e:
         print(f"\n[ERROR] Failed to start Streamlit: {e}")
@@ -4,29 +4,56 @@ StockGPT Deployment Verification Script
 Verifies that all components are properly deployed and functional.
 """
 
-import requests
+import aiohttp
+import asyncio
 import sys
 import time
 from typing import Dict, List, Tuple
 
 
-def test_endpoint(url: str, method: str = "GET", headers: Dict = None, data: Dict = None, timeout: int = 10) -> Tuple[bool, Dict]:
-    """Test an API endpoint and return result."""
+async def test_endpoint(session: aiohttp.ClientSession, url: str, method: str = "GET", headers: Dict = None,
+                        data: Dict = None, timeout: int = 10, read_body: bool = True) -> Tuple[bool, Dict]:
+    """
+    Test an API endpoint and return result.
+
+    With read_body=False only the status line and headers are awaited: the
+    response time is time to headers and the content length is the
+    Content-Length header.
+    """
+    if method not in ("GET", "POST"):
+        return False, {"error": f"Unsupported method: {method}"}
+
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, timeout=timeout)
-        elif method == "POST":
-            response = requests.post(url, json=data, headers=headers, timeout=timeout)
-        else:
-            return False, {"error": f"Unsupported method: {method}"}
+        start = time.perf_counter()
+        async with session.request(
+            method, url,
+            json=data if method == "POST" else None,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if read_body:
+                content_length = len(await response.read())
+            else:
+                content_length = response.content_length
+            response_time = time.perf_counter() - start
         
-        return response.status_code == 200, {
-            "status_code": response.status_code,
-            "response_time": response.elapsed.total_seconds(),
-            "content_length": len(response.content)
+        return response.status == 200, {
+            "status_code": response.status,
+            "response_time": response_time,
+            "content_length": content_length
         }
     except Exception as e:
-        return False, {"error": str(e)}
+        return False, {"error": str(e) or type(e).__name__}
+
+
+async def run_checks(tests: List[Tuple[str, str, str, bool]]) -> List[Tuple[bool, Dict]]:
+    """Run every endpoint check concurrently over one pooled session."""
+    connector = aiohttp.TCPConnector(limit_per_host=len(tests))
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(
+            *(test_endpoint(session, url, method, read_body=read_body)
+              for _, url, method, read_body in tests)
+        )
 
 
 def main():
@@ -37,27 +64,31 @@ def main():
     base_url = "http://localhost"
     api_base = f"{base_url}/api/v1"
     
+    # (name, url, method, read body); health checks only need the status,
+    # so their bodies are not downloaded
     tests = [
         # Health checks
-        ("Simple Health Check", f"{base_url}/health", "GET"),
-        ("Detailed Health Check", f"{api_base}/health/health", "GET"),
-        ("Metrics Check", f"{api_base}/health/metrics", "GET"),
+        ("Simple Health Check", f"{base_url}/health", "GET", False),
+        ("Detailed Health Check", f"{api_base}/health/health", "GET", False),
+        ("Metrics Check", f"{api_base}/health/metrics", "GET", False),
         
         # API endpoints
-        ("API Documentation", f"{base_url}/api/docs", "GET"),
-        ("Frontend", f"{base_url}", "GET"),
+        ("API Documentation", f"{base_url}/api/docs", "GET", True),
+        ("Frontend", f"{base_url}", "GET", True),
     ]
     
     results = []
     passed = 0
     failed = 0
     
-    for test_name, url, method in tests:
+    # The checks are independent; run them at once, so failing endpoints'
+    # timeouts overlap instead of adding up
+    outcomes = asyncio.run(run_checks(tests))
+    
+    for (test_name, url, method, _), (success, details) in zip(tests, outcomes):
         print(f"\n📋 Testing: {test_name}")
         print(f"   URL: {url}")
         
-        success, details = test_endpoint(url, method)
-        
         if success:
             print(f"   ✅ PASSED")
             if "response_time" in details: